@@ -0,0 +1,249 @@
+"""Load-test the HTTP API at a fixed concurrency.
+
+Each scenario sends ``--requests`` requests from ``--concurrency`` workers
+and reports p50/p95/p99 latency, throughput and, when the app runs
+in-process, SQL statements per request. By default the app is driven
+in-process through ASGI; pass ``--url`` to load-test a running server.
+``--seed-rows`` first appends synthetic data with db/bulk_load.py, so the
+database should be disposable. The POST scenario creates data requests.
+
+Results are written as JSON to benchmarks/results/ so runs can be compared.
+
+Run with: uv run python -m benchmarks.bench_http --seed-rows 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from dotenv import load_dotenv
+from httpx import ASGITransport, AsyncClient, HTTPError
+from sqlalchemy import event
+
+from core.database import dispose_database, get_database
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+@dataclass
+class Scenario:
+    """One endpoint to load-test; ``body`` builds a JSON body per request."""
+
+    name: str
+    method: str
+    path: str
+    body: Callable[[], Any] | None = None
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    requests: int
+    errors: int
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    statements_per_request: float | None
+
+
+class StatementCounter:
+    """Counts SQL statements sent by the in-process engine."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args: Any) -> None:
+        self.count += 1
+
+
+async def login(client: AsyncClient) -> dict[str, str]:
+    response = await client.post(
+        "/api/v1/auth/jwt/login",
+        data={
+            "username": os.getenv("BENCH_USER", "demo@example.com"),
+            "password": os.getenv("DEMO_USER_PASSWORD"),
+        },
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def make_scenarios(
+    client: AsyncClient, headers: dict[str, str], rng: random.Random
+) -> list[Scenario]:
+    """Build the scenarios, picking POST targets from the API itself."""
+    people = await client.get("/api/v1/people?limit=1000", headers=headers)
+    sources = await client.get("/api/v1/request-sources", headers=headers)
+    person_ids = [person["id"] for person in people.json()]
+    source_ids = [source["id"] for source in sources.json()]
+
+    def new_data_request() -> dict[str, Any]:
+        return {
+            "person_id": rng.choice(person_ids),
+            "request_source_id": rng.choice(source_ids),
+        }
+
+    return [
+        Scenario("list data requests", "GET", "/api/v1/data-requests?limit=100"),
+        Scenario(
+            "list data requests by status",
+            "GET",
+            "/api/v1/data-requests?status=2&limit=100",
+        ),
+        Scenario("list people", "GET", "/api/v1/people?limit=100"),
+        Scenario("list request sources", "GET", "/api/v1/request-sources"),
+        Scenario(
+            "create data request", "POST", "/api/v1/data-requests", new_data_request
+        ),
+    ]
+
+
+async def run_scenario(
+    client: AsyncClient,
+    headers: dict[str, str],
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    counter: StatementCounter | None,
+) -> ScenarioResult:
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            body = scenario.body() if scenario.body else None
+            start = time.perf_counter()
+            try:
+                response = await client.request(
+                    scenario.method, scenario.path, headers=headers, json=body
+                )
+                failed = response.status_code >= 400
+            except HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - start)
+            errors += failed
+
+    statements_before = counter.count if counter else 0
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return ScenarioResult(
+        name=scenario.name,
+        requests=requests,
+        errors=errors,
+        throughput_rps=round(requests / elapsed, 1),
+        p50_ms=round(cuts[49] * 1000, 2),
+        p95_ms=round(cuts[94] * 1000, 2),
+        p99_ms=round(cuts[98] * 1000, 2),
+        max_ms=round(max(latencies) * 1000, 2),
+        statements_per_request=(
+            round((counter.count - statements_before) / requests, 2)
+            if counter
+            else None
+        ),
+    )
+
+
+def git_revision() -> str | None:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+    )
+    return result.stdout.strip() or None
+
+
+async def main(args: argparse.Namespace) -> None:
+    started = datetime.now()
+    if args.seed_rows:
+        from db.bulk_load import run_load
+
+        run_load(args.seed_rows, seed=args.seed)
+
+    counter = None
+    if args.url:
+        client = AsyncClient(base_url=args.url, timeout=60)
+    else:
+        from main import app
+
+        client = AsyncClient(
+            transport=ASGITransport(app=app, raise_app_exceptions=False),
+            base_url="http://bench",
+            timeout=60,
+        )
+        counter = StatementCounter()
+        event.listen(
+            get_database().engine.sync_engine, "before_cursor_execute", counter
+        )
+
+    async with client:
+        headers = await login(client)
+        scenarios = await make_scenarios(client, headers, random.Random(args.seed))
+        results = []
+        for scenario in scenarios:
+            if args.only and args.only not in scenario.name:
+                continue
+            # Warm caches and the connection pool before measuring.
+            await run_scenario(
+                client, headers, scenario, args.concurrency, args.concurrency, None
+            )
+            result = await run_scenario(
+                client, headers, scenario, args.requests, args.concurrency, counter
+            )
+            results.append(result)
+            print(
+                f"{result.name:<30}{result.throughput_rps:>10.1f} req/s"
+                f"{result.p50_ms:>10.1f}{result.p95_ms:>10.1f}{result.p99_ms:>10.1f} ms"
+                f"  errors {result.errors}"
+                + (
+                    f"  statements/req {result.statements_per_request}"
+                    if result.statements_per_request is not None
+                    else ""
+                )
+            )
+    await dispose_database()
+
+    output = args.output or RESULTS_DIR / f"http-{started:%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "started": started.isoformat(timespec="seconds"),
+                "revision": git_revision(),
+                "target": args.url or "in-process",
+                "concurrency": args.concurrency,
+                "requests": args.requests,
+                "results": [asdict(result) for result in results],
+            },
+            indent=2,
+        )
+    )
+    print(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Base URL of a running server")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument(
+        "--seed-rows", type=int, default=0, help="Append synthetic data requests"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--only", help="Only run scenarios whose name contains this")
+    parser.add_argument("--output", type=Path, help="Where to write the JSON results")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,95 @@
+"""Benchmark cold start: the time to import the app and scripts' modules.
+
+Each target is imported ``--runs`` times in a fresh interpreter under
+``python -X importtime``; the median cumulative import time is reported
+along with the modules that cost the most on their own, which is where to
+look when cold start regresses. No database is needed.
+
+Run with: uv run python -m benchmarks.bench_import
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# What each kind of process imports before it can do any work
+TARGETS = {
+    "worker": "import main",
+    "background worker": "import worker",
+    "seed script": "import db.seed",
+    "database config": "import core.database",
+}
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(code: str) -> tuple[float, dict[str, float]]:
+    """Import in a fresh interpreter and get the total and per-module seconds.
+
+    The total covers every top-level import the code made; per-module times
+    exclude the module's own imports.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0.0
+    self_times: dict[str, float] = {}
+    for match in _IMPORTTIME_LINE.finditer(result.stderr):
+        self_us, cumulative_us, indent, module = match.groups()
+        self_times[module] = int(self_us) / 1e6
+        if len(indent) == 1:
+            total += int(cumulative_us) / 1e6
+    return total, self_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="Slowest modules to show")
+    parser.add_argument("--output", type=Path, help="Where to write the JSON results")
+    args = parser.parse_args()
+
+    results = {}
+    for name, code in TARGETS.items():
+        totals = []
+        self_times: dict[str, list[float]] = defaultdict(list)
+        for _ in range(args.runs):
+            total, modules = import_times(code)
+            totals.append(total)
+            for module, seconds in modules.items():
+                self_times[module].append(seconds)
+
+        median_ms = statistics.median(totals) * 1000
+        slowest = sorted(
+            (
+                (statistics.median(times) * 1000, module)
+                for module, times in self_times.items()
+            ),
+            reverse=True,
+        )[: args.top]
+        results[name] = {
+            "median_ms": round(median_ms, 1),
+            "slowest_modules_ms": {module: round(ms, 1) for ms, module in slowest},
+        }
+        print(f"{name:<20}{median_ms:>10.1f} ms  ({code})")
+        for ms, module in slowest:
+            print(f"{'':<24}{ms:>8.1f} ms  {module}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
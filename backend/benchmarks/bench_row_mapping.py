@@ -0,0 +1,122 @@
+"""Benchmark ORM hydration against column-select row mapping.
+
+Inserts synthetic data requests inside a transaction, reads them back with
+both read paths and rolls the transaction back, so the database is left
+unchanged. Requires a migrated and seeded database.
+
+Run with: uv run python -m benchmarks.bench_row_mapping --rows 100000
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Awaitable, Callable
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.data_request import DataRequest, DataRequestRepository, Status
+from core.data_request.data_request_model import DataRequestModel
+from core.database import dispose_database, open_session
+
+
+async def insert_rows(session: AsyncSession, rows: int) -> None:
+    """Insert synthetic data requests copied from the first seeded person."""
+    await session.execute(text("DELETE FROM data_request"))
+    await session.execute(
+        text(
+            """
+            INSERT INTO data_request
+            (person_id, first_name, last_name, date_of_birth, status,
+             created_on, created_by, request_source_id)
+            SELECT p.id, p.first_name, p.last_name, p.date_of_birth,
+                   (ARRAY[1, 2, 3, 99])[1 + n % 4], now(), 'bench@example.com',
+                   (SELECT id FROM request_source ORDER BY id LIMIT 1)
+            FROM generate_series(1, :rows) AS n,
+                 (SELECT * FROM people ORDER BY id LIMIT 1) AS p
+            """
+        ),
+        {"rows": rows},
+    )
+
+
+async def read_orm(session: AsyncSession) -> list[DataRequest]:
+    """The previous read path: ORM entities copied field by field."""
+    stmt = select(DataRequestModel).order_by(DataRequestModel.id)
+    result = await session.execute(stmt)
+    data_requests = [
+        DataRequest(
+            id=row.id,
+            person_id=row.person_id,
+            first_name=row.first_name,
+            last_name=row.last_name,
+            date_of_birth=row.date_of_birth,
+            status=Status(row.status),
+            created_on=row.created_on,
+            created_by=row.created_by,
+            request_source_id=row.request_source_id,
+        )
+        for row in result.scalars().all()
+    ]
+    session.expunge_all()
+    return data_requests
+
+
+async def read_columns(session: AsyncSession) -> list[DataRequest]:
+    """The column-select read path used by the repositories."""
+    return await DataRequestRepository(session).get_all()
+
+
+async def measure(
+    session: AsyncSession,
+    read: Callable[[AsyncSession], Awaitable[list[DataRequest]]],
+    repeat: int,
+) -> tuple[float, int]:
+    """Return the best wall time and the peak Python allocation of a read."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await read(session)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    await read(session)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak
+
+
+async def main(rows: int, repeat: int) -> None:
+    async with open_session() as session:
+        await insert_rows(session, rows)
+        try:
+            results = {
+                "orm": await measure(session, read_orm, repeat),
+                "columns": await measure(session, read_columns, repeat),
+            }
+        finally:
+            await session.rollback()
+    await dispose_database()
+
+    print(f"{rows} rows, best of {repeat}")
+    print(f"{'path':<10}{'total ms':>12}{'us/row':>10}{'peak MiB':>12}{'B/row':>10}")
+    for name, (seconds, peak) in results.items():
+        print(
+            f"{name:<10}{seconds * 1000:>12.1f}{seconds / rows * 1e6:>10.2f}"
+            f"{peak / 2**20:>12.1f}{peak / rows:>10.0f}"
+        )
+    orm_seconds, orm_peak = results["orm"]
+    seconds, peak = results["columns"]
+    print(
+        f"column select: {orm_seconds / seconds:.1f}x faster, "
+        f"{orm_peak / peak:.1f}x less peak memory"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
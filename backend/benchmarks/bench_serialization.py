@@ -0,0 +1,108 @@
+"""Benchmark list response serialization.
+
+Compares the previous path, ``dataclasses.asdict`` followed by FastAPI's
+validation and encoding of a ``list[dict[str, Any]]`` return value, with
+``dump_json`` on the DTOs. No database is needed.
+
+Run with: uv run python -m benchmarks.bench_serialization
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from core.data_request import DataRequest, Status
+from core.serialization import dump_json
+
+# What FastAPI does with a list[dict[str, Any]] return annotation: validate
+# against the response field, dump it in JSON mode, then json.dumps it in
+# JSONResponse.render.
+response_field = TypeAdapter(list[dict[str, Any]])
+
+
+def asdict_path(data_requests: list[DataRequest]) -> bytes:
+    content = [asdict(dr) for dr in data_requests]
+    validated = response_field.validate_python(content)
+    encoded = response_field.dump_python(validated, mode="json")
+    return json.dumps(
+        encoded, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+def dump_json_path(data_requests: list[DataRequest]) -> bytes:
+    return dump_json(data_requests, list[DataRequest])
+
+
+def make_data_requests(rows: int) -> list[DataRequest]:
+    statuses = list(Status)
+    start = datetime(2024, 1, 1)
+    return [
+        DataRequest(
+            id=i,
+            person_id=i % 1000,
+            first_name="John",
+            last_name="Smith",
+            date_of_birth=date(1985, 3, 15),
+            status=statuses[i % len(statuses)],
+            created_on=start + timedelta(minutes=i),
+            created_by="admin@example.com",
+            request_source_id="acme-corp",
+        )
+        for i in range(rows)
+    ]
+
+
+def measure(
+    serialize: Callable[[list[DataRequest]], bytes],
+    data_requests: list[DataRequest],
+    repeat: int,
+) -> tuple[float, int]:
+    """Return the best wall time and the peak Python allocation."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        serialize(data_requests)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    serialize(data_requests)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak
+
+
+def main(sizes: list[int], repeat: int) -> None:
+    print(f"best of {repeat}")
+    print(f"{'rows':>8}  {'path':<10}{'total ms':>12}{'us/row':>10}{'peak MiB':>12}")
+    for rows in sizes:
+        data_requests = make_data_requests(rows)
+        assert json.loads(asdict_path(data_requests)) == json.loads(
+            dump_json_path(data_requests)
+        )
+        results = {
+            "asdict": measure(asdict_path, data_requests, repeat),
+            "dump_json": measure(dump_json_path, data_requests, repeat),
+        }
+        for name, (seconds, peak) in results.items():
+            print(
+                f"{rows:>8}  {name:<10}{seconds * 1000:>12.1f}"
+                f"{seconds / rows * 1e6:>10.2f}{peak / 2**20:>12.1f}"
+            )
+        print(
+            f"{rows:>8}  dump_json is "
+            f"{results['asdict'][0] / results['dump_json'][0]:.1f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
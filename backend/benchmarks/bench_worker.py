@@ -0,0 +1,203 @@
+"""Benchmark the background worker with the fake connector.
+
+Adds ``--requests`` PROCESSING data requests for a request source of its
+own and processes them with ``--processes`` worker processes, each running
+``--concurrency`` requests at once, until none are left. Reports the
+throughput, how many claim and write-back statements it took, and how many
+requests were processed more than once, which must be none. The benchmark's
+requests and request source are deleted afterwards.
+
+Results are written as JSON to benchmarks/results/ so runs can be compared.
+
+Run with: uv run python -m benchmarks.bench_worker --requests 20000 --processes 4
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import func, select
+
+from core.data_request import (
+    DataRequestWorker,
+    FakeConnector,
+    SourceHandler,
+    Status,
+    WorkerStats,
+)
+from core.data_request.data_request_model import DataRequestModel
+from core.database import dispose_database, get_sync_connection, open_session
+
+RESULTS_DIR = Path(__file__).parent / "results"
+REQUEST_SOURCE_ID = "bench-worker"
+
+# Seconds between the processes being started and them starting to work,
+# so that interpreter start-up is not measured
+START_DELAY_SECONDS = 5.0
+
+
+@dataclass
+class ProcessResult:
+    processed: list[int]
+    stats: WorkerStats
+    done_at: float
+
+
+def add_requests(count: int) -> None:
+    """Add PROCESSING data requests for the benchmark's request source."""
+    with get_sync_connection() as conn:
+        conn.execute(
+            "INSERT INTO request_source (id, name) VALUES (%s, 'Worker benchmark')"
+            " ON CONFLICT DO NOTHING",
+            (REQUEST_SOURCE_ID,),
+        )
+        conn.execute(
+            """
+            INSERT INTO data_request (person_id, first_name, last_name,
+                date_of_birth, status, created_on, created_by, request_source_id)
+            SELECT p.id, p.first_name, p.last_name, p.date_of_birth, %s, now(),
+                'bench-worker@example.com', %s
+            FROM (SELECT * FROM people ORDER BY id LIMIT 1) AS p
+            CROSS JOIN generate_series(1, %s)
+            """,
+            (Status.PROCESSING, REQUEST_SOURCE_ID, count),
+        )
+        conn.commit()
+
+
+def remove_requests() -> dict[int, int]:
+    """Delete the benchmark's requests, returning how many had each status."""
+    with get_sync_connection() as conn:
+        rows = conn.execute(
+            "DELETE FROM data_request WHERE request_source_id = %s RETURNING status",
+            (REQUEST_SOURCE_ID,),
+        ).fetchall()
+        conn.execute("DELETE FROM request_source WHERE id = %s", (REQUEST_SOURCE_ID,))
+        conn.commit()
+    statuses: dict[int, int] = {}
+    for (status,) in rows:
+        statuses[status] = statuses.get(status, 0) + 1
+    return statuses
+
+
+async def count_remaining() -> int:
+    async with open_session() as session:
+        result = await session.execute(
+            select(func.count()).where(
+                DataRequestModel.request_source_id == REQUEST_SOURCE_ID,
+                DataRequestModel.status == Status.PROCESSING,
+            )
+        )
+        return result.scalar_one()
+
+
+async def work(args: argparse.Namespace, start_at: float) -> ProcessResult:
+    connector = FakeConnector(
+        latency_seconds=args.latency, failure_rate=args.failure_rate
+    )
+    handler = SourceHandler(
+        connector,
+        concurrency=args.concurrency,
+        max_attempts=args.max_attempts,
+        retry_delay_seconds=args.latency,
+    )
+    worker = DataRequestWorker({REQUEST_SOURCE_ID: handler})
+    await asyncio.sleep(start_at - time.time())
+    running = asyncio.create_task(worker.run())
+    while await count_remaining():
+        await asyncio.sleep(0.05)
+    done_at = time.time()
+    worker.stop()
+    await running
+    await dispose_database()
+    return ProcessResult(connector.processed, worker.stats, done_at)
+
+
+def run_process(args: argparse.Namespace, start_at: float) -> ProcessResult:
+    load_dotenv()
+    return asyncio.run(work(args, start_at))
+
+
+def git_revision() -> str | None:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True
+    )
+    return result.stdout.strip() or None
+
+
+def main(args: argparse.Namespace) -> None:
+    started = datetime.now()
+    add_requests(args.requests)
+    try:
+        start_at = time.time() + START_DELAY_SECONDS
+        with ProcessPoolExecutor(
+            args.processes, mp_context=get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(run_process, args, start_at) for _ in range(args.processes)
+            ]
+            results = [future.result() for future in futures]
+    finally:
+        statuses = remove_requests()
+
+    elapsed = min(result.done_at for result in results) - start_at
+    processed = [id for result in results for id in result.processed]
+    claims = sum(result.stats.claims for result in results)
+    flushes = sum(result.stats.flushes for result in results)
+    summary = {
+        "requests": args.requests,
+        "processes": args.processes,
+        "concurrency": args.concurrency,
+        "latency_seconds": args.latency,
+        "failure_rate": args.failure_rate,
+        "elapsed_seconds": round(elapsed, 2),
+        "throughput_rps": round(args.requests / elapsed, 1),
+        "ideal_throughput_rps": round(
+            args.processes * args.concurrency / args.latency, 1
+        ),
+        "claim_statements": claims,
+        "write_back_transactions": flushes,
+        "processed_more_than_once": len(processed) - len(set(processed)),
+        "statuses": {Status(status).name: count for status, count in statuses.items()},
+    }
+    for key, value in summary.items():
+        print(f"{key:<26}{value}")
+
+    output = args.output or RESULTS_DIR / f"worker-{started:%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "started": started.isoformat(timespec="seconds"),
+                "revision": git_revision(),
+                "results": summary,
+            },
+            indent=2,
+        )
+    )
+    print(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument(
+        "--concurrency", type=int, default=50, help="Requests at once per process"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.02, help="Fake seconds per request"
+    )
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--max-attempts", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Where to write the JSON results")
+    main(parser.parse_args())
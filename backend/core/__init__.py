@@ -1,15 +1,44 @@
-from core.data_request import (
-    DataRequest,
-    DataRequestRepository,
-    DataRequestService,
-    PersonNotFoundError,
-    Status,
-)
-from core.person import Person, PersonRepository
-from core.request_source import RequestSource, RequestSourceRepository
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from core.data_request import (
+        DataRequest,
+        DataRequestFilter,
+        DataRequestRepository,
+        DataRequestService,
+        PersonNotFoundError,
+        Status,
+    )
+    from core.person import CachedPersonRepository, Person, PersonRepository
+    from core.request_source import (
+        CachedRequestSourceRepository,
+        RequestSource,
+        RequestSourceRepository,
+    )
+
+# Re-exports are imported on first access, so that importing one module of
+# the package, e.g. core.database from a script, does not import them all.
+_EXPORTS = {
+    "CachedPersonRepository": "core.person",
+    "CachedRequestSourceRepository": "core.request_source",
+    "DataRequest": "core.data_request",
+    "DataRequestFilter": "core.data_request",
+    "DataRequestRepository": "core.data_request",
+    "DataRequestService": "core.data_request",
+    "Person": "core.person",
+    "PersonNotFoundError": "core.data_request",
+    "PersonRepository": "core.person",
+    "RequestSource": "core.request_source",
+    "RequestSourceRepository": "core.request_source",
+    "Status": "core.data_request",
+}
 
 __all__ = [
+    "CachedPersonRepository",
+    "CachedRequestSourceRepository",
     "DataRequest",
+    "DataRequestFilter",
     "DataRequestRepository",
     "DataRequestService",
     "Person",
@@ -19,3 +48,9 @@ __all__ = [
     "RequestSourceRepository",
     "Status",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name]), name)
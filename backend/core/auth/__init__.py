@@ -1,8 +1,11 @@
+from .backend import CachingJWTStrategy, token_cache
 from .users import fastapi_users, auth_backend, current_active_user
 from .models import User
 from .schemas import UserRead, UserCreate, UserUpdate
 
 __all__ = [
+    "CachingJWTStrategy",
+    "token_cache",
     "fastapi_users",
     "auth_backend",
     "current_active_user",
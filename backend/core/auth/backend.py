@@ -1,25 +1,96 @@
 import os
+import time
+import uuid
+from typing import Any
 
-from dotenv import load_dotenv
+import jwt
+from fastapi_users import BaseUserManager, exceptions
 from fastapi_users.authentication import (
     AuthenticationBackend,
     BearerTransport,
     JWTStrategy,
 )
+from fastapi_users.db import SQLAlchemyUserDatabase
+from fastapi_users.jwt import decode_jwt
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
 
-load_dotenv()
+from core.cache import TTLCache
+
+from .models import User
 
 # JWT configuration
 SECRET = os.getenv("JWT_SECRET", "CHANGE_ME_IN_PRODUCTION")
 LIFETIME_SECONDS = 3600  # 1 hour
 
+# Verified tokens and the column values of their users; entries never
+# outlive the token's exp
+token_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000")),
+    ttl=float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60")),
+)
+
 
 bearer_transport = BearerTransport(tokenUrl="auth/jwt/login")
 
 
+class CachingJWTStrategy(JWTStrategy[User, uuid.UUID]):
+    """JWTStrategy that remembers the user behind each verified token.
+
+    A cached token skips both JWT verification and the user query: a user
+    is rebuilt from the cached column values and merged into the request's
+    session without loading it. Only values are cached, never the instance,
+    as a rollback of the session that loaded it would expire it.
+    Deactivating or changing a user must call ``invalidate``; other
+    processes see the change once their entries expire.
+    """
+
+    cache = token_cache
+
+    async def read_token(
+        self, token: str | None, user_manager: BaseUserManager[User, uuid.UUID]
+    ) -> User | None:
+        if token is None:
+            return None
+
+        user_db = user_manager.user_db
+        assert isinstance(user_db, SQLAlchemyUserDatabase)
+        values = self.cache.get(token)
+        if values is not None:
+            user = User(**values)
+            make_transient_to_detached(user)
+            return await user_db.session.merge(user, load=False)
+
+        try:
+            data = decode_jwt(
+                token, self.decode_key, self.token_audience, algorithms=[self.algorithm]
+            )
+            user = await user_manager.get(user_manager.parse_id(data["sub"]))
+        except (
+            jwt.PyJWTError,
+            KeyError,
+            exceptions.UserNotExists,
+            exceptions.InvalidID,
+        ):
+            return None
+
+        expires_in = data["exp"] - time.time() if "exp" in data else None
+        self.cache.set(token, _column_values(user), ttl=expires_in)
+        return user
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Forget every cached token after a user was changed or deleted."""
+        cls.cache.clear()
+
+
+def _column_values(user: User) -> dict[str, Any]:
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
 def get_jwt_strategy() -> JWTStrategy:
     """Get JWT strategy with configured secret and lifetime."""
-    return JWTStrategy(secret=SECRET, lifetime_seconds=LIFETIME_SECONDS)
+    return CachingJWTStrategy(secret=SECRET, lifetime_seconds=LIFETIME_SECONDS)
 
 
 auth_backend = AuthenticationBackend(
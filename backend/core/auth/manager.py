@@ -1,17 +1,22 @@
 import uuid
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import Depends, Request
 from fastapi_users import BaseUserManager, UUIDIDMixin
 
+from .backend import CachingJWTStrategy
 from .models import User
-from .database import get_async_session
+from core.database import get_async_session
 from fastapi_users.db import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 async def get_user_db(session: AsyncSession = Depends(get_async_session)):
-    """Dependency for getting the user database adapter."""
+    """Dependency for getting the user database adapter.
+
+    Uses the same session dependency as the endpoints, so FastAPI resolves
+    it once per request and auth shares the endpoint's connection.
+    """
     yield SQLAlchemyUserDatabase(session, User)
 
 
@@ -25,6 +30,19 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         """Called after a user registers."""
         print(f"User {user.id} has registered.")
 
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: dict[str, Any],
+        request: Optional[Request] = None,
+    ):
+        """Called after a user is updated, e.g. deactivated."""
+        CachingJWTStrategy.invalidate()
+
+    async def on_after_delete(self, user: User, request: Optional[Request] = None):
+        """Called after a user is deleted."""
+        CachingJWTStrategy.invalidate()
+
     async def on_after_forgot_password(
         self, user: User, token: str, request: Optional[Request] = None
     ):
@@ -1,14 +1,78 @@
-from core.data_request.data_request import DataRequest, Status
-from core.data_request.data_request_repo import DataRequestRepository
+from core.data_request.data_request import (
+    STATUS_TRANSITIONS,
+    BulkCreateFailure,
+    BulkCreateResult,
+    ClaimedDataRequest,
+    DataRequest,
+    DataRequestFilter,
+    DataRequestSummary,
+    NewDataRequest,
+    RequestSourceCount,
+    Status,
+    StatusChangeResult,
+    StatusCount,
+)
+from core.data_request.data_request_export import ExportFormat, encode_export
+from core.data_request.data_request_feed import (
+    ChangeEvent,
+    ChangeOp,
+    ChangeSubscription,
+    DataRequestChange,
+    DataRequestChangeFeed,
+    Resync,
+    change_feed,
+    encode_event,
+)
+from core.data_request.data_request_repo import (
+    DataRequestRepository,
+    InvalidSyncTokenError,
+)
 from core.data_request.data_request_service import (
     DataRequestService,
+    InvalidStatusChangeError,
     PersonNotFoundError,
 )
+from core.data_request.data_request_worker import (
+    DataRequestWorker,
+    FakeConnector,
+    FakeConnectorError,
+    SourceConnector,
+    SourceHandler,
+    WorkerStats,
+)
 
 __all__ = [
+    "STATUS_TRANSITIONS",
+    "BulkCreateFailure",
+    "BulkCreateResult",
+    "ChangeEvent",
+    "ChangeOp",
+    "ChangeSubscription",
+    "ClaimedDataRequest",
     "DataRequest",
+    "DataRequestChange",
+    "DataRequestChangeFeed",
+    "DataRequestFilter",
     "DataRequestRepository",
     "DataRequestService",
+    "DataRequestSummary",
+    "DataRequestWorker",
+    "ExportFormat",
+    "FakeConnector",
+    "FakeConnectorError",
+    "InvalidStatusChangeError",
+    "InvalidSyncTokenError",
+    "NewDataRequest",
     "PersonNotFoundError",
+    "RequestSourceCount",
+    "Resync",
+    "SourceConnector",
+    "SourceHandler",
     "Status",
+    "StatusChangeResult",
+    "StatusCount",
+    "WorkerStats",
+    "change_feed",
+    "encode_event",
+    "encode_export",
 ]
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from enum import IntEnum
 
 
@@ -12,7 +12,16 @@ class Status(IntEnum):
     COMPLETE = 99
 
 
-@dataclass
+# The statuses a data request can be moved to from each status
+STATUS_TRANSITIONS: dict[Status, frozenset[Status]] = {
+    Status.CREATED: frozenset({Status.PROCESSING}),
+    Status.PROCESSING: frozenset({Status.NEEDS_REVIEW, Status.COMPLETE}),
+    Status.NEEDS_REVIEW: frozenset({Status.PROCESSING, Status.COMPLETE}),
+    Status.COMPLETE: frozenset({Status.NEEDS_REVIEW}),
+}
+
+
+@dataclass(frozen=True, slots=True)
 class DataRequest:
     """Data transfer object for a data request."""
 
@@ -25,3 +34,124 @@ class DataRequest:
     created_on: datetime
     created_by: str
     request_source_id: str
+
+
+@dataclass
+class DataRequestFilter:
+    """Optional filters for querying data requests.
+
+    Every field that is set narrows the result; unset fields are ignored.
+    ``created_from`` is inclusive and ``created_to`` is exclusive.
+    """
+
+    status: int | None = None
+    status_in: list[int] | None = None
+    request_source_id: str | None = None
+    person_id: int | None = None
+    created_by: str | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+    def matches(self, data_request: DataRequest) -> bool:
+        """Check a data request against the filters, as the query would."""
+        created_on = data_request.created_on
+        return (
+            (self.status is None or data_request.status == self.status)
+            and (self.status_in is None or data_request.status in self.status_in)
+            and (
+                self.request_source_id is None
+                or data_request.request_source_id == self.request_source_id
+            )
+            and (self.person_id is None or data_request.person_id == self.person_id)
+            and (self.created_by is None or data_request.created_by == self.created_by)
+            and (self.created_from is None or created_on >= _as_utc(self.created_from))
+            and (self.created_to is None or created_on < _as_utc(self.created_to))
+        )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Convert a datetime to naive UTC, like created_on, if it has a time zone."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(frozen=True, slots=True)
+class NewDataRequest:
+    """One data request to create in a bulk create."""
+
+    person_id: int
+    request_source_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class BulkCreateFailure:
+    """An item of a bulk create that was rejected, by position in the input."""
+
+    index: int
+    person_id: int
+    request_source_id: str
+    error: str
+
+
+@dataclass(frozen=True, slots=True)
+class BulkCreateResult:
+    """Outcome of a bulk create: the created requests and the rejected items."""
+
+    created: list[DataRequest]
+    failed: list[BulkCreateFailure]
+
+
+@dataclass(frozen=True, slots=True)
+class StatusCount:
+    """The number of data requests in one status."""
+
+    status: Status
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class RequestSourceCount:
+    """The number of data requests from one request source."""
+
+    request_source_id: str
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class DataRequestSummary:
+    """Data request totals by status and by request source.
+
+    Every status is listed, with a count of zero if no request has it;
+    request sources are listed only if they have requests.
+    """
+
+    total: int
+    by_status: list[StatusCount]
+    by_request_source: list[RequestSourceCount]
+
+
+@dataclass(frozen=True, slots=True)
+class ClaimedDataRequest:
+    """A data request claimed for processing, and which attempt this is.
+
+    ``claim_id`` identifies the claim; results are written back with it.
+    """
+
+    data_request: DataRequest
+    attempt: int
+    claim_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class StatusChangeResult:
+    """Outcome of a bulk status change.
+
+    ``updated`` lists the requests moved to ``status``; ``skipped`` lists
+    the requested ids that were not, because they do not exist or their
+    status cannot be changed to ``status``.
+    """
+
+    status: Status
+    updated: list[int]
+    skipped: list[int]
@@ -0,0 +1,20 @@
+from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class DataRequestCountModel(Base):
+    """SQLAlchemy model for the data_request_count table.
+
+    Database triggers count data requests by status and request source as
+    they are written, on a row per backend so that concurrent writers never
+    contend for one row. A group's count is the sum of its rows.
+    """
+
+    __tablename__ = "data_request_count"
+
+    status: Mapped[int] = mapped_column(Integer, primary_key=True)
+    request_source_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    backend_pid: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger)
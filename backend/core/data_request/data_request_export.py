@@ -0,0 +1,62 @@
+import csv
+import io
+from dataclasses import fields
+from datetime import date
+from enum import StrEnum
+from typing import Any, AsyncIterator
+
+from core.data_request.data_request import DataRequest
+from core.serialization import dump_json
+
+
+class ExportFormat(StrEnum):
+    """File formats supported by the data request export."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """MIME type to serve the export with."""
+        if self is ExportFormat.CSV:
+            return "text/csv"
+        return "application/x-ndjson"
+
+
+EXPORT_COLUMNS = [field.name for field in fields(DataRequest)]
+
+
+def _export_row(data_request: DataRequest) -> list[Any]:
+    """Get the column values of a data request, with dates in ISO 8601."""
+    row = []
+    for column in EXPORT_COLUMNS:
+        value = getattr(data_request, column)
+        row.append(value.isoformat() if isinstance(value, date) else value)
+    return row
+
+
+def _ndjson_chunk(data_requests: list[DataRequest]) -> bytes:
+    return b"".join(dump_json(dr, DataRequest) + b"\n" for dr in data_requests)
+
+
+def _csv_chunk(rows: list[list[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+async def encode_export(
+    chunks: AsyncIterator[list[DataRequest]], export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """Encode chunks of data requests into chunks of an export file.
+
+    Each chunk of rows becomes one chunk of bytes, so the export can be
+    sent to the client as soon as the first rows are read.
+    """
+    if export_format is ExportFormat.CSV:
+        yield _csv_chunk([EXPORT_COLUMNS])
+        async for data_requests in chunks:
+            yield _csv_chunk([_export_row(dr) for dr in data_requests])
+    else:
+        async for data_requests in chunks:
+            yield _ndjson_chunk(data_requests)
@@ -0,0 +1,239 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, AsyncIterator
+
+from pydantic import ValidationError
+
+from core.data_request.data_request import DataRequest, DataRequestFilter
+from core.database import get_connection_string
+from core.serialization import dump_json, load_json
+
+logger = logging.getLogger(__name__)
+
+# The channel the data_request triggers notify
+CHANNEL = "data_request_changes"
+
+# Changes a subscriber can fall behind by before it is told to resync
+BUFFER_SIZE = int(os.getenv("CHANGE_FEED_BUFFER_SIZE", "1000"))
+
+# How long subscribing waits for the listening connection to be ready
+LISTEN_TIMEOUT_SECONDS = float(os.getenv("CHANGE_FEED_LISTEN_TIMEOUT", "10"))
+
+# Delay before reconnecting after the listening connection is lost, doubling
+# with each failed attempt up to the maximum
+RECONNECT_DELAY_SECONDS = 0.5
+MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+
+class ChangeOp(StrEnum):
+    """The kinds of write to a data request."""
+
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True, slots=True)
+class DataRequestChange:
+    """A data request that was inserted, updated or deleted.
+
+    ``data_request`` is the row after an insert or update and before a
+    delete; ``previous`` is the row before an update.
+    """
+
+    op: ChangeOp
+    data_request: DataRequest
+    previous: DataRequest | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Resync:
+    """Changes were missed; re-read the data requests to catch up.
+
+    ``reason`` is "bulk" when a statement changed too many rows to send
+    one by one, "overflow" when the subscriber fell too far behind, and
+    "reconnect" when the feed lost its database connection.
+    """
+
+    reason: str
+
+
+@dataclass(frozen=True, slots=True)
+class _BulkChange:
+    """What the triggers send in place of the rows of a large statement."""
+
+    op: ChangeOp
+    count: int
+
+
+type ChangeEvent = DataRequestChange | Resync
+
+
+class ChangeSubscription:
+    """A subscriber's bounded buffer of the changes that match its filters.
+
+    An update matches if the row matches before or after it, so that a
+    subscriber also sees requests leave the set it follows.
+    """
+
+    def __init__(self, filters: DataRequestFilter, buffer_size: int) -> None:
+        self.filters = filters
+        self._events: asyncio.Queue[ChangeEvent] = asyncio.Queue(buffer_size)
+
+    def publish(self, event: ChangeEvent) -> None:
+        """Buffer an event if it matches, without waiting for the subscriber.
+
+        A subscriber whose buffer is full loses its backlog and gets a
+        ``Resync`` instead; it has to re-read the data requests anyway.
+        """
+        if isinstance(event, DataRequestChange) and not (
+            self.filters.matches(event.data_request)
+            or (event.previous is not None and self.filters.matches(event.previous))
+        ):
+            return
+        try:
+            self._events.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self._events.empty():
+                self._events.get_nowait()
+            self._events.put_nowait(Resync("overflow"))
+
+    async def get(self) -> ChangeEvent:
+        """Wait for the next event."""
+        return await self._events.get()
+
+
+class DataRequestChangeFeed:
+    """Fans data request changes out to subscribers in this process.
+
+    Triggers on data_request NOTIFY every committed change. The feed
+    listens for them on one connection per process, opened when the first
+    subscriber arrives, and copies each change into the buffers of the
+    subscribers it matches. The connection is not from the pool: LISTEN
+    holds it for the life of the session, so it must go straight to the
+    server, not through a transaction-pooling PgBouncer.
+    """
+
+    def __init__(self, buffer_size: int = BUFFER_SIZE) -> None:
+        self.buffer_size = buffer_size
+        self._subscriptions: set[ChangeSubscription] = set()
+        self._listening = asyncio.Event()
+        self._listener: asyncio.Task[None] | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """The number of open subscriptions."""
+        return len(self._subscriptions)
+
+    @asynccontextmanager
+    async def subscribe(
+        self, filters: DataRequestFilter
+    ) -> AsyncIterator[ChangeSubscription]:
+        """Receive the changes that match the filters while the context is open.
+
+        Changes committed after this returns are delivered, so a subscriber
+        can subscribe first and then read the current state without a gap.
+
+        Raises:
+            TimeoutError: If the feed cannot start listening in time.
+        """
+        await self.start()
+        subscription = ChangeSubscription(filters, self.buffer_size)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+
+    async def start(self) -> None:
+        """Start listening, if the feed is not already, and wait until it is.
+
+        Raises:
+            TimeoutError: If the feed cannot start listening in time.
+        """
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        async with asyncio.timeout(LISTEN_TIMEOUT_SECONDS):
+            await self._listening.wait()
+
+    async def close(self) -> None:
+        """Stop listening; the next subscriber starts the feed again."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _publish(self, event: ChangeEvent) -> None:
+        for subscription in self._subscriptions:
+            subscription.publish(event)
+
+    def _on_notification(
+        self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        try:
+            change = load_json(payload, DataRequestChange | _BulkChange)
+        except ValidationError:
+            logger.warning("Ignored malformed change notification: %s", payload)
+            return
+        if isinstance(change, _BulkChange):
+            self._publish(Resync("bulk"))
+        else:
+            self._publish(change)
+
+    async def _listen(self) -> None:
+        """Keep a connection listening, reconnecting when it is lost."""
+        import asyncpg  # type: ignore[import-untyped]
+
+        delay = RECONNECT_DELAY_SECONDS
+        reconnecting = False
+        while True:
+            try:
+                connection = await asyncpg.connect(get_connection_string())
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("Change feed cannot connect, retrying: %s", e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+                continue
+
+            delay = RECONNECT_DELAY_SECONDS
+            try:
+                await self._receive(connection, reconnecting)
+            finally:
+                self._listening.clear()
+                if not connection.is_closed():
+                    await connection.close()
+            logger.warning("Change feed lost its connection, reconnecting")
+            reconnecting = True
+
+    async def _receive(self, connection: Any, reconnecting: bool) -> None:
+        """Listen on a connection until it is lost."""
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda connection: lost.set())
+        await connection.add_listener(CHANNEL, self._on_notification)
+        self._listening.set()
+        if reconnecting:
+            # Changes committed while the feed was not listening are lost
+            self._publish(Resync("reconnect"))
+        await lost.wait()
+
+
+def encode_event(event: ChangeEvent) -> bytes:
+    """Encode an event as a Server-Sent Events message.
+
+    Changes are sent as "change" events and resyncs as "resync" events,
+    each with the event as JSON in its data.
+    """
+    if isinstance(event, Resync):
+        return b"event: resync\ndata: " + dump_json(event, Resync) + b"\n\n"
+    return b"event: change\ndata: " + dump_json(event, DataRequestChange) + b"\n\n"
+
+
+# The feed of this process
+change_feed = DataRequestChangeFeed()
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class DataRequestLeaseModel(Base):
+    """SQLAlchemy model for the data_request_lease table.
+
+    A background worker that claims a data request takes a lease on it
+    until ``process_after``; after a failed attempt, ``process_after`` is
+    when the request may be retried. ``attempts`` counts the claims, and
+    each claim draws a new ``claim_id``.
+    """
+
+    __tablename__ = "data_request_lease"
+
+    data_request_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("data_request.id", ondelete="CASCADE"), primary_key=True
+    )
+    attempts: Mapped[int] = mapped_column(Integer)
+    process_after: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    claim_id: Mapped[int] = mapped_column(BigInteger)
@@ -1,11 +1,34 @@
 from datetime import date, datetime
+from typing import Any
 
 from sqlalchemy import Date, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import UserDefinedType
 
 from core.database import Base
 
 
+class Xid8(UserDefinedType[int]):
+    """PostgreSQL's 64-bit transaction ID."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw: Any) -> str:
+        return "XID8"
+
+
+class PgSnapshot(UserDefinedType[str]):
+    """A PostgreSQL snapshot, as text like "xmin:xmax:xip,...".
+
+    Bind values as text and cast them, so drivers need no codec for it.
+    """
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw: Any) -> str:
+        return "PG_SNAPSHOT"
+
+
 class DataRequestModel(Base):
     """SQLAlchemy model for the data_request table."""
 
@@ -22,3 +45,5 @@ class DataRequestModel(Base):
     request_source_id: Mapped[str] = mapped_column(
         String(100), ForeignKey("request_source.id")
     )
+    # The transaction that last inserted or updated the row, for sync
+    change_xid: Mapped[int | None] = mapped_column(Xid8())
@@ -1,36 +1,212 @@
-from datetime import datetime
+import re
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Collection, Mapping, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Double,
+    Integer,
+    Interval,
+    Text,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 
-from core.data_request.data_request import DataRequest, Status
-from core.data_request.data_request_model import DataRequestModel
+from core.data_request.data_request import (
+    ClaimedDataRequest,
+    DataRequest,
+    DataRequestFilter,
+    DataRequestSummary,
+    RequestSourceCount,
+    Status,
+    StatusCount,
+)
+from core.data_request.data_request_count_model import DataRequestCountModel
+from core.data_request.data_request_lease_model import DataRequestLeaseModel
+from core.data_request.data_request_model import DataRequestModel, PgSnapshot
 from core.person.person import Person
-from core.repository import BaseRepository
+from core.repository import (
+    BaseRepository,
+    InvalidCursorError,
+    Page,
+    RowMapper,
+    any_of,
+    decode_cursor,
+    encode_cursor,
+)
+
+_SNAPSHOT_PATTERN = re.compile(r"\d+:\d+:(\d+(,\d+)*)?")
+
+
+class InvalidSyncTokenError(ValueError):
+    """Raised when a sync token cannot be decoded."""
+
+    pass
+
+
+def _decode_sync_token(token: str) -> str:
+    """Decode a sync token back into the text of its snapshot.
+
+    Raises:
+        InvalidSyncTokenError: If the token is malformed.
+    """
+    try:
+        (snapshot,) = decode_cursor(token, (str,))
+    except InvalidCursorError as e:
+        raise InvalidSyncTokenError("Invalid sync token") from e
+    if not _SNAPSHOT_PATTERN.fullmatch(snapshot):
+        raise InvalidSyncTokenError("Invalid sync token")
+    return snapshot
 
 
 class DataRequestRepository(BaseRepository):
     """Repository for data request data access."""
 
+    _mapper = RowMapper(
+        DataRequest, DataRequestModel.__table__, converters={"status": Status}
+    )
+
+    async def get_version(self) -> int:
+        """Get a stamp that changes whenever the table is written to."""
+        return await self._get_table_version(DataRequestModel.__tablename__)
+
     async def get_all(self) -> list[DataRequest]:
         """Load all data requests from the database."""
-        stmt = select(DataRequestModel).order_by(DataRequestModel.id)
+        page = await self.find(DataRequestFilter())
+        return page.items
+
+    async def get_summary(self) -> DataRequestSummary:
+        """Count data requests by status and by request source.
+
+        Reads the counters that triggers keep, not data_request itself, so
+        the cost depends on the number of statuses and request sources, not
+        on the number of data requests.
+        """
+        count = DataRequestCountModel
+        total = cast(func.sum(count.count), BigInteger)
+        stmt = (
+            select(count.status, count.request_source_id, total)
+            .group_by(count.status, count.request_source_id)
+            .having(total != 0)
+        )
         result = await self.session.execute(stmt)
-        rows = result.scalars().all()
 
-        return [
-            DataRequest(
-                id=row.id,
-                person_id=row.person_id,
-                first_name=row.first_name,
-                last_name=row.last_name,
-                date_of_birth=row.date_of_birth,
-                status=Status(row.status),
-                created_on=row.created_on,
-                created_by=row.created_by,
-                request_source_id=row.request_source_id,
+        by_status: Counter[Status] = Counter({status: 0 for status in Status})
+        by_source: Counter[str] = Counter()
+        for status, request_source_id, n in result:
+            by_status[Status(status)] += n
+            by_source[request_source_id] += n
+        return DataRequestSummary(
+            total=by_status.total(),
+            by_status=[StatusCount(status, n) for status, n in by_status.items()],
+            by_request_source=[
+                RequestSourceCount(request_source_id, n)
+                for request_source_id, n in sorted(by_source.items())
+            ],
+        )
+
+    async def get_sync_token(self) -> str:
+        """Get a token for reading the data requests changed from now on.
+
+        The token is the snapshot of this moment: rows whose last change it
+        cannot see have changed since. Take it before reading the rows, so
+        that anything committed meanwhile is read again rather than missed.
+        """
+        stmt = select(cast(func.pg_current_snapshot(), Text))
+        result = await self.session.execute(stmt)
+        return encode_cursor([result.scalar_one()])
+
+    async def find(
+        self,
+        filters: DataRequestFilter,
+        limit: int | None = None,
+        cursor: str | None = None,
+        since: str | None = None,
+    ) -> Page[DataRequest]:
+        """Load a page of data requests matching the given filters.
+
+        Results are ordered by id and paginated by keyset: ``cursor`` is the
+        ``next_cursor`` of the previous page, so every page costs the same
+        index range scan no matter how deep it is.
+
+        Pass a token from ``get_sync_token`` as ``since`` to load only the
+        requests inserted or updated since it was taken. They are found by
+        an index range on change_xid, so the cost depends on how much has
+        changed, not on the table size.
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded.
+            InvalidSyncTokenError: If the sync token cannot be decoded.
+        """
+        stmt = (
+            select(*self._mapper.columns)
+            .where(*self._filter_clauses(filters))
+            .order_by(DataRequestModel.id)
+        )
+        if since is not None:
+            snapshot = cast(cast(_decode_sync_token(since), Text), PgSnapshot())
+            stmt = stmt.where(
+                DataRequestModel.change_xid >= func.pg_snapshot_xmin(snapshot),
+                ~func.pg_visible_in_snapshot(DataRequestModel.change_xid, snapshot),
             )
-            for row in rows
-        ]
+        if cursor is not None:
+            (last_id,) = decode_cursor(cursor, (int,))
+            stmt = stmt.where(DataRequestModel.id > last_id)
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        result = await self.session.execute(stmt)
+        items = self._mapper.all(result)
+        return self._paginate(items, limit, lambda dr: (dr.id,))
+
+    async def stream(
+        self, filters: DataRequestFilter, chunk_size: int = 1000
+    ) -> AsyncIterator[list[DataRequest]]:
+        """Stream the data requests matching the filters in chunks.
+
+        Rows are read through a server-side cursor ``chunk_size`` at a time,
+        so memory use stays flat however many rows match.
+        """
+        stmt = (
+            select(*self._mapper.columns)
+            .where(*self._filter_clauses(filters))
+            .order_by(DataRequestModel.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions():
+            yield self._mapper.all(rows)
+
+    @staticmethod
+    def _filter_clauses(filters: DataRequestFilter) -> list[ColumnElement[bool]]:
+        """Build WHERE clauses for the filters that are set."""
+        clauses: list[ColumnElement[bool]] = []
+        if filters.status is not None:
+            clauses.append(DataRequestModel.status == filters.status)
+        if filters.status_in is not None:
+            clauses.append(DataRequestModel.status.in_(filters.status_in))
+        if filters.request_source_id is not None:
+            clauses.append(
+                DataRequestModel.request_source_id == filters.request_source_id
+            )
+        if filters.person_id is not None:
+            clauses.append(DataRequestModel.person_id == filters.person_id)
+        if filters.created_by is not None:
+            clauses.append(DataRequestModel.created_by == filters.created_by)
+        if filters.created_from is not None:
+            clauses.append(DataRequestModel.created_on >= filters.created_from)
+        if filters.created_to is not None:
+            clauses.append(DataRequestModel.created_on < filters.created_to)
+        return clauses
 
     async def create(
         self,
@@ -38,30 +214,255 @@ class DataRequestRepository(BaseRepository):
         request_source_id: str,
         created_by: str,
     ) -> DataRequest:
-        """Create a new data request in the database."""
-        model = DataRequestModel(
-            person_id=person.id,
-            first_name=person.first_name,
-            last_name=person.last_name,
-            date_of_birth=person.date_of_birth,
-            status=Status.PROCESSING,
-            created_on=datetime.now(),
-            created_by=created_by,
-            request_source_id=request_source_id,
-        )
-
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-
-        return DataRequest(
-            id=model.id,
-            person_id=model.person_id,
-            first_name=model.first_name,
-            last_name=model.last_name,
-            date_of_birth=model.date_of_birth,
-            status=Status(model.status),
-            created_on=model.created_on,
-            created_by=model.created_by,
-            request_source_id=model.request_source_id,
+        """Create a new data request in the database.
+
+        A single INSERT ... RETURNING both writes the row and reads back the
+        generated id, so there is no flush/refresh round trip.
+        """
+        stmt = (
+            insert(DataRequestModel)
+            .values(
+                person_id=person.id,
+                first_name=person.first_name,
+                last_name=person.last_name,
+                date_of_birth=person.date_of_birth,
+                status=Status.PROCESSING,
+                created_on=datetime.now(),
+                created_by=created_by,
+                request_source_id=request_source_id,
+            )
+            .returning(*self._mapper.columns)
+        )
+        result = await self.session.execute(stmt)
+        return self._mapper(result.one())
+
+    async def create_many(
+        self,
+        items: Sequence[tuple[Person, str]],
+        created_by: str,
+    ) -> list[DataRequest]:
+        """Create data requests for (person, request_source_id) pairs.
+
+        However many items there are, this is one INSERT ... SELECT FROM
+        unnest(...) RETURNING statement, with each column bound as a single
+        array parameter. The created requests are returned in input order.
+        """
+        if not items:
+            return []
+
+        table = DataRequestModel.__table__
+        arrays = {
+            "person_id": [person.id for person, _ in items],
+            "first_name": [person.first_name for person, _ in items],
+            "last_name": [person.last_name for person, _ in items],
+            "date_of_birth": [person.date_of_birth for person, _ in items],
+            "request_source_id": [source_id for _, source_id in items],
+        }
+        rows = (
+            func.unnest(
+                *(
+                    bindparam(None, values, type_=ARRAY(table.c[name].type))
+                    for name, values in arrays.items()
+                )
+            )
+            .table_valued(
+                *(column(name, table.c[name].type) for name in arrays),
+                with_ordinality="ordinality",
+            )
+            .render_derived()
+        )
+        # Ids are drawn from the sequence in the SELECT's order, so sorting
+        # the returned rows by id puts them back in input order.
+        source = select(
+            *(rows.c[name] for name in arrays),
+            literal(Status.PROCESSING, table.c.status.type),
+            literal(datetime.now(), table.c.created_on.type),
+            literal(created_by, table.c.created_by.type),
+        ).order_by(rows.c.ordinality)
+        stmt = (
+            insert(DataRequestModel)
+            .from_select([*arrays, "status", "created_on", "created_by"], source)
+            .returning(*self._mapper.columns)
+        )
+        result = await self.session.execute(stmt)
+        return sorted(self._mapper.all(result), key=lambda dr: dr.id)
+
+    async def change_status(
+        self,
+        status: Status,
+        allowed_from: Collection[Status],
+        ids: Sequence[int] | None = None,
+        filters: DataRequestFilter | None = None,
+    ) -> list[int]:
+        """Move data requests to ``status`` if they are in an allowed status.
+
+        Requests are picked by ``ids``, ``filters`` or both, and only those
+        whose status is in ``allowed_from`` are updated. The worker leases
+        of the updated requests are dropped with them: a worker still
+        processing one has its result ignored, and a request moved back to
+        PROCESSING starts again from its first attempt. However many there
+        are, this is one statement. Returns the ids of the requests that
+        were updated.
+        """
+        # Against the table, not the model, for the same reason as in
+        # finish_processing
+        table = DataRequestModel.metadata.tables[DataRequestModel.__tablename__]
+        clauses = [any_of(table.c.status, allowed_from, Integer())]
+        if ids is not None:
+            clauses.append(any_of(table.c.id, ids, Integer()))
+        if filters is not None:
+            clauses.extend(self._filter_clauses(filters))
+        updated = (
+            update(table)
+            .where(*clauses)
+            .values(status=status)
+            .returning(table.c.id)
+            .cte("updated")
+        )
+        dropped = (
+            delete(DataRequestLeaseModel)
+            .where(DataRequestLeaseModel.data_request_id == updated.c.id)
+            .cte("dropped")
+        )
+        stmt = select(updated.c.id).add_cte(dropped)
+        result = await self.session.execute(stmt)
+        return sorted(result.scalars())
+
+    async def claim(
+        self, request_source_id: str, limit: int, lease: timedelta
+    ) -> list[ClaimedDataRequest]:
+        """Claim up to ``limit`` PROCESSING requests of a source for a worker.
+
+        The oldest requests that are not leased, or whose lease has expired,
+        are leased for ``lease``; commit to hold the claim. Concurrent
+        workers pass over each other's claims instead of waiting, and never
+        claim the same request (see the claim_data_requests function).
+        """
+        claimed = (
+            func.claim_data_requests(request_source_id, limit, lease)
+            .table_valued(
+                column("data_request_id", Integer),
+                column("attempts", Integer),
+                column("claim_id", BigInteger),
+            )
+            .render_derived()
+        )
+        stmt = (
+            select(*self._mapper.columns, claimed.c.attempts, claimed.c.claim_id)
+            .join_from(
+                DataRequestModel,
+                claimed,
+                DataRequestModel.id == claimed.c.data_request_id,
+            )
+            .order_by(DataRequestModel.id)
+        )
+        result = await self.session.execute(stmt)
+        return [
+            ClaimedDataRequest(self._mapper(row[:-2]), row[-2], row[-1])
+            for row in result
+        ]
+
+    async def finish_processing(
+        self, statuses: Mapping[int, tuple[int, Status]]
+    ) -> list[int]:
+        """Move processed requests out of PROCESSING and drop their leases.
+
+        ``statuses`` maps request ids to the id of the claim that processed
+        them and their new statuses. A result only counts while its claim
+        still holds the lease: a request whose lease ran out and was claimed
+        again by another worker is left to that worker. Requests that have left
+        PROCESSING in the meantime, e.g. by a reviewer, are left alone too.
+        All of them are updated with one statement; returns the ids of the
+        requests that were updated.
+        """
+        if not statuses:
+            return []
+        rows = (
+            func.unnest(
+                bindparam(None, list(statuses), type_=ARRAY(Integer())),
+                bindparam(
+                    None,
+                    [claim_id for claim_id, _ in statuses.values()],
+                    type_=ARRAY(BigInteger()),
+                ),
+                bindparam(
+                    None,
+                    [status for _, status in statuses.values()],
+                    type_=ARRAY(Integer()),
+                ),
+            )
+            .table_valued(
+                column("id", Integer),
+                column("claim_id", BigInteger),
+                column("status", Integer),
+            )
+            .render_derived()
+        )
+        held = (
+            delete(DataRequestLeaseModel)
+            .where(
+                DataRequestLeaseModel.data_request_id == rows.c.id,
+                DataRequestLeaseModel.claim_id == rows.c.claim_id,
+            )
+            .returning(DataRequestLeaseModel.data_request_id)
+            .cte("held")
+        )
+        # Against the table, not the model: the ORM cannot read back the
+        # RETURNING rows of an UPDATE that has a DELETE ... RETURNING CTE
+        table = DataRequestModel.metadata.tables[DataRequestModel.__tablename__]
+        stmt = (
+            update(table)
+            .values(status=rows.c.status)
+            .where(
+                table.c.id == rows.c.id,
+                table.c.id == held.c.data_request_id,
+                table.c.status == Status.PROCESSING,
+            )
+            .returning(table.c.id)
+        )
+        result = await self.session.execute(stmt)
+        return sorted(result.scalars())
+
+    async def retry_processing(self, delays: Mapping[int, tuple[int, float]]) -> None:
+        """Make claimed requests available again after a delay.
+
+        ``delays`` maps request ids to the id of the claim that failed and
+        the seconds from now to retry after. Like results, a delay only
+        counts while its claim still holds the lease. All the leases are updated
+        with one statement.
+        """
+        if not delays:
+            return
+        rows = (
+            func.unnest(
+                bindparam(None, list(delays), type_=ARRAY(Integer())),
+                bindparam(
+                    None,
+                    [claim_id for claim_id, _ in delays.values()],
+                    type_=ARRAY(BigInteger()),
+                ),
+                bindparam(
+                    None,
+                    [delay for _, delay in delays.values()],
+                    type_=ARRAY(Double()),
+                ),
+            )
+            .table_valued(
+                column("id", Integer),
+                column("claim_id", BigInteger),
+                column("delay", Double),
+            )
+            .render_derived()
+        )
+        stmt = (
+            update(DataRequestLeaseModel)
+            .values(
+                process_after=func.now()
+                + rows.c.delay * literal(timedelta(seconds=1), Interval)
+            )
+            .where(
+                DataRequestLeaseModel.data_request_id == rows.c.id,
+                DataRequestLeaseModel.claim_id == rows.c.claim_id,
+            )
         )
+        await self.session.execute(stmt)
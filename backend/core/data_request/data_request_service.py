@@ -1,6 +1,17 @@
-from core.data_request.data_request import DataRequest
+from core.data_request.data_request import (
+    STATUS_TRANSITIONS,
+    BulkCreateFailure,
+    BulkCreateResult,
+    DataRequest,
+    DataRequestFilter,
+    NewDataRequest,
+    Status,
+    StatusChangeResult,
+)
 from core.data_request.data_request_repo import DataRequestRepository
+from core.person.person import Person
 from core.person.person_repo import PersonRepository
+from core.request_source.request_source_repo import RequestSourceRepository
 
 
 class PersonNotFoundError(ValueError):
@@ -9,6 +20,12 @@ class PersonNotFoundError(ValueError):
     pass
 
 
+class InvalidStatusChangeError(ValueError):
+    """Raised when no data request can be moved to the requested status."""
+
+    pass
+
+
 class DataRequestService:
     """Service for data request business logic."""
 
@@ -16,9 +33,11 @@ class DataRequestService:
         self,
         data_request_repo: DataRequestRepository,
         person_repo: PersonRepository,
+        request_source_repo: RequestSourceRepository | None = None,
     ) -> None:
         self.data_request_repo = data_request_repo
         self.person_repo = person_repo
+        self.request_source_repo = request_source_repo
 
     async def create_data_request(
         self,
@@ -42,3 +61,82 @@ class DataRequestService:
             request_source_id=request_source_id,
             created_by=created_by,
         )
+
+    async def create_data_requests(
+        self,
+        items: list[NewDataRequest],
+        created_by: str = "demo_user",
+    ) -> BulkCreateResult:
+        """Create many data requests at once.
+
+        People, and request sources when a request source repository was
+        given, are validated with one lookup each. Items that reference
+        a missing person or request source are reported as failures; the
+        rest are created with a single insert.
+        """
+        people = await self.person_repo.get_by_ids([item.person_id for item in items])
+        request_source_ids = None
+        if self.request_source_repo is not None:
+            request_sources = await self.request_source_repo.get_by_ids(
+                [item.request_source_id for item in items]
+            )
+            request_source_ids = request_sources.keys()
+
+        valid: list[tuple[Person, str]] = []
+        failed: list[BulkCreateFailure] = []
+        for index, item in enumerate(items):
+            person = people.get(item.person_id)
+            if person is None:
+                error = f"Person with id {item.person_id} not found"
+            elif (
+                request_source_ids is not None
+                and item.request_source_id not in request_source_ids
+            ):
+                error = f"Request source with id {item.request_source_id} not found"
+            else:
+                valid.append((person, item.request_source_id))
+                continue
+            failed.append(
+                BulkCreateFailure(
+                    index=index,
+                    person_id=item.person_id,
+                    request_source_id=item.request_source_id,
+                    error=error,
+                )
+            )
+
+        created = await self.data_request_repo.create_many(valid, created_by=created_by)
+        return BulkCreateResult(created=created, failed=failed)
+
+    async def change_status(
+        self,
+        status: Status,
+        ids: list[int] | None = None,
+        filters: DataRequestFilter | None = None,
+    ) -> StatusChangeResult:
+        """Move data requests, picked by ids or by filters, to a status.
+
+        Only requests whose current status allows the change, as listed in
+        ``STATUS_TRANSITIONS``, are moved; all of them with one update. Ids
+        that were not moved are reported as skipped. With filters, requests
+        in other statuses are not matched, so nothing is reported skipped.
+
+        Raises:
+            InvalidStatusChangeError: If no status can change to ``status``.
+        """
+        allowed_from = [
+            current
+            for current, targets in STATUS_TRANSITIONS.items()
+            if status in targets
+        ]
+        if not allowed_from:
+            raise InvalidStatusChangeError(
+                f"Data requests cannot be moved to status {status}"
+            )
+
+        updated = await self.data_request_repo.change_status(
+            status, allowed_from, ids=ids, filters=filters
+        )
+        updated_ids = set(updated)
+        skipped = [id for id in dict.fromkeys(ids or []) if id not in updated_ids]
+        return StatusChangeResult(status=status, updated=updated, skipped=skipped)
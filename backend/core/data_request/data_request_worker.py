@@ -0,0 +1,303 @@
+import asyncio
+import logging
+import os
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.data_request.data_request import ClaimedDataRequest, DataRequest, Status
+from core.data_request.data_request_repo import DataRequestRepository
+from core.database import open_session
+
+logger = logging.getLogger(__name__)
+
+# How often a source with no work left checks for new requests
+POLL_INTERVAL_SECONDS = float(os.getenv("WORKER_POLL_INTERVAL", "1"))
+
+# How often processed requests are written back, and how many are written
+# back at once without waiting for the interval
+FLUSH_INTERVAL_SECONDS = float(os.getenv("WORKER_FLUSH_INTERVAL", "0.5"))
+FLUSH_SIZE = int(os.getenv("WORKER_FLUSH_SIZE", "1000"))
+
+# How long a claim outlives a request's timeout, so that the result can be
+# written back before another worker may claim the request again
+LEASE_MARGIN_SECONDS = 30.0
+
+# The statuses a connector can move a request to
+FINAL_STATUSES = frozenset({Status.NEEDS_REVIEW, Status.COMPLETE})
+
+
+class SourceConnector(Protocol):
+    """Processes the data requests of a request source."""
+
+    async def process(self, data_request: DataRequest) -> Status:
+        """Process a data request and return its new status.
+
+        Return ``Status.COMPLETE``, or ``Status.NEEDS_REVIEW`` if a person
+        has to look at it; raise to have it retried. A request can be
+        processed again after a worker dies or its result cannot be written
+        back, so processing must be safe to repeat.
+        """
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class SourceHandler:
+    """How the worker processes the data requests of one request source.
+
+    At most ``concurrency`` requests are processed at once per worker. A
+    request that raises or takes longer than ``timeout_seconds`` is retried
+    after ``retry_delay_seconds``, doubling with each attempt up to
+    ``max_retry_delay_seconds``; after ``max_attempts`` it needs review.
+    """
+
+    connector: SourceConnector
+    concurrency: int = 10
+    timeout_seconds: float = 30.0
+    max_attempts: int = 5
+    retry_delay_seconds: float = 1.0
+    max_retry_delay_seconds: float = 300.0
+
+    @property
+    def lease(self) -> timedelta:
+        """How long a claimed request is kept from other workers."""
+        return timedelta(
+            seconds=self.timeout_seconds + FLUSH_INTERVAL_SECONDS + LEASE_MARGIN_SECONDS
+        )
+
+    def retry_delay(self, attempt: int) -> float:
+        """Seconds to wait before retrying a request after a failed attempt."""
+        return min(
+            self.retry_delay_seconds * 2 ** (attempt - 1), self.max_retry_delay_seconds
+        )
+
+
+@dataclass
+class WorkerStats:
+    """What a worker has done since it started."""
+
+    claimed: int = 0
+    completed: int = 0
+    needs_review: int = 0
+    retried: int = 0
+    claims: int = 0
+    flushes: int = 0
+
+
+class DataRequestWorker:
+    """Processes PROCESSING data requests in the background.
+
+    Each request source with a handler is worked on its own: the worker
+    claims as many of its oldest requests as it has free slots for and
+    processes them concurrently. Results are collected and written back in
+    bulk every ``FLUSH_INTERVAL_SECONDS``, one statement for the requests
+    that finished and one for those to retry. Claims are leases in the
+    database, so any number of workers, in any number of processes, can
+    work on the same sources without processing a request twice.
+    """
+
+    def __init__(
+        self,
+        handlers: dict[str, SourceHandler],
+        session_factory: Callable[[], AsyncSession] = open_session,
+    ) -> None:
+        self.handlers = handlers
+        self.stats = WorkerStats()
+        self._session_factory = session_factory
+        # Results by request id, with the claim that produced them, so that
+        # they are only written back while that claim holds the lease
+        self._statuses: dict[int, tuple[int, Status]] = {}
+        self._delays: dict[int, tuple[int, float]] = {}
+        self._stopping = asyncio.Event()
+        self._flush_needed = asyncio.Event()
+
+    async def run(self) -> None:
+        """Process requests until ``stop`` is called.
+
+        On stopping, no more requests are claimed; those in progress are
+        finished and every result is written back before this returns.
+        """
+        flusher = asyncio.create_task(self._flush_periodically())
+        try:
+            await asyncio.gather(
+                *(
+                    self._run_source(request_source_id, handler)
+                    for request_source_id, handler in self.handlers.items()
+                )
+            )
+        finally:
+            # Let the flusher finish a write in progress rather than cancel it
+            self._stopping.set()
+            self._flush_needed.set()
+            await flusher
+            await self.flush()
+
+    def stop(self) -> None:
+        """Ask the worker to stop once the requests in progress are done."""
+        self._stopping.set()
+
+    async def flush(self) -> None:
+        """Write the results collected so far back to the database.
+
+        If the write fails the results are kept for the next flush. Results
+        whose lease has meanwhile run out and been taken by another worker
+        are dropped, as that worker now processes the request.
+        """
+        if not self._statuses and not self._delays:
+            return
+        statuses, self._statuses = self._statuses, {}
+        delays, self._delays = self._delays, {}
+        try:
+            async with self._session_factory() as session:
+                repo = DataRequestRepository(session)
+                await repo.finish_processing(statuses)
+                await repo.retry_processing(delays)
+                await session.commit()
+        except Exception:
+            logger.exception("Could not write back processed data requests")
+            self._statuses = statuses | self._statuses
+            self._delays = delays | self._delays
+            return
+        self.stats.flushes += 1
+
+    async def _run_source(self, request_source_id: str, handler: SourceHandler) -> None:
+        """Claim and process the requests of one source until stopping."""
+        loop = asyncio.get_running_loop()
+        # Claim in batches of at least a quarter of the slots, so that a
+        # busy source is not claimed from once per finished request
+        batch_size = max(1, handler.concurrency // 4)
+        tasks: set[asyncio.Task[None]] = set()
+        next_claim = loop.time()
+        stopping = asyncio.create_task(self._stopping.wait())
+        try:
+            while not self._stopping.is_set():
+                free = handler.concurrency - len(tasks)
+                if (free >= batch_size or not tasks) and loop.time() >= next_claim:
+                    claims = await self._claim(request_source_id, handler, free)
+                    if len(claims) < free:
+                        # No more to claim for now; look again after a while
+                        next_claim = loop.time() + POLL_INTERVAL_SECONDS
+                    for claim in claims:
+                        tasks.add(asyncio.create_task(self._process(handler, claim)))
+                # Wait for a slot, or for the next poll if there was nothing
+                # left to claim; stopping cuts either short
+                wait = next_claim - loop.time()
+                done, _ = await asyncio.wait(
+                    {*tasks, stopping},
+                    timeout=wait if wait > 0 else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                tasks -= done
+        finally:
+            stopping.cancel()
+            if tasks:
+                await asyncio.wait(tasks)
+
+    async def _claim(
+        self, request_source_id: str, handler: SourceHandler, limit: int
+    ) -> list[ClaimedDataRequest]:
+        try:
+            async with self._session_factory() as session:
+                claims = await DataRequestRepository(session).claim(
+                    request_source_id, limit, handler.lease
+                )
+                await session.commit()
+        except Exception:
+            logger.exception("Could not claim data requests of %s", request_source_id)
+            return []
+        self.stats.claims += 1
+        self.stats.claimed += len(claims)
+        return claims
+
+    async def _process(self, handler: SourceHandler, claim: ClaimedDataRequest) -> None:
+        data_request = claim.data_request
+        try:
+            async with asyncio.timeout(handler.timeout_seconds):
+                status = await handler.connector.process(data_request)
+            if status not in FINAL_STATUSES:
+                raise ValueError(f"Connector returned status {status!r}")
+            status = Status(status)
+        except Exception as e:
+            if claim.attempt < handler.max_attempts:
+                logger.warning(
+                    "Attempt %d of data request %d failed, retrying: %r",
+                    claim.attempt,
+                    data_request.id,
+                    e,
+                )
+                self._delays[data_request.id] = (
+                    claim.claim_id,
+                    handler.retry_delay(claim.attempt),
+                )
+                self.stats.retried += 1
+                self._flush_soon()
+                return
+            logger.error(
+                "Data request %d failed %d times, it needs review: %r",
+                data_request.id,
+                claim.attempt,
+                e,
+            )
+            status = Status.NEEDS_REVIEW
+
+        self._statuses[data_request.id] = (claim.claim_id, status)
+        if status is Status.COMPLETE:
+            self.stats.completed += 1
+        else:
+            self.stats.needs_review += 1
+        self._flush_soon()
+
+    def _flush_soon(self) -> None:
+        if len(self._statuses) + len(self._delays) >= FLUSH_SIZE:
+            self._flush_needed.set()
+
+    async def _flush_periodically(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                async with asyncio.timeout(FLUSH_INTERVAL_SECONDS):
+                    await self._flush_needed.wait()
+            except TimeoutError:
+                pass
+            self._flush_needed.clear()
+            await self.flush()
+
+
+class FakeConnectorError(Exception):
+    """Raised by ``FakeConnector`` for a simulated failure."""
+
+    pass
+
+
+class FakeConnector:
+    """Pretends to process requests with a request source, for local runs.
+
+    Each request takes ``latency_seconds`` on average, fails with
+    probability ``failure_rate`` and otherwise needs review with
+    probability ``review_rate``. Every request it finishes is recorded in
+    ``processed``, so duplicates can be spotted.
+    """
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.05,
+        failure_rate: float = 0.0,
+        review_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.latency_seconds = latency_seconds
+        self.failure_rate = failure_rate
+        self.review_rate = review_rate
+        self.processed: list[int] = []
+        self._random = random.Random(seed)
+
+    async def process(self, data_request: DataRequest) -> Status:
+        await asyncio.sleep(self.latency_seconds * self._random.uniform(0.5, 1.5))
+        if self._random.random() < self.failure_rate:
+            raise FakeConnectorError(f"Simulated failure for {data_request.id}")
+        self.processed.append(data_request.id)
+        if self._random.random() < self.review_rate:
+            return Status.NEEDS_REVIEW
+        return Status.COMPLETE
@@ -1,12 +1,28 @@
 import os
-from typing import AsyncGenerator
+import random
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable
 from urllib.parse import quote_plus
 
-import psycopg
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import Connection, Engine, Select, exc
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+from starlette.requests import Request
+
+from core.metrics import Histogram
 
+if TYPE_CHECKING:
+    import psycopg
+
+# The one place .env is read; every module that reads settings imports this
 load_dotenv()
 
 
@@ -27,10 +43,13 @@ def get_connection_string() -> str:
     return f"postgresql://{user}:{encoded_password}@{host}:{port}/{dbname}"
 
 
-def get_async_database_url() -> str:
-    """Build async database URL for SQLAlchemy from environment variables."""
-    host = os.getenv("DB_HOST", "localhost")
-    port = os.getenv("DB_PORT", "5432")
+def get_async_database_url(host: str | None = None, port: str | None = None) -> str:
+    """Build async database URL for SQLAlchemy from environment variables.
+
+    Pass a host and port to build the URL of a replica of the database.
+    """
+    host = host or os.getenv("DB_HOST", "localhost")
+    port = port or os.getenv("DB_PORT", "5432")
     dbname = os.getenv("DB_NAME", "data_request_manager")
     user = os.getenv("DB_USER", "postgres")
     password = os.getenv("DB_PASSWORD", "postgres")
@@ -38,18 +57,218 @@ def get_async_database_url() -> str:
     return f"postgresql+asyncpg://{user}:{encoded_password}@{host}:{port}/{dbname}"
 
 
-engine = create_async_engine(
-    get_async_database_url(),
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
-async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+def get_replica_database_urls() -> list[str]:
+    """Build async database URLs for the read replicas in DB_REPLICA_HOSTS.
+
+    DB_REPLICA_HOSTS is a comma-separated list of host or host:port
+    entries; replicas share the primary's database name and credentials.
+    """
+    urls = []
+    for entry in os.getenv("DB_REPLICA_HOSTS", "").split(","):
+        if entry.strip():
+            host, _, port = entry.strip().partition(":")
+            urls.append(get_async_database_url(host, port or None))
+    return urls
+
+
+def get_pool_options() -> dict[str, Any]:
+    """Build connection pool options from environment variables.
+
+    DB_POOL_RECYCLE=-1 keeps connections indefinitely. Pre-ping costs a
+    round trip per checkout; with it off, a connection the server dropped
+    fails one request and is then replaced.
+    """
+    return {
+        "poolclass": InstrumentedPool,
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "-1")),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        "connect_args": {
+            "prepared_statement_cache_size": int(
+                os.getenv("DB_STATEMENT_CACHE_SIZE", "100")
+            ),
+        },
+    }
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait and how many time out.
+
+    The wait includes opening a new connection when the pool grows. The
+    counters carry over to the new pool when ``engine.dispose()`` replaces it.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_seconds = Histogram()
+        self.timeouts = 0
+
+    def recreate(self) -> "InstrumentedPool":
+        pool = super().recreate()
+        assert isinstance(pool, InstrumentedPool)
+        pool.wait_seconds = self.wait_seconds
+        pool.timeouts = self.timeouts
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.wait_seconds.observe(time.perf_counter() - start)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    """Point-in-time state of a connection pool."""
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    timeouts: int
+    waits: int
+    wait_seconds_total: float
+    wait_seconds_buckets: dict[str, int]
+
+
+def get_pool_stats(engine: AsyncEngine) -> PoolStats:
+    """Get the checkout counters and wait time histogram of an engine's pool."""
+    pool = engine.pool
+    assert isinstance(pool, InstrumentedPool)
+    return PoolStats(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=max(pool.overflow(), 0),
+        timeouts=pool.timeouts,
+        waits=pool.wait_seconds.count,
+        wait_seconds_total=pool.wait_seconds.sum,
+        wait_seconds_buckets=pool.wait_seconds.cumulative(),
+    )
+
+
+class RoutingSession(Session):
+    """Session that reads from a replica, if it has one, until it writes.
 
+    The replica comes from ``session.info["replica"]``. The first statement
+    that is not a plain SELECT, including any flush, goes to the primary,
+    and so does everything after it, so reads after a write see the write.
+    """
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting async database sessions."""
-    async with async_session_maker() as session:
+    def get_bind(
+        self, mapper: Any = None, *, clause: Any = None, **kw: Any
+    ) -> Engine | Connection:
+        replica = self.info.get("replica")
+        if replica is not None and not self.info.get("wrote"):
+            if isinstance(clause, Select) and clause._for_update_arg is None:
+                return replica.sync_engine
+            self.info["wrote"] = True
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@dataclass(slots=True)
+class Database:
+    """The engines and session factory of a process."""
+
+    engine: AsyncEngine
+    replica_engines: list[AsyncEngine]
+    session_maker: async_sessionmaker[AsyncSession]
+
+
+_database: Database | None = None
+_engine_hooks: list[Callable[[AsyncEngine, str], None]] = []
+
+
+def on_engine_created(hook: Callable[[AsyncEngine, str], None]) -> None:
+    """Run ``hook(engine, name)`` for every engine, including existing ones.
+
+    Engines are named "primary" and "replica-0", "replica-1", and so on.
+    """
+    _engine_hooks.append(hook)
+    if _database is not None:
+        for name, engine in _named_engines(_database):
+            hook(engine, name)
+
+
+def _named_engines(database: Database) -> list[tuple[str, AsyncEngine]]:
+    return [("primary", database.engine)] + [
+        (f"replica-{index}", engine)
+        for index, engine in enumerate(database.replica_engines)
+    ]
+
+
+def get_database() -> Database:
+    """Get the process's engines, creating them on first use.
+
+    Creating an engine imports the asyncpg dialect but opens no
+    connections, so importing this module stays cheap for scripts that
+    never connect through SQLAlchemy.
+    """
+    global _database
+    if _database is None:
+        engine = create_async_engine(get_async_database_url(), **get_pool_options())
+        _database = Database(
+            engine=engine,
+            replica_engines=[
+                create_async_engine(url, **get_pool_options())
+                for url in get_replica_database_urls()
+            ],
+            session_maker=async_sessionmaker(
+                engine, sync_session_class=RoutingSession, expire_on_commit=False
+            ),
+        )
+        for name, named_engine in _named_engines(_database):
+            for hook in _engine_hooks:
+                hook(named_engine, name)
+    return _database
+
+
+async def dispose_database() -> None:
+    """Close every pooled connection; the next use starts new pools."""
+    global _database
+    if _database is not None:
+        database, _database = _database, None
+        for engine in (database.engine, *database.replica_engines):
+            await engine.dispose()
+
+
+def _discard_pools_after_fork() -> None:
+    """Give a forked child fresh pools, leaving the parent's connections alone."""
+    if _database is not None:
+        for engine in (_database.engine, *_database.replica_engines):
+            engine.sync_engine.dispose(close=False)
+
+
+# Serving workers are spawned, but a server that forks after creating the
+# engines, such as gunicorn --preload, must not share connections across processes
+os.register_at_fork(after_in_child=_discard_pools_after_fork)
+
+# Methods whose handlers only read, so their sessions can use a replica
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
+
+
+def open_session(read_only: bool = False) -> AsyncSession:
+    """Open a session, reading from a random replica if read-only."""
+    database = get_database()
+    if read_only and database.replica_engines:
+        return database.session_maker(
+            info={"replica": random.choice(database.replica_engines)}
+        )
+    return database.session_maker()
+
+
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting async database sessions.
+
+    GET and HEAD requests read from a replica when DB_REPLICA_HOSTS is set.
+    """
+    async with open_session(request.method in READ_ONLY_METHODS) as session:
         try:
             yield session
             await session.commit()
@@ -58,6 +277,8 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
-def get_sync_connection() -> psycopg.Connection:
+def get_sync_connection() -> "psycopg.Connection":
     """Get a sync database connection (for scripts like seed.py)."""
+    import psycopg
+
     return psycopg.connect(get_connection_string())
@@ -0,0 +1,20 @@
+import hashlib
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag from everything the response body depends on."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against the current ETag.
+
+    Uses the weak comparison that RFC 9110 prescribes for If-None-Match.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
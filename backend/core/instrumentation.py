@@ -0,0 +1,192 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.database import InstrumentedPool, get_pool_stats
+from core.metrics import Counter, Gauge, HistogramMetric, registry
+
+requests_total = registry.register(
+    Counter(
+        "http_requests_total",
+        "HTTP requests handled.",
+        ("method", "route", "status"),
+    )
+)
+request_duration = registry.register(
+    HistogramMetric(
+        "http_request_duration_seconds",
+        "Time from receiving a request to sending the last byte of its response.",
+        ("method", "route"),
+    )
+)
+requests_in_flight = registry.register(
+    Gauge(
+        "http_requests_in_flight",
+        "HTTP requests being handled.",
+        ("method",),
+    )
+)
+request_db_duration = registry.register(
+    HistogramMetric(
+        "http_request_db_seconds",
+        "Time a request spent waiting on SQL statements.",
+        ("method", "route"),
+    )
+)
+request_db_statements = registry.register(
+    HistogramMetric(
+        "http_request_db_statements",
+        "SQL statements a request executed.",
+        ("method", "route"),
+        buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100),
+    )
+)
+request_serialization_duration = registry.register(
+    HistogramMetric(
+        "http_request_serialization_seconds",
+        "Time a request spent serializing DTOs to JSON.",
+        ("method", "route"),
+    )
+)
+pool_checked_out = registry.register(
+    Gauge("db_pool_checked_out", "Connections checked out of the pool.", ("pool",))
+)
+pool_overflow = registry.register(
+    Gauge("db_pool_overflow", "Connections open beyond the pool size.", ("pool",))
+)
+pool_timeouts = registry.register(
+    Counter(
+        "db_pool_checkout_timeouts_total",
+        "Checkouts that gave up waiting for a connection.",
+        ("pool",),
+    )
+)
+pool_wait = registry.register(
+    HistogramMetric(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting for a connection, including opening new ones.",
+        ("pool",),
+    )
+)
+
+
+@dataclass(slots=True)
+class RequestTimings:
+    """Time spent in the database and in serialization by one request."""
+
+    db_seconds: float = 0.0
+    statements: int = 0
+    serialization_seconds: float = 0.0
+
+
+_timings: ContextVar[RequestTimings | None] = ContextVar("timings", default=None)
+
+
+def record_serialization(seconds: float) -> None:
+    """Add serialization time to the current request, if there is one."""
+    timings = _timings.get()
+    if timings is not None:
+        timings.serialization_seconds += seconds
+
+
+def _before_cursor_execute(conn: Any, *args: Any) -> None:
+    # A connection runs one statement at a time, so one start time is kept
+    conn.info["query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn: Any, *args: Any) -> None:
+    _record_statement(conn)
+
+
+def _handle_error(context: Any) -> None:
+    # Failed statements take database time too, and must not leave their
+    # start time behind on the pooled connection
+    if context.connection is not None:
+        _record_statement(context.connection)
+
+
+def _record_statement(conn: Any) -> None:
+    start = conn.info.pop("query_start", None)
+    if start is None:
+        return
+    timings = _timings.get()
+    if timings is not None:
+        timings.db_seconds += time.perf_counter() - start
+        timings.statements += 1
+
+
+# Engines whose pools are exported, by name; a new engine replaces its namesake
+_pooled_engines: dict[str, AsyncEngine] = {}
+
+
+def _collect_pool_stats() -> None:
+    for name, engine in _pooled_engines.items():
+        stats = get_pool_stats(engine)
+        pool_checked_out.set((name,), stats.checked_out)
+        pool_overflow.set((name,), stats.overflow)
+        pool_timeouts.values[(name,)] = stats.timeouts
+        # Expose the pool's own wait histogram rather than copying it.
+        assert isinstance(engine.pool, InstrumentedPool)
+        pool_wait.histograms[(name,)] = engine.pool.wait_seconds
+
+
+registry.add_collector(_collect_pool_stats)
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """Time the engine's statements and export its pool stats as ``name``."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+    _pooled_engines[name] = engine
+
+
+class MetricsMiddleware:
+    """Records request counts, latency and per-request DB and serialization time.
+
+    A plain ASGI middleware rather than ``BaseHTTPMiddleware``, so it adds
+    no task or memory stream per request. Routes are labelled by their path
+    template, e.g. ``/api/v1/people``, never by the raw path.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = "500"
+        timings = RequestTimings()
+        token = _timings.set(timings)
+        requests_in_flight.inc((method,))
+        start = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            requests_in_flight.inc((method,), -1)
+            _timings.reset(token)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            labels = (method, route)
+            requests_total.inc((method, route, status))
+            request_duration.observe(labels, elapsed)
+            request_db_duration.observe(labels, timings.db_seconds)
+            request_db_statements.observe(labels, timings.statements)
+            request_serialization_duration.observe(
+                labels, timings.serialization_seconds
+            )
@@ -0,0 +1,181 @@
+from bisect import bisect_left
+from typing import Callable, Iterator, Sequence
+
+# Seconds, from a fast primary key lookup to a request that should time out
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """Counts observed values into fixed buckets, Prometheus style.
+
+    Bucket bounds are inclusive upper bounds; values above the last bound
+    are counted in an implicit +Inf bucket. Not thread-safe: observe from
+    the event loop only.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> dict[str, int]:
+        """Get the number of values at or below each bound, keyed by bound."""
+        result = {}
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            result["+Inf" if bound == float("inf") else repr(bound)] = total
+        return result
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric:
+    """A named family of time series, one per combination of label values."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+
+    def samples(self) -> Iterator[tuple[str, tuple[str, ...], float]]:
+        """Yield (name suffix, label values, value) for every series."""
+        raise NotImplementedError
+
+    def render(self) -> Iterator[str]:
+        """Yield the metric in the Prometheus text exposition format."""
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.type}"
+        for suffix, labels, value in self.samples():
+            names = self.label_names
+            if suffix == "_bucket":
+                names = (*names, "le")
+            yield (
+                f"{self.name}{suffix}{_format_labels(names, labels)} "
+                f"{_format_value(value)}"
+            )
+
+
+class Counter(Metric):
+    """A value that only goes up, such as a number of requests."""
+
+    type = "counter"
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = ()) -> None:
+        super().__init__(name, help, label_names)
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, labels: tuple[str, ...] = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self) -> Iterator[tuple[str, tuple[str, ...], float]]:
+        for labels, value in self.values.items():
+            yield "", labels, value
+
+
+class Gauge(Counter):
+    """A value that goes up and down, such as requests in flight."""
+
+    type = "gauge"
+
+    def set(self, labels: tuple[str, ...], value: float) -> None:
+        self.values[labels] = value
+
+
+class HistogramMetric(Metric):
+    """A histogram per combination of label values."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, label_names)
+        self.buckets = buckets
+        self.histograms: dict[tuple[str, ...], Histogram] = {}
+
+    def labels(self, labels: tuple[str, ...]) -> Histogram:
+        """Get the histogram for some label values, creating it if needed."""
+        histogram = self.histograms.get(labels)
+        if histogram is None:
+            histogram = self.histograms[labels] = Histogram(self.buckets)
+        return histogram
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        self.labels(labels).observe(value)
+
+    def samples(self) -> Iterator[tuple[str, tuple[str, ...], float]]:
+        for labels, histogram in self.histograms.items():
+            for bound, count in histogram.cumulative().items():
+                yield "_bucket", (*labels, bound), count
+            yield "_sum", labels, histogram.sum
+            yield "_count", labels, histogram.count
+
+
+class Registry:
+    """The metrics a process exposes, rendered for a Prometheus scrape.
+
+    Collectors run before each render, to copy values that are kept
+    elsewhere, such as connection pool counters, into gauges.
+    """
+
+    def __init__(self) -> None:
+        self.metrics: list[Metric] = []
+        self.collectors: list[Callable[[], None]] = []
+
+    def register[M: Metric](self, metric: M) -> M:
+        self.metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        for collect in self.collectors:
+            collect()
+        lines = [line for metric in self.metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
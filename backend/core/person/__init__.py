@@ -1,4 +1,5 @@
 from core.person.person import Person
+from core.person.person_cache import CachedPersonRepository, person_cache
 from core.person.person_repo import PersonRepository
 
-__all__ = ["Person", "PersonRepository"]
+__all__ = ["CachedPersonRepository", "Person", "PersonRepository", "person_cache"]
@@ -0,0 +1,34 @@
+import os
+
+from core.cache import TTLCache
+from core.person.person import Person
+from core.person.person_repo import PersonRepository
+
+person_cache: TTLCache[int, Person] = TTLCache(
+    maxsize=int(os.getenv("PERSON_CACHE_MAX_SIZE", "10000")),
+    ttl=float(os.getenv("PERSON_CACHE_TTL_SECONDS", "60")),
+)
+
+
+class CachedPersonRepository(PersonRepository):
+    """PersonRepository that serves lookups by id from an in-process cache.
+
+    Anything that writes to the people table must call ``invalidate`` for
+    the rows it changed, so this process stops serving the old values.
+    """
+
+    cache = person_cache
+
+    async def get_by_id(self, person_id: int) -> Person | None:
+        """Get a person by their ID, from the cache when possible."""
+        person = self.cache.get(person_id)
+        if person is None:
+            person = await super().get_by_id(person_id)
+            if person is not None:
+                self.cache.set(person_id, person)
+        return person
+
+    @classmethod
+    def invalidate(cls, person_id: int) -> None:
+        """Drop a cached person after it was written."""
+        cls.cache.invalidate(person_id)
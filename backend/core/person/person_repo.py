@@ -1,43 +1,227 @@
-from sqlalchemy import select
+from datetime import date
+from typing import Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union_all,
+)
 
 from core.person.person import Person
 from core.person.person_model import PersonModel
-from core.repository import BaseRepository
+from core.repository import (
+    BaseRepository,
+    Page,
+    RowMapper,
+    any_of,
+    decode_cursor,
+)
+
+
+# Search terms past this many are ignored, which bounds the query's size
+MAX_SEARCH_TERMS = 3
+
+# Shorter terms share trigrams with too many names to be worth fuzzy
+# matching; they only match as prefixes
+MIN_FUZZY_TERM_LENGTH = 3
+
+# The lower-cased names in byte order, as the prefix indexes hold them
+_LAST_NAME = func.lower(PersonModel.last_name).collate("C")
+_FIRST_NAME = func.lower(PersonModel.first_name).collate("C")
+
+
+def _starts_with(name: ColumnElement[str], term: str) -> ColumnElement[bool]:
+    """Match lower-cased names starting with ``term``, which is lower case."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return name.like(escaped + "%", escape="\\")
 
 
 class PersonRepository(BaseRepository):
     """Repository for person data access."""
 
+    _mapper = RowMapper(Person, PersonModel.__table__)
+
+    async def get_version(self) -> int:
+        """Get a stamp that changes whenever the table is written to."""
+        return await self._get_table_version(PersonModel.__tablename__)
+
     async def get_all(self) -> list[Person]:
         """Load all people from the database."""
-        stmt = select(PersonModel).order_by(
-            PersonModel.last_name, PersonModel.first_name
-        )
+        page = await self.get_page()
+        return page.items
+
+    async def get_page(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> Page[Person]:
+        """Load a page of people ordered by last name, first name and id.
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded.
+        """
+        sort_key = (PersonModel.last_name, PersonModel.first_name, PersonModel.id)
+        stmt = select(*self._mapper.columns).order_by(*sort_key)
+        if cursor is not None:
+            last_key = decode_cursor(cursor, (str, str, int))
+            stmt = stmt.where(tuple_(*sort_key) > tuple_(*last_key))
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
         result = await self.session.execute(stmt)
-        rows = result.scalars().all()
-
-        return [
-            Person(
-                id=row.id,
-                first_name=row.first_name,
-                last_name=row.last_name,
-                date_of_birth=row.date_of_birth,
-            )
-            for row in rows
-        ]
+        items = self._mapper.all(result)
+        return self._paginate(items, limit, lambda p: (p.last_name, p.first_name, p.id))
 
     async def get_by_id(self, person_id: int) -> Person | None:
         """Get a person by their ID."""
-        stmt = select(PersonModel).where(PersonModel.id == person_id)
+        stmt = select(*self._mapper.columns).where(PersonModel.id == person_id)
         result = await self.session.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = result.one_or_none()
 
         if row is None:
             return None
 
-        return Person(
-            id=row.id,
-            first_name=row.first_name,
-            last_name=row.last_name,
-            date_of_birth=row.date_of_birth,
+        return self._mapper(row)
+
+    async def get_by_ids(self, person_ids: Sequence[int]) -> dict[int, Person]:
+        """Get the people with the given IDs in one query, keyed by ID.
+
+        IDs that do not exist are missing from the result.
+        """
+        stmt = select(*self._mapper.columns).where(
+            any_of(PersonModel.id, set(person_ids), Integer())
+        )
+        result = await self.session.execute(stmt)
+        return {person.id: person for person in self._mapper.all(result)}
+
+    async def search(
+        self, query: str, date_of_birth: date | None = None, limit: int = 20
+    ) -> list[Person]:
+        """Find up to ``limit`` people whose names match a search query.
+
+        Each word of the query must start the person's first or last name,
+        ignoring case, so "jo smi" finds John Smith. People whose last name
+        matches come first, ordered by last name, then those whose first name
+        matches, ordered by first name. If that leaves room, people whose
+        names only resemble the words follow, closest first; "wiliams" finds
+        Michael Williams. Words shorter than ``MIN_FUZZY_TERM_LENGTH`` must
+        match as prefixes either way.
+
+        Prefix matches are read in order from the name indexes, stopping
+        after ``limit`` rows whatever the table size. Looking for similar
+        names reads every name sharing trigrams with the words, so it costs
+        more and only runs when the prefix matches do not fill the page.
+        """
+        terms = query.lower().split()[:MAX_SEARCH_TERMS]
+        if not terms:
+            return []
+
+        people = await self._search_prefixes(terms, date_of_birth, limit)
+        if len(people) < limit and any(
+            len(term) >= MIN_FUZZY_TERM_LENGTH for term in terms
+        ):
+            people += await self._search_similar(
+                terms, date_of_birth, limit - len(people), [p.id for p in people]
+            )
+        return people
+
+    async def _search_prefixes(
+        self, terms: list[str], date_of_birth: date | None, limit: int
+    ) -> list[Person]:
+        """Find people whose names start with every term.
+
+        The longest term is looked up in the last and first name indexes,
+        each read in order up to ``limit`` rows; the other terms and the
+        date of birth filter the rows read.
+        """
+        driver = max(terms, key=len)
+        filters = [
+            or_(_starts_with(_LAST_NAME, term), _starts_with(_FIRST_NAME, term))
+            for term in terms
+            if term != driver
+        ]
+        if date_of_birth is not None:
+            filters.append(PersonModel.date_of_birth == date_of_birth)
+
+        by_last_name = (
+            select(
+                *self._mapper.columns,
+                literal(0).label("rank"),
+                _LAST_NAME.label("key"),
+                _FIRST_NAME.label("tiebreak"),
+            )
+            .where(_starts_with(_LAST_NAME, driver), *filters)
+            .order_by(_LAST_NAME, _FIRST_NAME, PersonModel.id)
+            .limit(limit)
+        )
+        by_first_name = (
+            select(
+                *self._mapper.columns,
+                literal(1).label("rank"),
+                _FIRST_NAME.label("key"),
+                _LAST_NAME.label("tiebreak"),
+            )
+            .where(
+                _starts_with(_FIRST_NAME, driver),
+                ~_starts_with(_LAST_NAME, driver),
+                *filters,
+            )
+            .order_by(_FIRST_NAME, _LAST_NAME, PersonModel.id)
+            .limit(limit)
+        )
+        matches = union_all(by_last_name, by_first_name).subquery()
+        stmt = (
+            select(*(matches.c[column.key] for column in self._mapper.columns))
+            .order_by(matches.c.rank, matches.c.key, matches.c.tiebreak, matches.c.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return self._mapper.all(result)
+
+    async def _search_similar(
+        self,
+        terms: list[str],
+        date_of_birth: date | None,
+        limit: int,
+        exclude_ids: list[int],
+    ) -> list[Person]:
+        """Find people whose names start with, or resemble, every term.
+
+        Resemblance is pg_trgm's ``%`` operator on the lower-cased names,
+        served by the trigram indexes, and results are ordered by how
+        closely the names resemble the terms.
+        """
+        first_name = func.lower(PersonModel.first_name)
+        last_name = func.lower(PersonModel.last_name)
+        filters = []
+        scores = []
+        for term in terms:
+            match = or_(_starts_with(_LAST_NAME, term), _starts_with(_FIRST_NAME, term))
+            if len(term) >= MIN_FUZZY_TERM_LENGTH:
+                match = or_(match, last_name.op("%")(term), first_name.op("%")(term))
+            filters.append(match)
+            scores.append(
+                func.greatest(
+                    func.similarity(last_name, term), func.similarity(first_name, term)
+                )
+            )
+        if date_of_birth is not None:
+            filters.append(PersonModel.date_of_birth == date_of_birth)
+        if exclude_ids:
+            filters.append(~any_of(PersonModel.id, exclude_ids, Integer()))
+
+        stmt = (
+            select(*self._mapper.columns)
+            .where(*filters)
+            .order_by(
+                sum(scores[1:], scores[0]).desc(),
+                PersonModel.last_name,
+                PersonModel.first_name,
+                PersonModel.id,
+            )
+            .limit(limit)
         )
+        result = await self.session.execute(stmt)
+        return self._mapper.all(result)
@@ -0,0 +1,168 @@
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Any, Iterator, Mapping, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Statements slower than this are logged with their parameters' shape
+SLOW_QUERY_SECONDS = float(os.getenv("QUERY_LOG_SLOW_MS", "200")) / 1000
+# A request running one statement shape more often than this is logged as N+1
+REPEAT_LIMIT = int(os.getenv("QUERY_LOG_REPEAT_LIMIT", "5"))
+
+_PLACEHOLDER_LIST = re.compile(
+    r"(?:\$\d+|%\(\w+\)s|\?)(?:\s*,\s*(?:\$\d+|%\(\w+\)s|\?))*"
+)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def query_log_enabled() -> bool:
+    """Whether QUERY_LOG turns on the slow-query log and N+1 detector."""
+    return os.getenv("QUERY_LOG", "false").lower() == "true"
+
+
+@dataclass(frozen=True, slots=True)
+class StatementRecord:
+    """One SQL statement as sent to the database."""
+
+    statement: str
+    parameters: str
+    seconds: float
+    rows: int
+
+    @property
+    def shape(self) -> str:
+        return statement_shape(self.statement)
+
+
+class QueryLog:
+    """The statements run while the log is captured, e.g. by one request."""
+
+    def __init__(self) -> None:
+        self.records: list[StatementRecord] = []
+
+    def repeated(self, limit: int) -> dict[str, int]:
+        """Get the statement shapes run more than ``limit`` times, by count."""
+        counts = Counter(record.shape for record in self.records)
+        return {shape: count for shape, count in counts.most_common() if count > limit}
+
+
+_active_logs: ContextVar[tuple[QueryLog, ...]] = ContextVar("query_logs", default=())
+
+
+@contextmanager
+def capture() -> Iterator[QueryLog]:
+    """Record the statements run by instrumented engines in this context.
+
+    Captures nest: a statement is recorded in every enclosing log, so a
+    test can capture the statements of the requests it makes.
+    """
+    log = QueryLog()
+    token = _active_logs.set((*_active_logs.get(), log))
+    try:
+        yield log
+    finally:
+        _active_logs.reset(token)
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so that runs differing only in parameters match.
+
+    Whitespace is collapsed and each list of bind placeholders, such as an
+    expanded ``IN``, becomes a single ``?``.
+    """
+    return _PLACEHOLDER_LIST.sub("?", _WHITESPACE.sub(" ", statement).strip())
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """Describe parameters by type, without their values, e.g. ``(int, str×3)``."""
+    if executemany:
+        batches = list(parameters)
+        first = parameter_shape(batches[0]) if batches else "()"
+        return f"{len(batches)}×{first}"
+    if isinstance(parameters, Mapping):
+        parameters = list(parameters.values())
+    names = [type(value).__name__ for value in parameters or ()]
+    runs = [(name, len(list(group))) for name, group in groupby(names)]
+    return "(" + ", ".join(f"{n}×{c}" if c > 1 else n for n, c in runs) + ")"
+
+
+def _before_cursor_execute(conn: Any, *args: Any) -> None:
+    conn.info.setdefault("query_log_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Sequence[Any] | Mapping[str, Any],
+    context: Any,
+    executemany: bool,
+) -> None:
+    seconds = time.perf_counter() - conn.info["query_log_start"].pop()
+    logs = _active_logs.get()
+    if not logs and seconds < SLOW_QUERY_SECONDS:
+        return
+
+    record = StatementRecord(
+        statement=statement,
+        parameters=parameter_shape(parameters, executemany),
+        seconds=seconds,
+        rows=cursor.rowcount,
+    )
+    for log in logs:
+        log.records.append(record)
+    if seconds >= SLOW_QUERY_SECONDS:
+        logger.warning(
+            "Slow query (%.1f ms, %d rows, parameters %s): %s",
+            seconds * 1000,
+            record.rows,
+            record.parameters,
+            record.shape,
+        )
+
+
+def log_queries(engine: AsyncEngine) -> None:
+    """Log the engine's slow statements and record them in captured logs."""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryLogMiddleware:
+    """Logs requests that run one statement shape more than REPEAT_LIMIT times.
+
+    Such requests usually load related rows one at a time (N+1 queries)
+    or filter in Python what the database could have filtered.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with capture() as log:
+            await self.app(scope, receive, send)
+
+        for shape, count in log.repeated(REPEAT_LIMIT).items():
+            logger.warning(
+                "%s %s ran the same statement %d times: %s",
+                scope["method"],
+                scope["path"],
+                count,
+                shape,
+            )
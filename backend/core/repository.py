@@ -1,4 +1,127 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, fields
+from typing import Any, Callable, ClassVar, Iterable, Protocol, Sequence
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    FromClause,
+    any_,
+    bindparam,
+    cast,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import KeyedColumnElement
+from sqlalchemy.types import TypeEngine
+
+from core.table_version import TableVersionModel
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
+@dataclass
+class Page[T]:
+    """One page of results from a keyset-paginated query.
+
+    ``next_cursor`` is None when there are no more results.
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_types: Sequence[type]) -> list[Any]:
+    """Decode a cursor back into a sort key with the given column types.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match
+            the expected key shape.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+    if (
+        not isinstance(key, list)
+        or len(key) != len(key_types)
+        or not all(type(value) is key_type for value, key_type in zip(key, key_types))
+    ):
+        raise InvalidCursorError("Invalid cursor")
+    return key
+
+
+def any_of(
+    column: ColumnElement[Any] | InstrumentedAttribute[Any],
+    values: Iterable[Any],
+    item_type: TypeEngine[Any],
+) -> ColumnElement[bool]:
+    """Build ``column = ANY(:values)`` with the values bound as one array.
+
+    Unlike ``IN``, the statement text and parameter count do not depend on
+    how many values there are.
+    """
+    return column == any_(bindparam(None, list(values), type_=ARRAY(item_type)))
+
+
+class DataclassInstance(Protocol):
+    """Any dataclass instance."""
+
+    __dataclass_fields__: ClassVar[dict[str, Any]]
+
+
+class RowMapper[T: DataclassInstance]:
+    """Maps column-select rows straight into a DTO dataclass.
+
+    Selecting ``mapper.columns`` instead of the ORM entity returns plain
+    rows with the DTO's fields in order, skipping identity-map registration
+    and attribute instrumentation. Converters wrap the raw value of a
+    column, e.g. to turn an integer into an enum.
+    """
+
+    def __init__(
+        self,
+        dto_class: type[T],
+        table: FromClause,
+        converters: dict[str, Callable[[Any], Any]] | None = None,
+    ) -> None:
+        names = [field.name for field in fields(dto_class)]
+        self.dto_class = dto_class
+        self.columns: list[KeyedColumnElement[Any]] = [table.c[name] for name in names]
+        self._converters = [
+            (names.index(name), converter)
+            for name, converter in (converters or {}).items()
+        ]
+
+    def __call__(self, row: Sequence[Any]) -> T:
+        """Build a DTO from one row."""
+        if not self._converters:
+            return self.dto_class(*row)
+        values = list(row)
+        for index, converter in self._converters:
+            values[index] = converter(values[index])
+        return self.dto_class(*values)
+
+    def all(self, rows: Iterable[Sequence[Any]]) -> list[T]:
+        """Build DTOs from every row."""
+        return [self(row) for row in rows]
 
 
 class BaseRepository:
@@ -6,3 +129,30 @@ class BaseRepository:
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
+
+    async def _get_table_version(self, table_name: str) -> int:
+        """Get the modification stamp of a table.
+
+        Triggers bump it on every write, so an unchanged version means the
+        table's rows are unchanged. Sums a handful of rows, one per backend
+        that has written to the table, found by primary key prefix.
+        """
+        stmt = select(
+            cast(func.coalesce(func.sum(TableVersionModel.version), 0), BigInteger)
+        ).where(TableVersionModel.table_name == table_name)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    @staticmethod
+    def _paginate[T](
+        items: list[T], limit: int | None, key: Callable[[T], Sequence[Any]]
+    ) -> Page[T]:
+        """Trim a ``limit + 1`` result down to a page with a next cursor.
+
+        Queries fetch one row more than the page size; if it comes back,
+        there is another page and the cursor points after the last item kept.
+        """
+        if limit is None or len(items) <= limit:
+            return Page(items=items)
+        items = items[:limit]
+        return Page(items=items, next_cursor=encode_cursor(key(items[-1])))
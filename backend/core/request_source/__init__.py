@@ -1,4 +1,13 @@
 from core.request_source.request_source import RequestSource
+from core.request_source.request_source_cache import (
+    CachedRequestSourceRepository,
+    request_source_cache,
+)
 from core.request_source.request_source_repo import RequestSourceRepository
 
-__all__ = ["RequestSource", "RequestSourceRepository"]
+__all__ = [
+    "CachedRequestSourceRepository",
+    "RequestSource",
+    "RequestSourceRepository",
+    "request_source_cache",
+]
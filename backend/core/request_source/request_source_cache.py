@@ -0,0 +1,70 @@
+import os
+from typing import Any, Sequence
+
+from core.cache import TTLCache
+from core.repository import Page
+from core.request_source.request_source import RequestSource
+from core.request_source.request_source_repo import RequestSourceRepository
+
+request_source_cache: TTLCache[tuple[Any, ...], Any] = TTLCache(
+    maxsize=int(os.getenv("REQUEST_SOURCE_CACHE_MAX_SIZE", "1000")),
+    ttl=float(os.getenv("REQUEST_SOURCE_CACHE_TTL_SECONDS", "300")),
+)
+
+
+class CachedRequestSourceRepository(RequestSourceRepository):
+    """RequestSourceRepository that serves reads from an in-process cache.
+
+    Request sources are reference data that rarely change. Anything that
+    writes to the request_source table must call ``invalidate``.
+    """
+
+    cache = request_source_cache
+
+    async def get_page(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> Page[RequestSource]:
+        """Load a page of request sources, from the cache when possible."""
+        key = ("page", limit, cursor)
+        page = self.cache.get(key)
+        if page is None:
+            page = await super().get_page(limit=limit, cursor=cursor)
+            self.cache.set(key, page)
+        return page
+
+    async def get_by_id(self, request_source_id: str) -> RequestSource | None:
+        """Get a request source by its ID, from the cache when possible."""
+        key = ("id", request_source_id)
+        request_source = self.cache.get(key)
+        if request_source is None:
+            request_source = await super().get_by_id(request_source_id)
+            if request_source is not None:
+                self.cache.set(key, request_source)
+        return request_source
+
+    async def get_by_ids(
+        self, request_source_ids: Sequence[str]
+    ) -> dict[str, RequestSource]:
+        """Get request sources by ID, querying only for the uncached ones."""
+        found: dict[str, RequestSource] = {}
+        missing = []
+        for request_source_id in set(request_source_ids):
+            request_source = self.cache.get(("id", request_source_id))
+            if request_source is None:
+                missing.append(request_source_id)
+            else:
+                found[request_source_id] = request_source
+        if missing:
+            loaded = await super().get_by_ids(missing)
+            for request_source_id, request_source in loaded.items():
+                self.cache.set(("id", request_source_id), request_source)
+            found.update(loaded)
+        return found
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop every cached request source after any of them was written.
+
+        Pages depend on every row, so there is nothing finer to invalidate.
+        """
+        cls.cache.clear()
@@ -1,6 +1,14 @@
-from sqlalchemy import select
+from typing import Sequence
 
-from core.repository import BaseRepository
+from sqlalchemy import String, select, tuple_
+
+from core.repository import (
+    BaseRepository,
+    Page,
+    RowMapper,
+    any_of,
+    decode_cursor,
+)
 from core.request_source.request_source import RequestSource
 from core.request_source.request_source_model import RequestSourceModel
 
@@ -8,32 +16,54 @@ from core.request_source.request_source_model import RequestSourceModel
 class RequestSourceRepository(BaseRepository):
     """Repository for request source data access."""
 
+    _mapper = RowMapper(RequestSource, RequestSourceModel.__table__)
+
     async def get_all(self) -> list[RequestSource]:
         """Load all request sources from the database."""
-        stmt = select(RequestSourceModel).order_by(RequestSourceModel.name)
-        result = await self.session.execute(stmt)
-        rows = result.scalars().all()
+        page = await self.get_page()
+        return page.items
+
+    async def get_page(
+        self, limit: int | None = None, cursor: str | None = None
+    ) -> Page[RequestSource]:
+        """Load a page of request sources ordered by name and id.
 
-        return [
-            RequestSource(
-                id=row.id,
-                name=row.name,
-            )
-            for row in rows
-        ]
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded.
+        """
+        sort_key = (RequestSourceModel.name, RequestSourceModel.id)
+        stmt = select(*self._mapper.columns).order_by(*sort_key)
+        if cursor is not None:
+            last_key = decode_cursor(cursor, (str, str))
+            stmt = stmt.where(tuple_(*sort_key) > tuple_(*last_key))
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        result = await self.session.execute(stmt)
+        items = self._mapper.all(result)
+        return self._paginate(items, limit, lambda rs: (rs.name, rs.id))
 
     async def get_by_id(self, request_source_id: str) -> RequestSource | None:
         """Get a request source by its ID."""
-        stmt = select(RequestSourceModel).where(
+        stmt = select(*self._mapper.columns).where(
             RequestSourceModel.id == request_source_id
         )
         result = await self.session.execute(stmt)
-        row = result.scalar_one_or_none()
+        row = result.one_or_none()
 
         if row is None:
             return None
 
-        return RequestSource(
-            id=row.id,
-            name=row.name,
+        return self._mapper(row)
+
+    async def get_by_ids(
+        self, request_source_ids: Sequence[str]
+    ) -> dict[str, RequestSource]:
+        """Get the request sources with the given IDs in one query, keyed by ID.
+
+        IDs that do not exist are missing from the result.
+        """
+        stmt = select(*self._mapper.columns).where(
+            any_of(RequestSourceModel.id, set(request_source_ids), String())
         )
+        result = await self.session.execute(stmt)
+        return {source.id: source for source in self._mapper.all(result)}
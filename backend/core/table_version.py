@@ -0,0 +1,19 @@
+from sqlalchemy import BigInteger, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class TableVersionModel(Base):
+    """SQLAlchemy model for the table_version table.
+
+    Database triggers bump a table's version on every write to it, on a
+    row per backend so that concurrent writers never contend for one row.
+    A table's version is the sum of its rows.
+    """
+
+    __tablename__ = "table_version"
+
+    table_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    backend_pid: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger)
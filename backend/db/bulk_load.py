@@ -0,0 +1,324 @@
+"""Bulk loading with COPY FROM STDIN.
+
+Rows are streamed into COPY one at a time, from JSON, NDJSON or CSV files
+or from the synthetic generators below, so loading never holds a whole
+dataset in memory (plain JSON arrays are the exception: they have to be
+parsed in one go, so use NDJSON or CSV for large files).
+
+Run with:
+    uv run python db/bulk_load.py --rows 1000000
+    uv run python db/bulk_load.py --from people.ndjson --table people
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+from array import array
+from bisect import bisect
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import psycopg
+
+# Add parent directory to path for imports when run directly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.data_request import Status
+from core.database import get_sync_connection
+
+REQUEST_SOURCE_COLUMNS = ("id", "name")
+PEOPLE_COLUMNS = ("id", "first_name", "last_name", "date_of_birth")
+DATA_REQUEST_COLUMNS = (
+    "id",
+    "person_id",
+    "first_name",
+    "last_name",
+    "date_of_birth",
+    "status",
+    "created_on",
+    "created_by",
+    "request_source_id",
+)
+
+
+def iter_records(path: Path) -> Iterator[dict[str, Any]]:
+    """Read records from a .json, .ndjson or .csv file.
+
+    Records use the same camelCase keys as the files in data/.
+    """
+    with open(path, newline="") as f:
+        if path.suffix == ".json":
+            yield from json.load(f)
+        elif path.suffix == ".ndjson":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif path.suffix == ".csv":
+            yield from csv.DictReader(f)
+        else:
+            raise ValueError(f"Unsupported file type: {path}")
+
+
+def request_source_row(record: dict[str, Any]) -> tuple[Any, ...]:
+    return (record["id"], record["name"])
+
+
+def person_row(record: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        record["id"],
+        record["firstName"],
+        record["lastName"],
+        record["dateOfBirth"],
+    )
+
+
+def data_request_row(record: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        record["id"],
+        record["personId"],
+        record["firstName"],
+        record["lastName"],
+        record["dateOfBirth"],
+        record["status"],
+        record["createdOn"],
+        record["createdBy"],
+        record["requestSourceId"],
+    )
+
+
+# Columns and record-to-row converters for each table that can be loaded
+TABLES: dict[
+    str, tuple[tuple[str, ...], Callable[[dict[str, Any]], tuple[Any, ...]]]
+] = {
+    "request_source": (REQUEST_SOURCE_COLUMNS, request_source_row),
+    "people": (PEOPLE_COLUMNS, person_row),
+    "data_request": (DATA_REQUEST_COLUMNS, data_request_row),
+}
+
+
+def copy_rows(
+    cur: psycopg.Cursor,
+    table: str,
+    columns: tuple[str, ...],
+    rows: Iterable[tuple[Any, ...]],
+) -> int:
+    """Stream rows into a table with COPY FROM STDIN and return the count."""
+    count = 0
+    column_list = ", ".join(columns)
+    with cur.copy(f"COPY {table} ({column_list}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+            count += 1
+    return count
+
+
+def reset_sequences(cur: psycopg.Cursor) -> None:
+    """Move the id sequences past the ids that were loaded explicitly."""
+    for table in ("people", "data_request"):
+        cur.execute(
+            f"SELECT setval('{table}_id_seq', "
+            f"(SELECT COALESCE(MAX(id), 0) + 1 FROM {table}), false)"
+        )
+
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael",
+    "Linda", "David", "Elizabeth", "William", "Barbara", "Richard", "Susan",
+    "Joseph", "Jessica", "Thomas", "Sarah", "Carlos", "Maria", "Wei", "Aisha",
+]  # fmt: skip
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
+    "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Wilson",
+    "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee",
+    "Nguyen", "Chen", "Patel", "Kim", "O'Brien", "Schmidt",
+]  # fmt: skip
+CREATORS = [f"user{i}@example.com" for i in range(1, 21)]
+
+# Most requests are done; a minority are still in flight or need review.
+STATUS_WEIGHTS = {
+    Status.COMPLETE: 0.55,
+    Status.PROCESSING: 0.20,
+    Status.NEEDS_REVIEW: 0.15,
+    Status.CREATED: 0.10,
+}
+
+
+class SyntheticPeople:
+    """Randomly generated people, stored compactly.
+
+    Names are kept as indexes into the name lists and birth dates as
+    ordinals, so millions of people fit in a few bytes each while data
+    requests that copy their details are generated.
+    """
+
+    def __init__(self, count: int, start_id: int, rng: random.Random) -> None:
+        earliest = date(1940, 1, 1).toordinal()
+        latest = date(2005, 12, 31).toordinal()
+        self.start_id = start_id
+        self.first_names = array(
+            "B", (rng.randrange(len(FIRST_NAMES)) for _ in range(count))
+        )
+        self.last_names = array(
+            "B", (rng.randrange(len(LAST_NAMES)) for _ in range(count))
+        )
+        self.birth_dates = array(
+            "I", (rng.randint(earliest, latest) for _ in range(count))
+        )
+
+    def __len__(self) -> int:
+        return len(self.birth_dates)
+
+    def __getitem__(self, index: int) -> tuple[Any, ...]:
+        return (
+            self.start_id + index,
+            FIRST_NAMES[self.first_names[index]],
+            LAST_NAMES[self.last_names[index]],
+            date.fromordinal(self.birth_dates[index]),
+        )
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        return (self[index] for index in range(len(self)))
+
+
+def generate_data_requests(
+    count: int,
+    start_id: int,
+    people: SyntheticPeople,
+    request_source_ids: list[str],
+    rng: random.Random,
+) -> Iterator[tuple[Any, ...]]:
+    """Generate data requests with a realistic mix of people, sources and status.
+
+    A few people and sources account for most requests, as they do in
+    production, and created_on increases with the id over the last two years.
+    """
+    statuses = [int(status) for status in STATUS_WEIGHTS]
+    status_weights = list(accumulate(STATUS_WEIGHTS.values()))
+    source_weights = list(
+        accumulate(1 / rank for rank in range(1, len(request_source_ids) + 1))
+    )
+    created_on = datetime.now() - timedelta(days=730)
+    step = timedelta(days=730) / max(count, 1)
+    # Draw from cumulative weights directly; rng.choices rebuilds them per call.
+    status_total = status_weights[-1]
+    source_total = source_weights[-1]
+    random_ = rng.random
+    for request_id in range(start_id, start_id + count):
+        person = people[int(len(people) * random_() ** 2)]
+        yield (
+            request_id,
+            *person,
+            statuses[bisect(status_weights, random_() * status_total)],
+            created_on,
+            CREATORS[int(random_() * len(CREATORS))],
+            request_source_ids[bisect(source_weights, random_() * source_total)],
+        )
+        created_on += step
+
+
+def next_id(cur: psycopg.Cursor, table: str) -> int:
+    """Return the id after the highest one in a table."""
+    row = cur.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}").fetchone()
+    assert row is not None
+    return row[0]
+
+
+def load_file(conn: psycopg.Connection, table: str, path: Path) -> int:
+    """Append the records in a file to a table and return how many were loaded."""
+    columns, to_row = TABLES[table]
+    with conn.cursor() as cur:
+        count = copy_rows(cur, table, columns, map(to_row, iter_records(path)))
+        reset_sequences(cur)
+    conn.commit()
+    return count
+
+
+def load_synthetic(
+    conn: psycopg.Connection,
+    rows: int,
+    people: int | None = None,
+    seed: int = 0,
+) -> tuple[int, int]:
+    """Append ``rows`` synthetic data requests and their people.
+
+    Uses the request sources already in the database. Defaults to one new
+    person per five data requests. Returns (people, data requests) loaded.
+    """
+    people = max(rows // 5, 1) if people is None else people
+    rng = random.Random(seed)
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT id FROM request_source ORDER BY id")
+        request_source_ids = [row[0] for row in cur.fetchall()]
+        if not request_source_ids:
+            raise ValueError("Load request sources before synthetic data requests")
+        first_person_id = next_id(cur, "people")
+        first_request_id = next_id(cur, "data_request")
+
+        synthetic_people = SyntheticPeople(people, first_person_id, rng)
+        copy_rows(cur, "people", PEOPLE_COLUMNS, synthetic_people.rows())
+        copy_rows(
+            cur,
+            "data_request",
+            DATA_REQUEST_COLUMNS,
+            generate_data_requests(
+                rows, first_request_id, synthetic_people, request_source_ids, rng
+            ),
+        )
+        reset_sequences(cur)
+    conn.commit()
+    return people, rows
+
+
+def run_load(
+    rows: int | None = None,
+    people: int | None = None,
+    seed: int = 0,
+    path: Path | None = None,
+    table: str = "data_request",
+) -> None:
+    """Load synthetic rows, or the records in ``path``, and report the time taken."""
+    start = time.perf_counter()
+    with get_sync_connection() as conn:
+        if path is not None:
+            count = load_file(conn, table, path)
+            loaded = f"{count} {table} rows from {path}"
+        else:
+            people, rows = load_synthetic(conn, rows or 0, people, seed)
+            loaded = f"{people} people and {rows} data requests"
+    elapsed = time.perf_counter() - start
+    print(f"Loaded {loaded} in {elapsed:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk load data with COPY")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--rows", type=int, help="Number of data requests to generate")
+    source.add_argument(
+        "--from",
+        dest="path",
+        type=Path,
+        help="Load records from a .json, .ndjson or .csv file instead",
+    )
+    parser.add_argument(
+        "--table",
+        choices=TABLES,
+        default="data_request",
+        help="Table to load --from into (default: data_request)",
+    )
+    parser.add_argument(
+        "--people", type=int, help="Number of people to generate (default: rows / 5)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    run_load(args.rows, args.people, args.seed, args.path, args.table)
+
+
+if __name__ == "__main__":
+    main()
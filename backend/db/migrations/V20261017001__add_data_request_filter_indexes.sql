@@ -0,0 +1,7 @@
+-- Indexes backing the data request list filters
+
+-- Create index on created_by for filtering by creator
+CREATE INDEX idx_data_request_created_by ON data_request(created_by);
+
+-- Create index on created_on for date range filtering
+CREATE INDEX idx_data_request_created_on ON data_request(created_on);
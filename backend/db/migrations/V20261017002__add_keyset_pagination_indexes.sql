@@ -0,0 +1,7 @@
+-- Indexes matching the keyset pagination sort orders
+
+-- People are listed by last name, first name, then id
+CREATE INDEX idx_people_name ON people(last_name, first_name, id);
+
+-- Request sources are listed by name, then id
+CREATE INDEX idx_request_source_name ON request_source(name, id);
@@ -0,0 +1,31 @@
+-- Per-table modification stamps for cheap change detection (ETags)
+-- A statement-level trigger bumps the version of a table on every write,
+-- in the same transaction, so readers never see a version ahead of the data.
+
+CREATE TABLE table_version (
+    table_name VARCHAR(100) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO table_version (table_name)
+VALUES ('data_request'), ('people'), ('request_source');
+
+CREATE FUNCTION bump_table_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE table_version SET version = version + 1
+    WHERE table_name = TG_TABLE_NAME;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_data_request_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON data_request
+FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER trg_people_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON people
+FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+CREATE TRIGGER trg_request_source_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON request_source
+FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
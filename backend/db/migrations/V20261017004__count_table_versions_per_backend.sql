@@ -0,0 +1,42 @@
+-- Count table writes per backend instead of on one shared row
+-- Bumping a single table_version row held its row lock until commit, so
+-- every concurrent writer of a table queued behind the others, and
+-- transactions writing two tables in opposite orders could deadlock.
+-- Each backend now bumps its own row, which no other transaction writes,
+-- and a table's version is the sum of its rows: it still grows with every
+-- committed write statement, in whatever order transactions commit.
+
+ALTER TABLE table_version DROP CONSTRAINT table_version_pkey;
+ALTER TABLE table_version ADD COLUMN backend_pid INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE table_version ADD PRIMARY KEY (table_name, backend_pid);
+
+CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO table_version (table_name, backend_pid, version)
+    VALUES (TG_TABLE_NAME, pg_backend_pid(), 1)
+    ON CONFLICT (table_name, backend_pid)
+    DO UPDATE SET version = table_version.version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Fold the rows of backends that have exited into the backend_pid 0 row,
+-- keeping each table's sum unchanged. Run periodically to bound the table.
+CREATE FUNCTION compact_table_version() RETURNS void AS $$
+BEGIN
+    WITH exited AS (
+        DELETE FROM table_version
+        WHERE backend_pid <> 0
+          AND backend_pid NOT IN (SELECT pid FROM pg_stat_activity)
+        RETURNING table_name, version
+    )
+    UPDATE table_version t
+    SET version = t.version + totals.version
+    FROM (
+        SELECT table_name, SUM(version) AS version
+        FROM exited
+        GROUP BY table_name
+    ) totals
+    WHERE t.table_name = totals.table_name AND t.backend_pid = 0;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,95 @@
+-- Data request counts by status and request source, for dashboard summaries
+-- Statement-level triggers keep the counts up to date in the writing
+-- transaction, from the rows each statement inserted, updated or deleted,
+-- so COPY and multi-row statements cost one counter update per group.
+-- As with table_version, each backend counts on its own rows, so concurrent
+-- writers never wait on each other; a group's count is the sum of its rows.
+
+CREATE TABLE data_request_count (
+    status INTEGER NOT NULL,
+    request_source_id VARCHAR(100) NOT NULL,
+    backend_pid INTEGER NOT NULL DEFAULT 0,
+    count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (status, request_source_id, backend_pid)
+);
+
+-- Each branch only reads the transition tables its trigger defines; PL/pgSQL
+-- plans a statement when it first runs, so the other branches never fail.
+CREATE FUNCTION count_data_requests() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO data_request_count AS c
+            (status, request_source_id, backend_pid, count)
+        SELECT status, request_source_id, pg_backend_pid(), COUNT(*)
+        FROM new_rows
+        GROUP BY status, request_source_id
+        ON CONFLICT (status, request_source_id, backend_pid)
+        DO UPDATE SET count = c.count + EXCLUDED.count;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO data_request_count AS c
+            (status, request_source_id, backend_pid, count)
+        SELECT status, request_source_id, pg_backend_pid(), -COUNT(*)
+        FROM old_rows
+        GROUP BY status, request_source_id
+        ON CONFLICT (status, request_source_id, backend_pid)
+        DO UPDATE SET count = c.count + EXCLUDED.count;
+    ELSE
+        INSERT INTO data_request_count AS c
+            (status, request_source_id, backend_pid, count)
+        SELECT status, request_source_id, pg_backend_pid(), SUM(delta)
+        FROM (
+            SELECT status, request_source_id, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT status, request_source_id, -1 AS delta FROM old_rows
+        ) changes
+        GROUP BY status, request_source_id
+        HAVING SUM(delta) <> 0
+        ON CONFLICT (status, request_source_id, backend_pid)
+        DO UPDATE SET count = c.count + EXCLUDED.count;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables allow one event per trigger
+CREATE TRIGGER trg_data_request_count_insert
+AFTER INSERT ON data_request
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION count_data_requests();
+
+CREATE TRIGGER trg_data_request_count_update
+AFTER UPDATE ON data_request
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION count_data_requests();
+
+CREATE TRIGGER trg_data_request_count_delete
+AFTER DELETE ON data_request
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION count_data_requests();
+
+CREATE FUNCTION clear_data_request_count() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM data_request_count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_data_request_count_truncate
+AFTER TRUNCATE ON data_request
+FOR EACH STATEMENT EXECUTE FUNCTION clear_data_request_count();
+
+-- Rebuild the counts from data_request, on one row per group. Writers to
+-- data_request wait until the calling transaction ends, so run it off-peak.
+-- Besides repairing drift it folds away the rows of past backends.
+CREATE FUNCTION reconcile_data_request_count() RETURNS void AS $$
+BEGIN
+    LOCK TABLE data_request IN SHARE MODE;
+    DELETE FROM data_request_count;
+    INSERT INTO data_request_count (status, request_source_id, count)
+    SELECT status, request_source_id, COUNT(*)
+    FROM data_request
+    GROUP BY status, request_source_id;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT reconcile_data_request_count();
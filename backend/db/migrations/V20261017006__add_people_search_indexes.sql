@@ -0,0 +1,23 @@
+-- Indexes for the people search typeahead, which matches the words of a
+-- query against the start of either name, then by trigram similarity,
+-- ignoring case
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Prefix matches, read in name order so a search stops after a page of
+-- rows. The C collation lets LIKE 'abc%' use them whatever the database's.
+CREATE INDEX idx_people_last_name_prefix ON people (
+    (lower(last_name) COLLATE "C"), (lower(first_name) COLLATE "C"), id
+);
+CREATE INDEX idx_people_first_name_prefix ON people (
+    (lower(first_name) COLLATE "C"), (lower(last_name) COLLATE "C"), id
+);
+
+-- Similar names, with pg_trgm's % operator
+CREATE INDEX idx_people_last_name_trgm
+    ON people USING gin (lower(last_name) gin_trgm_ops);
+CREATE INDEX idx_people_first_name_trgm
+    ON people USING gin (lower(first_name) gin_trgm_ops);
+
+-- Narrowing a search down by date of birth
+CREATE INDEX idx_people_date_of_birth ON people (date_of_birth);
@@ -0,0 +1,64 @@
+-- Publish data request changes on the data_request_changes channel, for
+-- the API's change feed. Each changed row is sent as
+-- {"op": ..., "data_request": row, "previous": old row of an update}.
+-- Notifications are delivered when the writing transaction commits, and
+-- not at all if it rolls back.
+--
+-- A statement that changes more than 1000 rows, such as a bulk load, sends
+-- {"op": ..., "count": n} instead, so that it does not flood the
+-- notification queue; listeners re-read the data requests to catch up.
+
+-- Like count_data_requests(), each branch only reads the transition tables
+-- its trigger defines
+CREATE FUNCTION notify_data_request_changes() RETURNS trigger AS $$
+DECLARE
+    changed BIGINT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        SELECT COUNT(*) INTO changed FROM old_rows;
+    ELSE
+        SELECT COUNT(*) INTO changed FROM new_rows;
+    END IF;
+
+    IF changed > 1000 THEN
+        PERFORM pg_notify(
+            'data_request_changes',
+            json_build_object('op', lower(TG_OP), 'count', changed)::text
+        );
+    ELSIF TG_OP = 'INSERT' THEN
+        PERFORM pg_notify(
+            'data_request_changes',
+            json_build_object('op', 'insert', 'data_request', n)::text
+        )
+        FROM new_rows n;
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify(
+            'data_request_changes',
+            json_build_object('op', 'delete', 'data_request', o)::text
+        )
+        FROM old_rows o;
+    ELSE
+        PERFORM pg_notify(
+            'data_request_changes',
+            json_build_object('op', 'update', 'data_request', n, 'previous', o)::text
+        )
+        FROM new_rows n JOIN old_rows o USING (id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_data_request_notify_insert
+AFTER INSERT ON data_request
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_data_request_changes();
+
+CREATE TRIGGER trg_data_request_notify_update
+AFTER UPDATE ON data_request
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_data_request_changes();
+
+CREATE TRIGGER trg_data_request_notify_delete
+AFTER DELETE ON data_request
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION notify_data_request_changes();
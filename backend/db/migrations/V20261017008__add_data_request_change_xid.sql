@@ -0,0 +1,26 @@
+-- Record which transaction last inserted or updated each data request, for
+-- incremental sync. A sync token is the snapshot of the previous sync; the
+-- rows changed since are those whose transaction that snapshot could not
+-- see, which an index range from the snapshot's xmin finds. Transaction IDs
+-- are assigned in order but commit out of order, so comparing against the
+-- snapshot, not a single high-water number, is what makes sure a long
+-- transaction's rows are not skipped.
+--
+-- Rows that existed before this migration are NULL: every sync token is
+-- newer than them. Deletes are not recorded.
+
+ALTER TABLE data_request ADD COLUMN change_xid XID8;
+ALTER TABLE data_request ALTER COLUMN change_xid SET DEFAULT pg_current_xact_id();
+
+CREATE FUNCTION set_data_request_change_xid() RETURNS trigger AS $$
+BEGIN
+    NEW.change_xid := pg_current_xact_id();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_data_request_change_xid
+BEFORE UPDATE ON data_request
+FOR EACH ROW EXECUTE FUNCTION set_data_request_change_xid();
+
+CREATE INDEX idx_data_request_change_xid ON data_request (change_xid);
@@ -0,0 +1,50 @@
+-- Leases of data requests claimed by the background workers
+-- A worker claims PROCESSING requests by taking a lease on them until
+-- process_after; nobody else claims a request while its lease runs, and a
+-- request whose worker died is claimed again once it expires. A failed
+-- attempt sets process_after to when the request may be retried. Leases
+-- live apart from data_request so that claiming a request does not count
+-- as changing it: no notification, no version bump, no sync token change.
+
+CREATE TABLE data_request_lease (
+    data_request_id INTEGER PRIMARY KEY
+        REFERENCES data_request(id) ON DELETE CASCADE,
+    attempts INTEGER NOT NULL,
+    process_after TIMESTAMPTZ NOT NULL
+);
+
+-- Workers look for the PROCESSING requests of one source, oldest first
+CREATE INDEX idx_data_request_processing
+ON data_request (request_source_id, id)
+WHERE status = 2;
+
+-- Claim up to max_count PROCESSING requests of a source, oldest first, by
+-- leasing them for lease, and return them with their attempt numbers.
+-- Candidates are locked with SKIP LOCKED so concurrent claims pass over
+-- each other instead of waiting. A candidate can still be one another
+-- worker has just claimed and committed, as only locking, not changing, the
+-- row does not make a waiting claim look at it again; the upsert takes over
+-- a lease only once it has expired, so such a row is left out.
+CREATE FUNCTION claim_data_requests(
+    claim_request_source_id VARCHAR, max_count INTEGER, lease INTERVAL
+) RETURNS TABLE (data_request_id INTEGER, attempts INTEGER) AS $$
+    WITH candidates AS (
+        SELECT dr.id
+        FROM data_request dr
+        WHERE dr.status = 2
+          AND dr.request_source_id = claim_request_source_id
+          AND NOT EXISTS (
+              SELECT 1 FROM data_request_lease l
+              WHERE l.data_request_id = dr.id AND l.process_after > now()
+          )
+        ORDER BY dr.id
+        LIMIT max_count
+        FOR UPDATE OF dr SKIP LOCKED
+    )
+    INSERT INTO data_request_lease AS l (data_request_id, attempts, process_after)
+    SELECT id, 1, now() + lease FROM candidates
+    ON CONFLICT (data_request_id) DO UPDATE
+    SET attempts = l.attempts + 1, process_after = EXCLUDED.process_after
+    WHERE l.process_after <= now()
+    RETURNING l.data_request_id, l.attempts;
+$$ LANGUAGE sql;
@@ -0,0 +1,41 @@
+-- Tell the claims of a data request apart
+-- A worker writes its result back only while its claim still holds the
+-- lease. The attempt number cannot tell claims apart once a status change
+-- drops a request's lease and a new claim starts again from attempt 1, so
+-- each claim now draws a claim_id, which the worker hands back with its
+-- results.
+
+CREATE SEQUENCE data_request_claim_id_seq;
+
+ALTER TABLE data_request_lease
+ADD COLUMN claim_id BIGINT NOT NULL DEFAULT nextval('data_request_claim_id_seq');
+
+DROP FUNCTION claim_data_requests(VARCHAR, INTEGER, INTERVAL);
+
+-- As before, but also returning the claim_id of each claim; taking over an
+-- expired lease draws a new one
+CREATE FUNCTION claim_data_requests(
+    claim_request_source_id VARCHAR, max_count INTEGER, lease INTERVAL
+) RETURNS TABLE (data_request_id INTEGER, attempts INTEGER, claim_id BIGINT) AS $$
+    WITH candidates AS (
+        SELECT dr.id
+        FROM data_request dr
+        WHERE dr.status = 2
+          AND dr.request_source_id = claim_request_source_id
+          AND NOT EXISTS (
+              SELECT 1 FROM data_request_lease l
+              WHERE l.data_request_id = dr.id AND l.process_after > now()
+          )
+        ORDER BY dr.id
+        LIMIT max_count
+        FOR UPDATE OF dr SKIP LOCKED
+    )
+    INSERT INTO data_request_lease AS l (data_request_id, attempts, process_after)
+    SELECT id, 1, now() + lease FROM candidates
+    ON CONFLICT (data_request_id) DO UPDATE
+    SET attempts = l.attempts + 1,
+        process_after = EXCLUDED.process_after,
+        claim_id = EXCLUDED.claim_id
+    WHERE l.process_after <= now()
+    RETURNING l.data_request_id, l.attempts, l.claim_id;
+$$ LANGUAGE sql;
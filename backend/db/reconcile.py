@@ -0,0 +1,37 @@
+"""Rebuild the data request counts and compact the table version rows.
+
+Both tables are kept up to date by triggers, on a row per backend. This
+recounts data_request_count from data_request, repairing any drift, and
+folds the rows of backends that have exited, so neither table grows with
+connection churn. Writers to data_request wait while it is recounted, so
+run it off-peak; the deployment runs it nightly from a systemd timer.
+
+Run with: uv run python db/reconcile.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports when run directly
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.database import get_sync_connection
+
+
+def reconcile() -> None:
+    with get_sync_connection() as conn:
+        start = time.perf_counter()
+        conn.execute("SELECT reconcile_data_request_count()")
+        conn.commit()
+        recounted = time.perf_counter()
+        conn.execute("SELECT compact_table_version()")
+        conn.commit()
+        compacted = time.perf_counter()
+
+    print(f"Recounted data requests in {recounted - start:.2f}s")
+    print(f"Compacted table versions in {compacted - recounted:.2f}s")
+
+
+if __name__ == "__main__":
+    reconcile()
@@ -1,4 +1,3 @@
-import json
 import os
 import sys
 from pathlib import Path
@@ -10,6 +9,17 @@ from pwdlib import PasswordHash
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.database import get_sync_connection
+from db.bulk_load import (
+    DATA_REQUEST_COLUMNS,
+    PEOPLE_COLUMNS,
+    REQUEST_SOURCE_COLUMNS,
+    copy_rows,
+    data_request_row,
+    iter_records,
+    person_row,
+    request_source_row,
+    reset_sequences,
+)
 
 load_dotenv()
 
@@ -43,71 +53,36 @@ def seed_database():
                 ("demo@example.com", hashed_password, True, False, True),
             )
 
-            # Load and insert request_sources
-            with open(data_dir / "request_sources.json") as f:
-                request_sources = json.load(f)
-
-            for source in request_sources:
-                cur.execute(
-                    "INSERT INTO request_source (id, name) VALUES (%s, %s)",
-                    (source["id"], source["name"]),
-                )
-
-            # Load and insert people
-            with open(data_dir / "people.json") as f:
-                people = json.load(f)
-
-            for person in people:
-                cur.execute(
-                    """
-                    INSERT INTO people (id, first_name, last_name, date_of_birth)
-                    VALUES (%s, %s, %s, %s)
-                    """,
-                    (
-                        person["id"],
-                        person["firstName"],
-                        person["lastName"],
-                        person["dateOfBirth"],
-                    ),
-                )
-
-            # Reset the people sequence
-            cur.execute("SELECT setval('people_id_seq', (SELECT MAX(id) FROM people))")
-
-            # Load and insert data_requests
-            with open(data_dir / "data_requests.json") as f:
-                data_requests = json.load(f)
-
-            for request in data_requests:
-                cur.execute(
-                    """
-                    INSERT INTO data_request
-                    (id, person_id, first_name, last_name, date_of_birth, status, created_on, created_by, request_source_id)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        request["id"],
-                        request["personId"],
-                        request["firstName"],
-                        request["lastName"],
-                        request["dateOfBirth"],
-                        request["status"],
-                        request["createdOn"],
-                        request["createdBy"],
-                        request["requestSourceId"],
-                    ),
-                )
-
-            # Reset the sequence to continue from the max id
-            cur.execute(
-                "SELECT setval('data_request_id_seq', (SELECT MAX(id) FROM data_request))"
+            # Stream request_sources, people and data_requests in with COPY
+            request_source_count = copy_rows(
+                cur,
+                "request_source",
+                REQUEST_SOURCE_COLUMNS,
+                map(
+                    request_source_row, iter_records(data_dir / "request_sources.json")
+                ),
+            )
+            people_count = copy_rows(
+                cur,
+                "people",
+                PEOPLE_COLUMNS,
+                map(person_row, iter_records(data_dir / "people.json")),
             )
+            data_request_count = copy_rows(
+                cur,
+                "data_request",
+                DATA_REQUEST_COLUMNS,
+                map(data_request_row, iter_records(data_dir / "data_requests.json")),
+            )
+
+            # Reset the sequences to continue from the max ids
+            reset_sequences(cur)
 
         conn.commit()
         print("Seeded 1 demo user (demo@example.com)")
-        print(f"Seeded {len(request_sources)} request sources")
-        print(f"Seeded {len(people)} people")
-        print(f"Seeded {len(data_requests)} data requests")
+        print(f"Seeded {request_source_count} request sources")
+        print(f"Seeded {people_count} people")
+        print(f"Seeded {data_request_count} data requests")
 
 
 if __name__ == "__main__":
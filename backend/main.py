@@ -1,10 +1,14 @@
+import asyncio
 import os
-from dataclasses import asdict
-from typing import Any
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from ipaddress import ip_address, ip_network
+from typing import Any, AsyncIterator, Self
 
-from fastapi import Depends, FastAPI, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field, model_validator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.auth import (
@@ -16,13 +20,40 @@ from core.auth import (
     fastapi_users,
 )
 from core.data_request import (
+    BulkCreateResult,
+    DataRequest,
+    DataRequestFilter,
     DataRequestRepository,
     DataRequestService,
+    DataRequestSummary,
+    ExportFormat,
+    InvalidStatusChangeError,
+    InvalidSyncTokenError,
+    NewDataRequest,
     PersonNotFoundError,
+    Status,
+    StatusChangeResult,
+    change_feed,
+    encode_event,
+    encode_export,
 )
-from core.database import get_async_session
-from core.person import PersonRepository
-from core.request_source import RequestSourceRepository
+from core.database import (
+    PoolStats,
+    dispose_database,
+    get_async_session,
+    get_database,
+    get_pool_stats,
+    on_engine_created,
+    open_session,
+)
+from core.etag import etag_matches, make_etag
+from core.instrumentation import MetricsMiddleware, instrument_engine
+from core.metrics import registry
+from core.query_log import QueryLogMiddleware, log_queries, query_log_enabled
+from core.person import CachedPersonRepository, Person, PersonRepository
+from core.repository import InvalidCursorError, Page
+from core.request_source import CachedRequestSourceRepository, RequestSource
+from core.serialization import dump_json
 
 
 class CreateDataRequestBody(BaseModel):
@@ -30,7 +61,55 @@ class CreateDataRequestBody(BaseModel):
     request_source_id: str
 
 
-app = FastAPI()
+class BulkCreateDataRequestsBody(BaseModel):
+    items: list[CreateDataRequestBody] = Field(max_length=10000)
+
+
+class ChangeDataRequestStatusBody(BaseModel):
+    status: Status
+    ids: list[int] | None = Field(None, max_length=10000)
+    filters: DataRequestFilter | None = None
+
+    @model_validator(mode="after")
+    def check_selection(self) -> Self:
+        if (self.ids is None) == (self.filters is None):
+            raise ValueError("Pass either ids or filters")
+        if self.filters == DataRequestFilter():
+            raise ValueError("Filters must set at least one field")
+        return self
+
+
+MAX_PAGE_SIZE = 1000
+MAX_SEARCH_RESULTS = 100
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+SYNC_TOKEN_HEADER = "X-Sync-Token"
+EXPORT_CHUNK_SIZE = 1000
+
+# Idle change feed streams send a comment this often, so that proxies and
+# clients can tell them from dead connections
+CHANGE_FEED_KEEPALIVE_SECONDS = float(os.getenv("CHANGE_FEED_KEEPALIVE", "15"))
+
+# Clients allowed to read /metrics and /internal/pool, which take no login:
+# comma-separated addresses or networks, loopback only by default
+INTERNAL_ALLOWED_NETWORKS = [
+    ip_network(network.strip())
+    for network in os.getenv("INTERNAL_ALLOWED_NETWORKS", "127.0.0.1/32,::1/128").split(
+        ","
+    )
+    if network.strip()
+]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the engines before the first request and close them on shutdown."""
+    get_database()
+    yield
+    await change_feed.close()
+    await dispose_database()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Parse CORS origins from environment variable (comma-separated)
 cors_origins_env = os.getenv("CORS_ORIGINS", "http://localhost:5173")
@@ -42,7 +121,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", NEXT_CURSOR_HEADER, SYNC_TOKEN_HEADER],
 )
+app.add_middleware(MetricsMiddleware)
+if query_log_enabled():
+    app.add_middleware(QueryLogMiddleware)
+    on_engine_created(lambda engine, name: log_queries(engine))
+on_engine_created(instrument_engine)
 
 # Auth routers
 app.include_router(
@@ -57,33 +142,263 @@ app.include_router(
 )
 
 
+def dto_response(content: Any, content_type: Any) -> Response:
+    """Build a JSON response from DTOs, serialized in a single pass.
+
+    Returning a Response directly skips FastAPI's response validation and
+    re-encoding; the route's response_model still documents the shape.
+    """
+    return Response(dump_json(content, content_type), media_type="application/json")
+
+
+def page_response(page: Page[Any], item_type: type) -> Response:
+    """Build a JSON list response from a page, with its next cursor header."""
+    response = dto_response(page.items, list[item_type])  # type: ignore[valid-type]
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
+
+
+def set_etag(response: Response, etag: str) -> Response:
+    """Tag a response so clients revalidate it with If-None-Match."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Build a 304 response if the client already has this ETag."""
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return set_etag(Response(status_code=304), etag)
+    return None
+
+
 @app.get("/")
 def read_root() -> dict[str, str]:
     return {"Hello": "World"}
 
 
-@app.get("/api/v1/data-requests")
-async def get_data_requests(
+def require_internal_client(request: Request) -> None:
+    """Dependency refusing clients outside INTERNAL_ALLOWED_NETWORKS."""
+    try:
+        address = ip_address(request.client.host if request.client else "")
+    except ValueError:
+        address = None
+    if address is not None and address.version == 6 and address.ipv4_mapped:
+        address = address.ipv4_mapped
+    if address is None or not any(
+        address in network for network in INTERNAL_ALLOWED_NETWORKS
+    ):
+        raise HTTPException(status_code=403, detail="Not allowed from this address")
+
+
+@app.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_client)],
+)
+def get_metrics() -> PlainTextResponse:
+    """Metrics for this process, in the Prometheus text exposition format."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get(
+    "/internal/pool",
+    response_model=PoolStats,
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_client)],
+)
+def get_pool() -> Response:
+    """Connection pool usage, for sizing DB_POOL_SIZE and DB_MAX_OVERFLOW."""
+    return dto_response(get_pool_stats(get_database().engine), PoolStats)
+
+
+def data_request_filter(
     status: int | None = Query(None),
+    status_in: list[int] | None = Query(None),
+    request_source_id: str | None = Query(None),
+    person_id: int | None = Query(None),
+    created_by: str | None = Query(None),
+    created_from: datetime | None = Query(None),
+    created_to: datetime | None = Query(None),
+) -> DataRequestFilter:
+    """Dependency for reading data request filters from the query string."""
+    return DataRequestFilter(
+        status=status,
+        status_in=status_in,
+        request_source_id=request_source_id,
+        person_id=person_id,
+        created_by=created_by,
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+
+@app.get("/api/v1/data-requests", response_model=list[DataRequest])
+async def get_data_requests(
+    request: Request,
+    filters: DataRequestFilter = Depends(data_request_filter),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+    since: str | None = Query(None),
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
-) -> list[dict[str, Any]]:
-    """Get all data requests, optionally filtered by status."""
+) -> Response:
+    """Get data requests, optionally filtered and paginated.
+
+    Filters are combined with AND and applied in the database query.
+    Pass ``limit`` to page through the results; the cursor for the next
+    page is returned in the X-Next-Cursor header.
+
+    Pass ``since`` to sync incrementally: the first page of a listing with
+    ``since`` returns a token in the X-Sync-Token header, and passing that
+    token as ``since`` later lists only the data requests inserted or
+    updated after it was issued. Start with an empty ``since`` to list
+    everything and get the first token.
+
+    Responses carry an ETag derived from the table's version stamp; a
+    matching If-None-Match gets a 304 without any rows being loaded.
+    """
     repo = DataRequestRepository(session)
-    data_requests = await repo.get_all()
-    if status is not None:
-        data_requests = [dr for dr in data_requests if dr.status == status]
-    return [asdict(dr) for dr in data_requests]
+    etag = make_etag("data-requests", await repo.get_version(), request.url.query)
+    if (response := not_modified(request, etag)) is not None:
+        return response
+
+    sync_token = None
+    if since is not None and cursor is None:
+        # Taken before the rows are read, so that a change committed in
+        # between is listed again next time rather than missed
+        sync_token = await repo.get_sync_token()
+    try:
+        page = await repo.find(filters, limit=limit, cursor=cursor, since=since or None)
+    except (InvalidCursorError, InvalidSyncTokenError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response = set_etag(page_response(page, DataRequest), etag)
+    if sync_token is not None:
+        response.headers[SYNC_TOKEN_HEADER] = sync_token
+    return response
+
+
+@app.get("/api/v1/data-requests/summary", response_model=DataRequestSummary)
+async def get_data_request_summary(
+    request: Request,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    """Count data requests by status and by request source.
+
+    Served from counters that database triggers keep up to date, so it
+    costs the same however many data requests there are.
+    """
+    repo = DataRequestRepository(session)
+    etag = make_etag("data-request-summary", await repo.get_version())
+    if (response := not_modified(request, etag)) is not None:
+        return response
+
+    summary = await repo.get_summary()
+    return set_etag(dto_response(summary, DataRequestSummary), etag)
 
 
-@app.post("/api/v1/data-requests")
+async def release_session(session: AsyncSession) -> None:
+    """Return the request session's connection before a streaming response.
+
+    The session, shared with authentication, is only closed by its
+    dependency once the response has been sent; a stream would keep its
+    connection checked out, idle in a transaction, for as long as it runs.
+    """
+    await session.close()
+
+
+async def stream_data_request_export(
+    filters: DataRequestFilter, export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """Stream an export from its own session, open for as long as it runs."""
+    async with open_session(read_only=True) as session:
+        repo = DataRequestRepository(session)
+        chunks = repo.stream(filters, chunk_size=EXPORT_CHUNK_SIZE)
+        async for chunk in encode_export(chunks, export_format):
+            yield chunk
+
+
+@app.get("/api/v1/data-requests/export")
+async def export_data_requests(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    filters: DataRequestFilter = Depends(data_request_filter),
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> StreamingResponse:
+    """Export data requests as NDJSON or CSV, optionally filtered.
+
+    Rows are streamed from a server-side cursor, so the response starts
+    immediately and memory use does not grow with the export size.
+    """
+    await release_session(session)
+    return StreamingResponse(
+        stream_data_request_export(filters, format),
+        media_type=format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="data-requests.{format}"'
+        },
+    )
+
+
+async def stream_data_request_changes(
+    filters: DataRequestFilter,
+) -> AsyncIterator[bytes]:
+    """Stream the changes matching the filters until the client disconnects.
+
+    Idle streams get a keepalive comment every CHANGE_FEED_KEEPALIVE seconds.
+    """
+    async with change_feed.subscribe(filters) as subscription:
+        yield b"event: ready\ndata: {}\n\n"
+        while True:
+            try:
+                async with asyncio.timeout(CHANGE_FEED_KEEPALIVE_SECONDS):
+                    event = await subscription.get()
+            except TimeoutError:
+                yield b": keepalive\n\n"
+            else:
+                yield encode_event(event)
+
+
+@app.get("/api/v1/data-requests/changes")
+async def get_data_request_changes(
+    filters: DataRequestFilter = Depends(data_request_filter),
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> StreamingResponse:
+    """Stream changes to data requests as Server-Sent Events.
+
+    Takes the same filters as the list; an update is sent if the request
+    matches them before or after it. The stream opens with a "ready"
+    event, after which no committed change is missed: read the current
+    data requests then, and apply the "change" events that follow. A
+    "resync" event means changes were dropped, and the data requests must
+    be read again.
+    """
+    await release_session(session)
+    try:
+        await change_feed.start()
+    except TimeoutError:
+        raise HTTPException(status_code=503, detail="Change feed unavailable")
+
+    return StreamingResponse(
+        stream_data_request_changes(filters),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/v1/data-requests", response_model=DataRequest)
 async def post_data_request(
     body: CreateDataRequestBody,
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
-) -> dict[str, Any]:
+) -> Response:
     """Create a new data request."""
-    person_repo = PersonRepository(session)
+    person_repo = CachedPersonRepository(session)
     data_request_repo = DataRequestRepository(session)
     service = DataRequestService(data_request_repo, person_repo)
 
@@ -94,30 +409,131 @@ async def post_data_request(
             created_by=user.email,
         )
     except PersonNotFoundError as e:
-        from fastapi import HTTPException
-
         raise HTTPException(status_code=404, detail=str(e))
 
-    return asdict(data_request)
+    return dto_response(data_request, DataRequest)
 
 
-@app.get("/api/v1/request-sources")
+@app.post("/api/v1/data-requests/bulk", response_model=BulkCreateResult)
+async def post_data_requests_bulk(
+    body: BulkCreateDataRequestsBody,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    """Create many data requests in one call.
+
+    Items whose person or request source does not exist are reported in
+    ``failed`` by their index in the request; all other items are created.
+    """
+    service = DataRequestService(
+        DataRequestRepository(session),
+        PersonRepository(session),
+        CachedRequestSourceRepository(session),
+    )
+    result = await service.create_data_requests(
+        [
+            NewDataRequest(
+                person_id=item.person_id, request_source_id=item.request_source_id
+            )
+            for item in body.items
+        ],
+        created_by=user.email,
+    )
+    return dto_response(result, BulkCreateResult)
+
+
+@app.post("/api/v1/data-requests/status", response_model=StatusChangeResult)
+async def post_data_requests_status(
+    body: ChangeDataRequestStatusBody,
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    """Move data requests, picked by ids or by filters, to a status.
+
+    Requests whose current status cannot change to the new one are left
+    as they are, and ids that were not moved are reported in ``skipped``.
+    All the requests are updated with one statement.
+    """
+    service = DataRequestService(
+        DataRequestRepository(session), PersonRepository(session)
+    )
+    try:
+        result = await service.change_status(
+            body.status, ids=body.ids, filters=body.filters
+        )
+    except InvalidStatusChangeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return dto_response(result, StatusChangeResult)
+
+
+@app.get("/api/v1/request-sources", response_model=list[RequestSource])
 async def get_request_sources(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
-) -> list[dict[str, Any]]:
-    """Get all request sources."""
-    repo = RequestSourceRepository(session)
-    request_sources = await repo.get_all()
-    return [asdict(rs) for rs in request_sources]
+) -> Response:
+    """Get request sources, optionally paginated.
+
+    Request sources are served from the in-process cache, so the ETag is
+    a hash of the response itself rather than a database version stamp.
+    """
+    repo = CachedRequestSourceRepository(session)
+    try:
+        page = await repo.get_page(limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response = page_response(page, RequestSource)
+    etag = make_etag(response.body, page.next_cursor)
+    return not_modified(request, etag) or set_etag(response, etag)
 
 
-@app.get("/api/v1/people")
+@app.get("/api/v1/people", response_model=list[Person])
 async def get_people(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
     user: User = Depends(current_active_user),
     session: AsyncSession = Depends(get_async_session),
-) -> list[dict[str, Any]]:
-    """Get all people."""
+) -> Response:
+    """Get people, optionally paginated.
+
+    Responses carry an ETag derived from the table's version stamp; a
+    matching If-None-Match gets a 304 without any rows being loaded.
+    """
     repo = PersonRepository(session)
-    people = await repo.get_all()
-    return [asdict(p) for p in people]
+    etag = make_etag("people", await repo.get_version(), request.url.query)
+    if (response := not_modified(request, etag)) is not None:
+        return response
+
+    try:
+        page = await repo.get_page(limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return set_etag(page_response(page, Person), etag)
+
+
+@app.get("/api/v1/people/search", response_model=list[Person])
+async def search_people(
+    request: Request,
+    q: str = Query(min_length=1, max_length=200),
+    date_of_birth: date | None = Query(None),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_RESULTS),
+    user: User = Depends(current_active_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    """Search people by name for a typeahead, best matches first.
+
+    Each word of ``q`` matches the start of, or something like, a first or
+    last name; see ``PersonRepository.search``.
+    """
+    repo = PersonRepository(session)
+    etag = make_etag("people-search", await repo.get_version(), request.url.query)
+    if (response := not_modified(request, etag)) is not None:
+        return response
+
+    people = await repo.search(q, date_of_birth=date_of_birth, limit=limit)
+    return set_etag(dto_response(people, list[Person]), etag)
@@ -71,6 +71,13 @@ def seed_database():
     run_seed()
 
 
+def load_synthetic_data(rows: int):
+    """Append synthetic people and data requests with COPY."""
+    from db.bulk_load import run_load
+
+    run_load(rows)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Rebuild the database")
     parser.add_argument(
@@ -78,6 +85,12 @@ def main():
         action="store_true",
         help="Run setup_db.sql to create the database (first-time setup)",
     )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=0,
+        help="Also load N synthetic data requests (and N / 5 people) with COPY",
+    )
     args = parser.parse_args()
 
     print("=== Rebuilding Database ===\n")
@@ -93,6 +106,10 @@ def main():
     print("3. Seeding database...")
     seed_database()
 
+    if args.rows:
+        print(f"4. Loading {args.rows} synthetic data requests...")
+        load_synthetic_data(args.rows)
+
     print("\n=== Database rebuild complete ===")
 
 
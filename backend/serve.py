@@ -0,0 +1,52 @@
+"""Run the API in production: several uvicorn workers on uvloop and httptools.
+
+The worker count comes from API_WORKERS, defaulting to one per CPU. Workers
+are spawned, not forked, so each imports the app, reads .env and opens its
+own database connection pool; the pool settings in core/database.py apply
+per worker.
+
+The supervisor holds the listening socket, so workers can be replaced
+without refusing connections. Send it SIGHUP to restart the workers one at
+a time, e.g. after a deploy, SIGTTIN/SIGTTOU to add or remove a worker, and
+SIGTERM to stop. Workers finish in-flight requests for up to
+API_GRACEFUL_TIMEOUT seconds (default 30) before they are stopped.
+
+Run with: .venv/bin/python serve.py --port 8000
+"""
+
+import argparse
+import os
+
+from uvicorn import Config, Server
+from uvicorn.supervisors import Multiprocess
+
+
+def get_worker_count() -> int:
+    """Get the number of workers from API_WORKERS, or the number of CPUs."""
+    return int(os.getenv("API_WORKERS") or os.cpu_count() or 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=os.getenv("API_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("API_PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=get_worker_count())
+    args = parser.parse_args()
+
+    config = Config(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop="uvloop",
+        http="httptools",
+        proxy_headers=True,
+        timeout_graceful_shutdown=int(os.getenv("API_GRACEFUL_TIMEOUT", "30")),
+    )
+    # Supervise even a single worker, so that SIGHUP reloads it
+    socket = config.bind_socket()
+    Multiprocess(config, target=Server(config).run, sockets=[socket]).run()
+
+
+if __name__ == "__main__":
+    main()
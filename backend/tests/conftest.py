@@ -0,0 +1 @@
+pytest_plugins = ["tests.statement_budget"]
@@ -1,10 +1,32 @@
+import asyncio
+import csv
+import io
+import json
 import os
+from contextlib import asynccontextmanager, contextmanager
+from ipaddress import ip_network
+from typing import AsyncIterator, Iterator
 
 import pytest
 from dotenv import load_dotenv
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, func, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
-from core.data_request import Status
+import core.query_log
+import main
+
+from core.auth import token_cache
+from core.data_request import Status, change_feed
+from core.database import (
+    get_async_database_url,
+    get_database,
+    get_pool_stats,
+    open_session,
+)
+from core.query_log import QueryLogMiddleware, log_queries
+from core.repository import encode_cursor
 from main import app
 
 load_dotenv()
@@ -34,6 +56,25 @@ async def auth_headers(client: AsyncClient) -> dict:
     return {"Authorization": f"Bearer {token}"}
 
 
+async def collect_pages(
+    client: AsyncClient, auth_headers: dict, url: str, limit: int
+) -> list[list[dict]]:
+    """Follow X-Next-Cursor from the first page to the last."""
+    separator = "&" if "?" in url else "?"
+    pages = []
+    cursor = None
+    while True:
+        page_url = f"{url}{separator}limit={limit}"
+        if cursor is not None:
+            page_url += f"&cursor={cursor}"
+        response = await client.get(page_url, headers=auth_headers)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return pages
+
+
 class TestGetDataRequestsEndpoint:
     """Integration tests for GET /api/v1/data-requests endpoint."""
 
@@ -49,6 +90,7 @@ class TestGetDataRequestsEndpoint:
         assert len(data) >= 6  # At least the seeded data
 
     @pytest.mark.asyncio
+    @pytest.mark.statement_budget(3)
     async def test_filter_by_status_created(
         self, client: AsyncClient, auth_headers: dict
     ) -> None:
@@ -125,11 +167,496 @@ class TestGetDataRequestsEndpoint:
             filtered_data = filtered_response.json()
             assert len(filtered_data) == expected_count
 
+    @pytest.mark.asyncio
+    async def test_filter_by_status_in(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.get(
+            "/api/v1/data-requests?status_in=1&status_in=3", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) > 0
+        assert all(item["status"] in (1, 3) for item in data)
+
+    @pytest.mark.asyncio
+    async def test_filter_by_request_source_and_person(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.get(
+            "/api/v1/data-requests?request_source_id=acme-corp&person_id=1",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) > 0
+        assert all(
+            item["request_source_id"] == "acme-corp" and item["person_id"] == 1
+            for item in data
+        )
+
+    @pytest.mark.asyncio
+    async def test_filter_by_created_by(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.get(
+            "/api/v1/data-requests?created_by=admin@example.com",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) > 0
+        assert all(item["created_by"] == "admin@example.com" for item in data)
+
+    @pytest.mark.asyncio
+    async def test_filter_by_created_on_range(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.get(
+            "/api/v1/data-requests"
+            "?created_from=2024-01-15T09:30:00&created_to=2024-01-17T00:00:00",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert {item["id"] for item in data} == {1, 2}
+
+    @pytest.mark.asyncio
+    async def test_paginate_with_cursor(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        all_data = (
+            await client.get("/api/v1/data-requests", headers=auth_headers)
+        ).json()
+
+        pages = await collect_pages(client, auth_headers, "/api/v1/data-requests", 2)
+
+        assert all(len(page) <= 2 for page in pages)
+        assert [item for page in pages for item in page] == all_data
+
+    @pytest.mark.asyncio
+    async def test_paginate_with_filter(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        filtered = (
+            await client.get(
+                "/api/v1/data-requests?status_in=1&status_in=2",
+                headers=auth_headers,
+            )
+        ).json()
+
+        pages = await collect_pages(
+            client, auth_headers, "/api/v1/data-requests?status_in=1&status_in=2", 1
+        )
+
+        assert [item for page in pages for item in page] == filtered
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_returns_400(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.get(
+            "/api/v1/data-requests?limit=2&cursor=garbage", headers=auth_headers
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_limit_out_of_range_returns_422(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.get(
+            "/api/v1/data-requests?limit=0", headers=auth_headers
+        )
+
+        assert response.status_code == 422
+
+
+class TestSyncDataRequests:
+    """Integration tests for incremental sync of the data request list."""
+
+    @staticmethod
+    async def sync(client: AsyncClient, auth_headers: dict, since: str = "") -> tuple:
+        response = await client.get(
+            f"/api/v1/data-requests?since={since}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        return response.json(), response.headers["X-Sync-Token"]
+
+    @pytest.mark.asyncio
+    async def test_empty_since_lists_everything(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        all_data = (
+            await client.get("/api/v1/data-requests", headers=auth_headers)
+        ).json()
+
+        data, _ = await self.sync(client, auth_headers)
+
+        assert data == all_data
+
+    @pytest.mark.asyncio
+    async def test_lists_only_changes_since_the_token(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        _, token = await self.sync(client, auth_headers)
+        async with open_session() as session:
+            await session.execute(
+                text("UPDATE data_request SET status = status WHERE id = 2")
+            )
+            await session.commit()
+
+        changed, next_token = await self.sync(client, auth_headers, token)
+        unchanged, _ = await self.sync(client, auth_headers, next_token)
+
+        assert [item["id"] for item in changed] == [2]
+        assert unchanged == []
+
+    @pytest.mark.asyncio
+    async def test_includes_changes_committed_after_the_token(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        async with open_session() as session:
+            await session.execute(
+                text("UPDATE data_request SET status = status WHERE id = 3")
+            )
+            _, token = await self.sync(client, auth_headers)
+            await session.commit()
+
+        changed, _ = await self.sync(client, auth_headers, token)
+
+        assert [item["id"] for item in changed] == [3]
+
+    @pytest.mark.asyncio
+    async def test_token_only_on_the_first_page(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        first = await client.get(
+            "/api/v1/data-requests?since=&limit=1", headers=auth_headers
+        )
+        second = await client.get(
+            "/api/v1/data-requests?since=&limit=1"
+            f"&cursor={first.headers['X-Next-Cursor']}",
+            headers=auth_headers,
+        )
+
+        assert "X-Sync-Token" in first.headers
+        assert "X-Sync-Token" not in second.headers
+
+    @pytest.mark.asyncio
+    async def test_no_token_without_since(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.get("/api/v1/data-requests", headers=auth_headers)
+
+        assert "X-Sync-Token" not in response.headers
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "since", ["garbage", encode_cursor(["x"]), encode_cursor(["1:2:a"])]
+    )
+    async def test_invalid_token_returns_400(
+        self, client: AsyncClient, auth_headers: dict, since: str
+    ) -> None:
+        response = await client.get(
+            f"/api/v1/data-requests?since={since}", headers=auth_headers
+        )
+
+        assert response.status_code == 400
+
+
+class TestConditionalGet:
+    """Integration tests for ETag / If-None-Match on the list endpoints."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/v1/data-requests",
+            "/api/v1/data-requests?status=2&limit=2",
+            "/api/v1/data-requests/summary",
+            "/api/v1/people",
+            "/api/v1/people/search?q=jo",
+            "/api/v1/request-sources",
+        ],
+    )
+    async def test_matching_etag_returns_304(
+        self, client: AsyncClient, auth_headers: dict, url: str
+    ) -> None:
+        first = await client.get(url, headers=auth_headers)
+        etag = first.headers["ETag"]
+
+        second = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_etag_depends_on_query(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        all_etag = (
+            await client.get("/api/v1/data-requests", headers=auth_headers)
+        ).headers["ETag"]
+
+        response = await client.get(
+            "/api/v1/data-requests?status=2",
+            headers={**auth_headers, "If-None-Match": all_etag},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != all_etag
+
+    @pytest.mark.asyncio
+    async def test_write_changes_etag(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        etag = (
+            await client.get("/api/v1/data-requests", headers=auth_headers)
+        ).headers["ETag"]
+        await client.post(
+            "/api/v1/data-requests",
+            json={"person_id": 1, "request_source_id": "acme-corp"},
+            headers=auth_headers,
+        )
+
+        response = await client.get(
+            "/api/v1/data-requests",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+
+class TestGetDataRequestSummaryEndpoint:
+    """Integration tests for GET /api/v1/data-requests/summary endpoint."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.statement_budget(3)
+    async def test_summary_reads_only_the_counters(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.get(
+            "/api/v1/data-requests/summary", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_summary_matches_the_list(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.get(
+            "/api/v1/data-requests/summary", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        summary = response.json()
+        listed = (
+            await client.get("/api/v1/data-requests", headers=auth_headers)
+        ).json()
+        assert summary["total"] == len(listed)
+        assert summary["by_status"] == [
+            {
+                "status": status,
+                "count": sum(1 for dr in listed if dr["status"] == status),
+            }
+            for status in Status
+        ]
+        sources = sorted({dr["request_source_id"] for dr in listed})
+        assert summary["by_request_source"] == [
+            {
+                "request_source_id": source,
+                "count": sum(1 for dr in listed if dr["request_source_id"] == source),
+            }
+            for source in sources
+        ]
+
+    @pytest.mark.asyncio
+    async def test_create_is_counted(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        before = (
+            await client.get("/api/v1/data-requests/summary", headers=auth_headers)
+        ).json()
+        await client.post(
+            "/api/v1/data-requests",
+            json={"person_id": 1, "request_source_id": "acme-corp"},
+            headers=auth_headers,
+        )
+
+        after = (
+            await client.get("/api/v1/data-requests/summary", headers=auth_headers)
+        ).json()
+
+        assert after["total"] == before["total"] + 1
+        processing = {sc["status"]: sc["count"] for sc in after["by_status"]}
+        assert processing[Status.PROCESSING] == next(
+            sc["count"] + 1
+            for sc in before["by_status"]
+            if sc["status"] == Status.PROCESSING
+        )
+
+    @pytest.mark.asyncio
+    async def test_summary_requires_auth(self, client: AsyncClient) -> None:
+        response = await client.get("/api/v1/data-requests/summary")
+
+        assert response.status_code == 401
+
+
+class TestExportDataRequestsEndpoint:
+    """Integration tests for GET /api/v1/data-requests/export endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_export_ndjson(self, client: AsyncClient, auth_headers: dict) -> None:
+        all_data = (
+            await client.get("/api/v1/data-requests", headers=auth_headers)
+        ).json()
+
+        response = await client.get(
+            "/api/v1/data-requests/export", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert rows == all_data
+
+    @pytest.mark.asyncio
+    async def test_export_csv_with_filter(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        filtered = (
+            await client.get("/api/v1/data-requests?status=2", headers=auth_headers)
+        ).json()
+
+        response = await client.get(
+            "/api/v1/data-requests/export?format=csv&status=2", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [int(row["id"]) for row in rows] == [item["id"] for item in filtered]
+        assert all(row["status"] == "2" for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_export_requires_auth(self, client: AsyncClient) -> None:
+        response = await client.get("/api/v1/data-requests/export")
+
+        assert response.status_code == 401
+
+
+@asynccontextmanager
+async def event_stream(url: str, headers: dict) -> AsyncIterator[asyncio.Queue]:
+    """Call the app for a streaming response, disconnecting on exit.
+
+    httpx's ASGI transport waits for the whole body, which an event stream
+    never finishes, so this drives the app directly and queues what it sends.
+    """
+    path, _, query = url.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("testclient", 50000),
+        "server": ("test", 80),
+    }
+    disconnected = asyncio.Event()
+    sent: asyncio.Queue = asyncio.Queue()
+
+    async def receive() -> dict:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    task = asyncio.create_task(app(scope, receive, sent.put))
+    try:
+        yield sent
+    finally:
+        disconnected.set()
+        async with asyncio.timeout(5):
+            await task
+
+
+async def next_message(sent: asyncio.Queue) -> dict:
+    async with asyncio.timeout(5):
+        return await sent.get()
+
+
+class TestGetDataRequestChangesEndpoint:
+    """Integration tests for GET /api/v1/data-requests/changes endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_streams_matching_changes(self, auth_headers: dict) -> None:
+        url = "/api/v1/data-requests/changes?person_id=1"
+        async with event_stream(url, auth_headers) as sent:
+            start = await next_message(sent)
+            ready = await next_message(sent)
+
+            async with open_session() as session:
+                await session.execute(
+                    text("UPDATE data_request SET status = status WHERE id IN (1, 2)")
+                )
+                await session.commit()
+            change = await next_message(sent)
+
+        await change_feed.close()
+        assert start["status"] == 200
+        assert (b"content-type", b"text/event-stream; charset=utf-8") in start[
+            "headers"
+        ]
+        assert ready["body"] == b"event: ready\ndata: {}\n\n"
+        event, data = change["body"].split(b"\n")[:2]
+        assert event == b"event: change"
+        payload = json.loads(data.removeprefix(b"data: "))
+        assert payload["op"] == "update"
+        assert payload["data_request"]["id"] == 1
+        assert change_feed.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_does_not_hold_a_pooled_connection(
+        self, auth_headers: dict, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the connection used to authenticate is returned."""
+        monkeypatch.setattr(get_database(), "replica_engines", [])
+        token_cache.clear()
+        engine = get_database().engine
+
+        async with event_stream("/api/v1/data-requests/changes", auth_headers) as sent:
+            start = await next_message(sent)
+            await next_message(sent)
+
+            assert start["status"] == 200
+            assert get_pool_stats(engine).checked_out == 0
+
+        await change_feed.close()
+
+    @pytest.mark.asyncio
+    async def test_changes_require_auth(self, client: AsyncClient) -> None:
+        response = await client.get("/api/v1/data-requests/changes")
+
+        assert response.status_code == 401
+
 
 class TestPostDataRequestEndpoint:
     """Integration tests for POST /api/v1/data-requests endpoint."""
 
     @pytest.mark.asyncio
+    @pytest.mark.statement_budget(3)
     async def test_create_data_request_success(
         self, client: AsyncClient, auth_headers: dict
     ) -> None:
@@ -183,10 +710,219 @@ class TestPostDataRequestEndpoint:
         assert response.status_code == 422
 
 
+class TestPostDataRequestsBulkEndpoint:
+    """Integration tests for POST /api/v1/data-requests/bulk endpoint."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.statement_budget(6)
+    async def test_bulk_create_reports_failures_per_item(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.post(
+            "/api/v1/data-requests/bulk",
+            json={
+                "items": [
+                    {"person_id": 1, "request_source_id": "acme-corp"},
+                    {"person_id": 9999, "request_source_id": "acme-corp"},
+                    {"person_id": 2, "request_source_id": "globex-inc"},
+                    {"person_id": 1, "request_source_id": "no-such-source"},
+                ]
+            },
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [
+            (dr["person_id"], dr["request_source_id"]) for dr in data["created"]
+        ] == [
+            (1, "acme-corp"),
+            (2, "globex-inc"),
+        ]
+        assert all(dr["status"] == Status.PROCESSING for dr in data["created"])
+        assert all(dr["created_by"] == "demo@example.com" for dr in data["created"])
+        assert data["created"][1]["first_name"] == "Sarah"
+        assert [(f["index"], f["person_id"]) for f in data["failed"]] == [
+            (1, 9999),
+            (3, 1),
+        ]
+
+        ids = {dr["id"] for dr in data["created"]}
+        listed = (
+            await client.get("/api/v1/data-requests", headers=auth_headers)
+        ).json()
+        assert ids <= {dr["id"] for dr in listed}
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_empty(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.post(
+            "/api/v1/data-requests/bulk", json={"items": []}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"created": [], "failed": []}
+
+
+class TestChangeDataRequestStatusEndpoint:
+    """Integration tests for POST /api/v1/data-requests/status endpoint."""
+
+    @pytest.fixture
+    async def request_ids(self) -> AsyncIterator[list[int]]:
+        """Three PROCESSING requests of their own, deleted afterwards."""
+        async with open_session() as session:
+            result = await session.execute(
+                text(
+                    """
+                    INSERT INTO data_request (person_id, first_name, last_name,
+                        date_of_birth, status, created_on, created_by,
+                        request_source_id)
+                    SELECT 1, 'John', 'Smith', '1985-03-15', :processing, now(),
+                        'status-test@example.com', 'acme-corp'
+                    FROM generate_series(1, 3)
+                    RETURNING id
+                    """
+                ),
+                {"processing": Status.PROCESSING},
+            )
+            ids = sorted(result.scalars())
+            await session.commit()
+        yield ids
+        async with open_session() as session:
+            await session.execute(
+                text("DELETE FROM data_request WHERE id = ANY(:ids)"), {"ids": ids}
+            )
+            await session.commit()
+
+    async def statuses(self, ids: list[int]) -> list[int]:
+        async with open_session() as session:
+            result = await session.execute(
+                text(
+                    "SELECT status FROM data_request WHERE id = ANY(:ids) ORDER BY id"
+                ),
+                {"ids": ids},
+            )
+            return list(result.scalars())
+
+    @pytest.mark.asyncio
+    @pytest.mark.statement_budget(3)
+    async def test_change_status_by_ids(
+        self, client: AsyncClient, auth_headers: dict, request_ids: list[int]
+    ) -> None:
+        ids = request_ids[:2] + list(range(10**9, 10**9 + 10000 - 2))
+
+        response = await client.post(
+            "/api/v1/data-requests/status",
+            json={"status": Status.COMPLETE, "ids": ids},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == Status.COMPLETE
+        assert data["updated"] == request_ids[:2]
+        assert data["skipped"] == ids[2:]
+        assert await self.statuses(request_ids) == [
+            Status.COMPLETE,
+            Status.COMPLETE,
+            Status.PROCESSING,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_disallowed_changes_are_skipped(
+        self, client: AsyncClient, auth_headers: dict, request_ids: list[int]
+    ) -> None:
+        await client.post(
+            "/api/v1/data-requests/status",
+            json={"status": Status.COMPLETE, "ids": request_ids[:1]},
+            headers=auth_headers,
+        )
+
+        response = await client.post(
+            "/api/v1/data-requests/status",
+            json={"status": Status.PROCESSING, "ids": request_ids},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["updated"] == []
+        assert data["skipped"] == request_ids
+        assert await self.statuses(request_ids) == [
+            Status.COMPLETE,
+            Status.PROCESSING,
+            Status.PROCESSING,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_change_status_by_filters(
+        self, client: AsyncClient, auth_headers: dict, request_ids: list[int]
+    ) -> None:
+        response = await client.post(
+            "/api/v1/data-requests/status",
+            json={
+                "status": Status.NEEDS_REVIEW,
+                "filters": {"created_by": "status-test@example.com"},
+            },
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": Status.NEEDS_REVIEW,
+            "updated": request_ids,
+            "skipped": [],
+        }
+        assert await self.statuses(request_ids) == [Status.NEEDS_REVIEW] * 3
+
+    @pytest.mark.asyncio
+    async def test_change_status_to_created(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.post(
+            "/api/v1/data-requests/status",
+            json={"status": Status.CREATED, "ids": [1]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "selection",
+        [
+            {},
+            {"ids": [1], "filters": {"status": Status.PROCESSING}},
+            {"filters": {}},
+        ],
+    )
+    async def test_change_status_needs_ids_or_filters(
+        self, client: AsyncClient, auth_headers: dict, selection: dict
+    ) -> None:
+        response = await client.post(
+            "/api/v1/data-requests/status",
+            json={"status": Status.COMPLETE, **selection},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_change_status_requires_auth(self, client: AsyncClient) -> None:
+        response = await client.post(
+            "/api/v1/data-requests/status",
+            json={"status": Status.COMPLETE, "ids": [1]},
+        )
+
+        assert response.status_code == 401
+
+
 class TestGetPeopleEndpoint:
     """Integration tests for GET /api/v1/people endpoint."""
 
     @pytest.mark.asyncio
+    @pytest.mark.statement_budget(3)
     async def test_get_all_people(
         self, client: AsyncClient, auth_headers: dict
     ) -> None:
@@ -214,6 +950,103 @@ class TestGetPeopleEndpoint:
             assert isinstance(item["last_name"], str)
             assert isinstance(item["date_of_birth"], str)
 
+    @pytest.mark.asyncio
+    async def test_paginate_people(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        all_data = (await client.get("/api/v1/people", headers=auth_headers)).json()
+
+        pages = await collect_pages(client, auth_headers, "/api/v1/people", 3)
+
+        assert [len(page) for page in pages] == [3, 3, 2]
+        assert [item for page in pages for item in page] == all_data
+
+
+class TestSearchPeopleEndpoint:
+    """Integration tests for GET /api/v1/people/search endpoint."""
+
+    async def search(
+        self, client: AsyncClient, auth_headers: dict, query: str
+    ) -> list[str]:
+        response = await client.get(
+            f"/api/v1/people/search?{query}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        return [f"{p['first_name']} {p['last_name']}" for p in response.json()]
+
+    @pytest.mark.asyncio
+    @pytest.mark.statement_budget(3)
+    async def test_prefix_matches_either_name(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        names = await self.search(client, auth_headers, "q=JO")
+
+        assert names == ["Sarah Johnson", "David Jones", "John Smith"]
+
+    @pytest.mark.asyncio
+    async def test_every_word_must_match(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        names = await self.search(client, auth_headers, "q=jo%20smi")
+
+        assert names == ["John Smith"]
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_match(self, client: AsyncClient, auth_headers: dict) -> None:
+        names = await self.search(client, auth_headers, "q=wiliams")
+
+        assert names == ["Michael Williams"]
+
+    @pytest.mark.asyncio
+    async def test_last_name_matches_come_first(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        names = await self.search(client, auth_headers, "q=mi")
+
+        assert names == ["Robert Miller", "Michael Williams"]
+
+    @pytest.mark.asyncio
+    async def test_similar_names_follow_prefix_matches(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        names = await self.search(client, auth_headers, "q=johns")
+
+        assert names == ["Sarah Johnson", "John Smith"]
+
+    @pytest.mark.asyncio
+    async def test_like_wildcards_match_literally(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        assert await self.search(client, auth_headers, "q=%25") == []
+        assert await self.search(client, auth_headers, "q=_") == []
+
+    @pytest.mark.asyncio
+    async def test_filter_by_date_of_birth(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        names = await self.search(client, auth_headers, "q=jo&date_of_birth=1982-09-12")
+
+        assert names == ["David Jones"]
+
+    @pytest.mark.asyncio
+    async def test_limit(self, client: AsyncClient, auth_headers: dict) -> None:
+        names = await self.search(client, auth_headers, "q=jo&limit=2")
+
+        assert names == ["Sarah Johnson", "David Jones"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "query", ["q=", "date_of_birth=1982-09-12", "q=jo&limit=101"]
+    )
+    async def test_invalid_query_returns_422(
+        self, client: AsyncClient, auth_headers: dict, query: str
+    ) -> None:
+        response = await client.get(
+            f"/api/v1/people/search?{query}", headers=auth_headers
+        )
+
+        assert response.status_code == 422
+
 
 class TestGetRequestSourcesEndpoint:
     """Integration tests for GET /api/v1/request-sources endpoint."""
@@ -256,3 +1089,319 @@ class TestGetRequestSourcesEndpoint:
         assert "initech" in ids
         assert "umbrella-corp" in ids
         assert "wayne-enterprises" in ids
+
+    @pytest.mark.asyncio
+    async def test_paginate_request_sources(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        all_data = (
+            await client.get("/api/v1/request-sources", headers=auth_headers)
+        ).json()
+
+        pages = await collect_pages(client, auth_headers, "/api/v1/request-sources", 2)
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [item for page in pages for item in page] == all_data
+
+
+class TestAuthentication:
+    """Integration tests for bearer token authentication."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_skip_the_user_query(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test that a token seen before is served from the token cache."""
+        await client.get("/api/v1/request-sources", headers=auth_headers)
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        event.listen(get_database().engine.sync_engine, "before_cursor_execute", record)
+        try:
+            response = await client.get("/api/v1/users/me", headers=auth_headers)
+        finally:
+            event.remove(
+                get_database().engine.sync_engine, "before_cursor_execute", record
+            )
+
+        assert response.status_code == 200
+        assert response.json()["email"] == "demo@example.com"
+        assert not any('FROM "user"' in statement for statement in statements)
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_is_rejected(self, client: AsyncClient):
+        """Test that a bad token is a 401, not a cache lookup that succeeds."""
+        response = await client.get(
+            "/api/v1/request-sources", headers={"Authorization": "Bearer nope"}
+        )
+
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_request_checks_out_one_connection(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that the user lookup and the endpoint share one connection."""
+        monkeypatch.setattr(get_database(), "replica_engines", [])
+        token_cache.clear()
+        checkouts: list[object] = []
+
+        def record(dbapi_connection, connection_record, connection_proxy) -> None:
+            checkouts.append(dbapi_connection)
+
+        event.listen(get_database().engine.sync_engine, "checkout", record)
+        try:
+            response = await client.get("/api/v1/people", headers=auth_headers)
+        finally:
+            event.remove(get_database().engine.sync_engine, "checkout", record)
+
+        assert response.status_code == 200
+        assert len(checkouts) == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_token_survives_a_failed_request(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test that a rollback of the request that cached the user is harmless."""
+        token_cache.clear()
+        response = await client.get(
+            "/api/v1/data-requests?cursor=not-a-cursor", headers=auth_headers
+        )
+        assert response.status_code == 400
+
+        response = await client.get("/api/v1/users/me", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["email"] == "demo@example.com"
+
+
+@pytest.fixture
+async def remote_client() -> AsyncIterator[AsyncClient]:
+    """Client connecting from an address outside the loopback network."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app, client=("203.0.113.5", 40000)),
+        base_url="http://test",
+    ) as c:
+        yield c
+
+
+class TestPoolEndpoint:
+    """Integration tests for GET /internal/pool."""
+
+    @pytest.mark.asyncio
+    async def test_reports_pool_usage(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that checkouts made by requests show up in the pool stats."""
+        monkeypatch.setattr(get_database(), "replica_engines", [])
+        before = (await client.get("/internal/pool")).json()
+        await client.get("/api/v1/people", headers=auth_headers)
+
+        after = (await client.get("/internal/pool")).json()
+
+        assert after["size"] == 5
+        assert after["checked_out"] == 0
+        assert after["waits"] == before["waits"] + 1
+        assert after["wait_seconds_buckets"]["+Inf"] == after["waits"]
+        assert after["timeouts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_refuses_clients_outside_allowed_networks(
+        self, remote_client: AsyncClient
+    ):
+        response = await remote_client.get("/internal/pool")
+
+        assert response.status_code == 403
+
+
+class TestMetricsEndpoint:
+    """Integration tests for GET /metrics."""
+
+    @pytest.mark.asyncio
+    async def test_reports_requests_by_route_template(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test that requests are counted by route template, not raw path."""
+        await client.get("/api/v1/people", headers=auth_headers)
+        await client.get("/api/v1/no-such-route/12345")
+
+        response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        lines = response.text.splitlines()
+        assert any(
+            line.startswith(
+                'http_requests_total{method="GET",route="/api/v1/people",status="200"}'
+            )
+            for line in lines
+        )
+        assert any(
+            line.startswith(
+                'http_requests_total{method="GET",route="unmatched",status="404"}'
+            )
+            for line in lines
+        )
+        assert not any("12345" in line for line in lines)
+        db_count = next(
+            line
+            for line in lines
+            if line.startswith(
+                'http_request_db_statements_count{method="GET",route="/api/v1/people"}'
+            )
+        )
+        assert int(db_count.split()[-1]) >= 1
+        assert any(
+            line.startswith('db_pool_checked_out{pool="primary"}') for line in lines
+        )
+
+    @pytest.mark.asyncio
+    async def test_refuses_clients_outside_allowed_networks(
+        self, remote_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        assert (await remote_client.get("/metrics")).status_code == 403
+
+        monkeypatch.setattr(
+            main, "INTERNAL_ALLOWED_NETWORKS", [ip_network("203.0.113.0/24")]
+        )
+
+        assert (await remote_client.get("/metrics")).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_failed_statements_leave_nothing_on_the_connection(self):
+        """Test that a statement that raises does not leak its start time."""
+        async with open_session() as session:
+            connection = await session.connection()
+            for _ in range(3):
+                with pytest.raises(DBAPIError):
+                    await connection.execute(text("SELECT 1 / 0"))
+                await connection.rollback()
+
+            assert "query_start" not in connection.info
+
+
+class TestQueryLog:
+    """Integration tests for the slow-query log and N+1 detector."""
+
+    @pytest.mark.asyncio
+    async def test_logs_repeated_statements_per_request(
+        self,
+        auth_headers: dict,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        """Test that a request running a statement too often is logged."""
+        monkeypatch.setattr(core.query_log, "REPEAT_LIMIT", 0)
+        log_queries(get_database().engine)
+        async with AsyncClient(
+            transport=ASGITransport(app=QueryLogMiddleware(app)),
+            base_url="http://test",
+        ) as logged_client:
+            await logged_client.get("/api/v1/people", headers=auth_headers)
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert any(
+            m.startswith("GET /api/v1/people ran the same statement 1 times")
+            and "FROM people" in m
+            for m in messages
+        )
+
+    @pytest.mark.asyncio
+    async def test_logs_slow_statements_without_values(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        """Test that slow statements are logged with their parameters' types."""
+        monkeypatch.setattr(core.query_log, "SLOW_QUERY_SECONDS", 0)
+        log_queries(get_database().engine)
+        async with open_session() as session:
+            await session.execute(
+                text("SELECT * FROM people WHERE last_name = :name"),
+                {"name": "Smith"},
+            )
+
+        [message] = [
+            r.getMessage() for r in caplog.records if "FROM people" in r.getMessage()
+        ]
+        assert message.startswith("Slow query")
+        assert "1 rows, parameters (str)" in message
+        assert "Smith" not in message
+
+
+@pytest.fixture
+async def replica(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[AsyncEngine]:
+    """The test database under a second engine, standing in for a replica."""
+    replica = create_async_engine(
+        get_async_database_url(),
+        connect_args={"server_settings": {"application_name": "replica"}},
+    )
+    monkeypatch.setattr(get_database(), "replica_engines", [replica])
+    yield replica
+    await replica.dispose()
+
+
+@contextmanager
+def recording(engine: AsyncEngine) -> Iterator[list[str]]:
+    """Record the SQL statements an engine sends."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+class TestReplicaRouting:
+    """Integration tests for sending read-only requests to a replica."""
+
+    @pytest.mark.asyncio
+    async def test_get_requests_read_from_the_replica(
+        self, client: AsyncClient, auth_headers: dict, replica: AsyncEngine
+    ):
+        """Test that a GET, including its user lookup, never uses the primary."""
+        token_cache.clear()
+
+        with recording(get_database().engine) as primary_statements:
+            with recording(replica) as replica_statements:
+                response = await client.get("/api/v1/people", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert primary_statements == []
+        assert any('FROM "user"' in statement for statement in replica_statements)
+        assert any("FROM people" in statement for statement in replica_statements)
+
+    @pytest.mark.asyncio
+    async def test_writes_use_the_primary(
+        self, client: AsyncClient, auth_headers: dict, replica: AsyncEngine
+    ):
+        """Test that a POST runs entirely on the primary."""
+        with recording(replica) as replica_statements:
+            response = await client.post(
+                "/api/v1/data-requests",
+                headers=auth_headers,
+                json={"person_id": 1, "request_source_id": "acme-corp"},
+            )
+
+        assert response.status_code == 200
+        assert replica_statements == []
+
+    @pytest.mark.asyncio
+    async def test_reads_after_a_write_use_the_primary(self, replica: AsyncEngine):
+        """Test that once a read-only session writes, it stays on the primary."""
+        application_name = select(func.current_setting("application_name"))
+
+        async with open_session(read_only=True) as session:
+            before = await session.scalar(application_name)
+            await session.execute(
+                text("UPDATE data_request SET status = status WHERE id = 1")
+            )
+            after = await session.scalar(application_name)
+            await session.rollback()
+
+        assert before == "replica"
+        assert after != "replica"
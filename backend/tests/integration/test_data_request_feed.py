@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from core.data_request import (
+    ChangeOp,
+    ChangeSubscription,
+    DataRequestChange,
+    DataRequestChangeFeed,
+    DataRequestFilter,
+    Resync,
+    Status,
+)
+from core.database import open_session
+
+
+async def next_event(subscription: ChangeSubscription) -> DataRequestChange | Resync:
+    async with asyncio.timeout(5):
+        return await subscription.get()
+
+
+async def execute_and_commit(statement: str) -> None:
+    async with open_session() as session:
+        await session.execute(text(statement))
+        await session.commit()
+
+
+@pytest.fixture
+async def feed():
+    """A feed of its own, stopped after the test."""
+    feed = DataRequestChangeFeed(buffer_size=10)
+    yield feed
+    await feed.close()
+
+
+class TestDataRequestChangeFeed:
+    """Integration tests for the LISTEN/NOTIFY data request change feed."""
+
+    @pytest.mark.asyncio
+    async def test_receives_committed_update(self, feed: DataRequestChangeFeed) -> None:
+        async with feed.subscribe(DataRequestFilter()) as subscription:
+            await execute_and_commit(
+                "UPDATE data_request SET status = status WHERE id = 1"
+            )
+
+            event = await next_event(subscription)
+
+        assert isinstance(event, DataRequestChange)
+        assert event.op is ChangeOp.UPDATE
+        assert event.data_request.id == 1
+        assert isinstance(event.data_request.status, Status)
+        assert event.previous == event.data_request
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_changes_are_not_sent(
+        self, feed: DataRequestChangeFeed
+    ) -> None:
+        async with feed.subscribe(DataRequestFilter()) as subscription:
+            async with open_session() as session:
+                await session.execute(
+                    text("UPDATE data_request SET status = status WHERE id = 1")
+                )
+                await session.rollback()
+            await execute_and_commit(
+                "UPDATE data_request SET status = status WHERE id = 2"
+            )
+
+            event = await next_event(subscription)
+
+        assert isinstance(event, DataRequestChange)
+        assert event.data_request.id == 2
+
+    @pytest.mark.asyncio
+    async def test_filters_changes(self, feed: DataRequestChangeFeed) -> None:
+        async with feed.subscribe(DataRequestFilter(person_id=2)) as subscription:
+            await execute_and_commit(
+                "UPDATE data_request SET status = status WHERE id IN (1, 2)"
+            )
+
+            event = await next_event(subscription)
+
+        assert isinstance(event, DataRequestChange)
+        assert event.data_request.person_id == 2
+
+    @pytest.mark.asyncio
+    async def test_large_statement_sends_resync(
+        self, feed: DataRequestChangeFeed
+    ) -> None:
+        async with feed.subscribe(DataRequestFilter()) as subscription:
+            await execute_and_commit(
+                """
+                INSERT INTO data_request (person_id, first_name, last_name,
+                    date_of_birth, status, created_on, created_by,
+                    request_source_id)
+                SELECT 1, 'John', 'Smith', '1985-03-15', 2, now(),
+                    'feed-test@example.com', 'acme-corp'
+                FROM generate_series(1, 1001)
+                """
+            )
+            await execute_and_commit(
+                "DELETE FROM data_request WHERE created_by = 'feed-test@example.com'"
+            )
+
+            events = [await next_event(subscription) for _ in range(2)]
+
+        assert events == [Resync("bulk"), Resync("bulk")]
+
+    @pytest.mark.asyncio
+    async def test_reconnects_and_sends_resync(
+        self, feed: DataRequestChangeFeed
+    ) -> None:
+        async with feed.subscribe(DataRequestFilter()) as subscription:
+            await execute_and_commit(
+                """
+                SELECT pg_terminate_backend(pid) FROM pg_stat_activity
+                WHERE query LIKE 'LISTEN%data_request_changes%'
+                """
+            )
+
+            assert await next_event(subscription) == Resync("reconnect")
+
+            await execute_and_commit(
+                "UPDATE data_request SET status = status WHERE id = 1"
+            )
+            event = await next_event(subscription)
+
+        assert isinstance(event, DataRequestChange)
+        assert event.data_request.id == 1
+
+    @pytest.mark.asyncio
+    async def test_unsubscribes_on_exit(self, feed: DataRequestChangeFeed) -> None:
+        async with feed.subscribe(DataRequestFilter()):
+            assert feed.subscriber_count == 1
+
+        assert feed.subscriber_count == 0
@@ -0,0 +1,413 @@
+from datetime import timedelta
+from typing import AsyncIterator, Iterator
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.data_request import (
+    ClaimedDataRequest,
+    DataRequestRepository,
+    DataRequestSummary,
+    Status,
+)
+from core.database import get_database, open_session
+from core.person import PersonRepository
+
+
+@pytest.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    """Session whose changes are rolled back after the test."""
+    async with open_session() as s:
+        yield s
+        await s.rollback()
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """SQL statements sent to the database while the test runs."""
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        executed.append(statement)
+
+    event.listen(get_database().engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(get_database().engine.sync_engine, "before_cursor_execute", record)
+
+
+class TestDataRequestRepositoryCreate:
+    """Integration tests for DataRequestRepository.create."""
+
+    @pytest.mark.asyncio
+    async def test_create_is_a_single_statement(
+        self, session: AsyncSession, statements: list[str]
+    ) -> None:
+        person = await PersonRepository(session).get_by_id(1)
+        assert person is not None
+        statements.clear()
+
+        data_request = await DataRequestRepository(session).create(
+            person=person,
+            request_source_id="acme-corp",
+            created_by="test@example.com",
+        )
+
+        assert len(statements) == 1
+        assert statements[0].startswith("INSERT INTO data_request")
+        assert "RETURNING" in statements[0]
+        assert data_request.id is not None
+        assert data_request.person_id == 1
+        assert data_request.first_name == person.first_name
+        assert data_request.status is Status.PROCESSING
+        assert data_request.created_by == "test@example.com"
+
+    @pytest.mark.asyncio
+    async def test_create_many_is_a_single_statement(
+        self, session: AsyncSession, statements: list[str]
+    ) -> None:
+        people = await PersonRepository(session).get_by_ids([1, 2])
+        statements.clear()
+
+        created = await DataRequestRepository(session).create_many(
+            [(people[1], "acme-corp"), (people[2], "globex-inc")] * 5000,
+            created_by="test@example.com",
+        )
+
+        assert len(statements) == 1
+        assert len(created) == 10000
+        assert [dr.person_id for dr in created[:2]] == [1, 2]
+        assert [dr.id for dr in created] == sorted(dr.id for dr in created)
+
+
+class TestDataRequestRepositoryVersion:
+    """Integration tests for the table version behind data request ETags."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writers_do_not_block_each_other(self) -> None:
+        async with open_session() as first, open_session() as second:
+            people = await PersonRepository(first).get_by_ids([1])
+            await DataRequestRepository(first).create(
+                people[1], "acme-corp", "test@example.com"
+            )
+
+            # The first transaction is still open; a lock wait would time out.
+            await second.execute(text("SET LOCAL lock_timeout = '1s'"))
+            await DataRequestRepository(second).create(
+                people[1], "acme-corp", "test@example.com"
+            )
+
+            await first.rollback()
+            await second.rollback()
+
+    @pytest.mark.asyncio
+    async def test_version_changes_with_each_commit(self) -> None:
+        async with open_session() as reader:
+            before = await DataRequestRepository(reader).get_version()
+            await reader.rollback()
+
+            async with open_session() as writer:
+                await writer.execute(
+                    text("UPDATE data_request SET status = status WHERE id = 1")
+                )
+                uncommitted = await DataRequestRepository(reader).get_version()
+                await reader.rollback()
+                await writer.commit()
+
+            after = await DataRequestRepository(reader).get_version()
+
+        assert uncommitted == before
+        assert after == before + 1
+
+
+async def add_processing(session: AsyncSession, count: int) -> list[int]:
+    """Add PROCESSING acme-corp requests, returning their ids."""
+    people = await PersonRepository(session).get_by_ids([1])
+    created = await DataRequestRepository(session).create_many(
+        [(people[1], "acme-corp")] * count, created_by="test@example.com"
+    )
+    return [dr.id for dr in created]
+
+
+def claimed_ids(claims: list[ClaimedDataRequest]) -> list[int]:
+    return [claim.data_request.id for claim in claims]
+
+
+def by_id(claims: list[ClaimedDataRequest]) -> dict[int, ClaimedDataRequest]:
+    return {claim.data_request.id: claim for claim in claims}
+
+
+class TestDataRequestRepositoryClaim:
+    """Integration tests for claiming data requests for the workers."""
+
+    @pytest.mark.asyncio
+    async def test_claims_oldest_unleased_requests(self, session: AsyncSession) -> None:
+        repo = DataRequestRepository(session)
+        ids = await add_processing(session, 3)
+
+        first = await repo.claim("acme-corp", 100, timedelta(minutes=1))
+        second = await repo.claim("acme-corp", 100, timedelta(minutes=1))
+
+        assert claimed_ids(first)[-3:] == ids
+        assert claimed_ids(first) == sorted(claimed_ids(first))
+        assert {claim.attempt for claim in first} == {1}
+        assert first[-1].data_request.status is Status.PROCESSING
+        assert second == []
+
+    @pytest.mark.asyncio
+    async def test_only_claims_the_requested_source(
+        self, session: AsyncSession
+    ) -> None:
+        await add_processing(session, 1)
+
+        claims = await DataRequestRepository(session).claim(
+            "globex-inc", 100, timedelta(minutes=1)
+        )
+
+        assert {claim.data_request.request_source_id for claim in claims} <= {
+            "globex-inc"
+        }
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_claimed_again(self, session: AsyncSession) -> None:
+        repo = DataRequestRepository(session)
+        ids = await add_processing(session, 1)
+        first = await repo.claim("acme-corp", 100, timedelta(0))
+
+        second = await repo.claim("acme-corp", 100, timedelta(minutes=1))
+
+        assert claimed_ids(second) == claimed_ids(first)
+        claim = next(claim for claim in second if claim.data_request.id == ids[0])
+        assert claim.attempt == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_claims_skip_each_other(self) -> None:
+        async with open_session() as first, open_session() as second:
+            ids = await add_processing(first, 2)
+            await first.commit()
+            try:
+                claimed = await DataRequestRepository(first).claim(
+                    "acme-corp", 1, timedelta(minutes=1)
+                )
+
+                # The first claim is still open; a lock wait would time out.
+                await second.execute(text("SET LOCAL lock_timeout = '1s'"))
+                skipped = await DataRequestRepository(second).claim(
+                    "acme-corp", 1, timedelta(minutes=1)
+                )
+
+                assert claimed_ids(claimed) != claimed_ids(skipped)
+                await first.rollback()
+                await second.rollback()
+            finally:
+                await first.execute(
+                    text("DELETE FROM data_request WHERE id = ANY(:ids)"),
+                    {"ids": ids},
+                )
+                await first.commit()
+
+    @pytest.mark.asyncio
+    async def test_retry_delays_the_next_claim(self, session: AsyncSession) -> None:
+        repo = DataRequestRepository(session)
+        ids = await add_processing(session, 1)
+        claim = by_id(await repo.claim("acme-corp", 100, timedelta(0)))[ids[0]]
+
+        await repo.retry_processing({ids[0]: (claim.claim_id, 60.0)})
+        claims = await repo.claim("acme-corp", 100, timedelta(0))
+
+        assert ids[0] not in claimed_ids(claims)
+
+    @pytest.mark.asyncio
+    async def test_finish_skips_requests_that_left_processing(
+        self, session: AsyncSession
+    ) -> None:
+        repo = DataRequestRepository(session)
+        ids = await add_processing(session, 2)
+        claims = by_id(await repo.claim("acme-corp", 100, timedelta(minutes=1)))
+        await session.execute(
+            text("UPDATE data_request SET status = :review WHERE id = :id"),
+            {"review": Status.NEEDS_REVIEW, "id": ids[0]},
+        )
+
+        finished = await repo.finish_processing(
+            {id: (claims[id].claim_id, Status.COMPLETE) for id in ids}
+        )
+
+        assert finished == [ids[1]]
+        statuses = await session.execute(
+            text("SELECT status FROM data_request WHERE id = ANY(:ids) ORDER BY id"),
+            {"ids": ids},
+        )
+        assert statuses.scalars().all() == [Status.NEEDS_REVIEW, Status.COMPLETE]
+        leases = await session.execute(
+            text(
+                "SELECT count(*) FROM data_request_lease"
+                " WHERE data_request_id = ANY(:ids)"
+            ),
+            {"ids": ids},
+        )
+        assert leases.scalar_one() == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_results_do_not_touch_a_new_claim(
+        self, session: AsyncSession
+    ) -> None:
+        repo = DataRequestRepository(session)
+        ids = await add_processing(session, 2)
+        # The first worker's leases run out before it writes back, and
+        # another worker claims the requests again
+        first = by_id(await repo.claim("acme-corp", 100, timedelta(0)))
+        second = by_id(await repo.claim("acme-corp", 100, timedelta(minutes=1)))
+        assert [second[id].attempt for id in ids] == [2, 2]
+
+        finished = await repo.finish_processing(
+            {ids[0]: (first[ids[0]].claim_id, Status.COMPLETE)}
+        )
+        await repo.retry_processing({ids[1]: (first[ids[1]].claim_id, 0.0)})
+
+        assert finished == []
+        statuses = await session.execute(
+            text("SELECT status FROM data_request WHERE id = ANY(:ids) ORDER BY id"),
+            {"ids": ids},
+        )
+        assert statuses.scalars().all() == [Status.PROCESSING] * 2
+        # Both are still leased to the second worker, so no third one gets them
+        assert ids[0] not in claimed_ids(
+            await repo.claim("acme-corp", 100, timedelta(minutes=1))
+        )
+        assert ids[1] not in claimed_ids(
+            await repo.claim("acme-corp", 100, timedelta(minutes=1))
+        )
+
+        finished = await repo.finish_processing(
+            {ids[0]: (second[ids[0]].claim_id, Status.COMPLETE)}
+        )
+
+        assert finished == [ids[0]]
+
+    @pytest.mark.asyncio
+    async def test_status_change_restarts_attempts(self, session: AsyncSession) -> None:
+        repo = DataRequestRepository(session)
+        ids = await add_processing(session, 1)
+        first = by_id(await repo.claim("acme-corp", 100, timedelta(0)))[ids[0]]
+        await repo.retry_processing({ids[0]: (first.claim_id, 0.0)})
+        assert (
+            by_id(await repo.claim("acme-corp", 100, timedelta(0)))[ids[0]].attempt == 2
+        )
+
+        # A reviewer takes the request while it waits for a retry, then
+        # sends it back
+        await repo.change_status(Status.NEEDS_REVIEW, [Status.PROCESSING], ids=ids)
+        await repo.change_status(Status.PROCESSING, [Status.NEEDS_REVIEW], ids=ids)
+        claims = by_id(await repo.claim("acme-corp", 100, timedelta(minutes=1)))
+
+        assert claims[ids[0]].attempt == 1
+
+    @pytest.mark.asyncio
+    async def test_status_change_drops_the_result_in_progress(
+        self, session: AsyncSession
+    ) -> None:
+        repo = DataRequestRepository(session)
+        ids = await add_processing(session, 1)
+        first = by_id(await repo.claim("acme-corp", 100, timedelta(minutes=1)))[ids[0]]
+
+        # While a worker processes the request, a reviewer completes it,
+        # reopens it and sends it back, and another worker claims it
+        await repo.change_status(Status.COMPLETE, [Status.PROCESSING], ids=ids)
+        await repo.change_status(Status.NEEDS_REVIEW, [Status.COMPLETE], ids=ids)
+        await repo.change_status(Status.PROCESSING, [Status.NEEDS_REVIEW], ids=ids)
+        second = by_id(await repo.claim("acme-corp", 100, timedelta(minutes=1)))[ids[0]]
+        finished = await repo.finish_processing(
+            {ids[0]: (first.claim_id, Status.NEEDS_REVIEW)}
+        )
+
+        assert second.attempt == 1
+        assert finished == []
+        assert await repo.finish_processing(
+            {ids[0]: (second.claim_id, Status.COMPLETE)}
+        ) == [ids[0]]
+
+
+async def count_directly(
+    session: AsyncSession,
+) -> tuple[dict[int, int], dict[str, int]]:
+    """Count data requests by status and by request source the slow way."""
+    by_status = await session.execute(
+        text("SELECT status, COUNT(*) FROM data_request GROUP BY status")
+    )
+    by_source = await session.execute(
+        text(
+            "SELECT request_source_id, COUNT(*) FROM data_request"
+            " GROUP BY request_source_id"
+        )
+    )
+    return dict(by_status.tuples().all()), dict(by_source.tuples().all())
+
+
+def summary_counts(
+    summary: DataRequestSummary,
+) -> tuple[dict[int, int], dict[str, int]]:
+    """The non-zero counts of a summary, keyed like count_directly's."""
+    return (
+        {sc.status: sc.count for sc in summary.by_status if sc.count},
+        {rc.request_source_id: rc.count for rc in summary.by_request_source},
+    )
+
+
+class TestDataRequestRepositorySummary:
+    """Integration tests for DataRequestRepository.get_summary."""
+
+    @pytest.mark.asyncio
+    async def test_summary_lists_every_status(self, session: AsyncSession) -> None:
+        summary = await DataRequestRepository(session).get_summary()
+
+        assert [sc.status for sc in summary.by_status] == list(Status)
+        assert summary.total == sum(sc.count for sc in summary.by_status)
+        assert summary.total == sum(rc.count for rc in summary.by_request_source)
+        assert summary_counts(summary) == await count_directly(session)
+
+    @pytest.mark.asyncio
+    async def test_writes_update_the_counts_in_their_transaction(
+        self, session: AsyncSession
+    ) -> None:
+        repo = DataRequestRepository(session)
+        before = await repo.get_summary()
+        people = await PersonRepository(session).get_by_ids([1, 2])
+
+        await repo.create(people[1], "acme-corp", "test@example.com")
+        await repo.create_many(
+            [(people[2], "globex-inc")] * 3, created_by="test@example.com"
+        )
+        await session.execute(
+            text(
+                "UPDATE data_request SET status = :complete"
+                " WHERE request_source_id = 'globex-inc'"
+            ),
+            {"complete": Status.COMPLETE},
+        )
+        await session.execute(
+            text(
+                "DELETE FROM data_request WHERE created_by = 'test@example.com'"
+                " AND request_source_id = 'acme-corp'"
+            )
+        )
+        after = await repo.get_summary()
+
+        assert after.total == before.total + 3
+        assert summary_counts(after) == await count_directly(session)
+
+    @pytest.mark.asyncio
+    async def test_reconcile_repairs_drifted_counts(
+        self, session: AsyncSession
+    ) -> None:
+        repo = DataRequestRepository(session)
+        await session.execute(text("UPDATE data_request_count SET count = count + 5"))
+        assert summary_counts(await repo.get_summary()) != await count_directly(session)
+
+        await session.execute(text("SELECT reconcile_data_request_count()"))
+
+        assert summary_counts(await repo.get_summary()) == await count_directly(session)
+        rows = await session.execute(
+            text("SELECT DISTINCT backend_pid FROM data_request_count")
+        )
+        assert rows.scalars().all() == [0]
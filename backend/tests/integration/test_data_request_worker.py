@@ -0,0 +1,184 @@
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+from sqlalchemy import text
+
+from core.data_request import (
+    DataRequest,
+    DataRequestWorker,
+    FakeConnector,
+    SourceHandler,
+    Status,
+    data_request_worker,
+)
+from core.database import open_session
+
+REQUEST_SOURCE_ID = "worker-test"
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(data_request_worker, "POLL_INTERVAL_SECONDS", 0.05)
+    monkeypatch.setattr(data_request_worker, "FLUSH_INTERVAL_SECONDS", 0.05)
+
+
+@pytest.fixture
+async def request_ids() -> AsyncIterator[list[int]]:
+    """Twenty PROCESSING requests of a source of their own, deleted afterwards."""
+    async with open_session() as session:
+        await session.execute(
+            text(
+                "INSERT INTO request_source (id, name)"
+                " VALUES (:id, 'Worker test') ON CONFLICT DO NOTHING"
+            ),
+            {"id": REQUEST_SOURCE_ID},
+        )
+        result = await session.execute(
+            text(
+                """
+                INSERT INTO data_request (person_id, first_name, last_name,
+                    date_of_birth, status, created_on, created_by,
+                    request_source_id)
+                SELECT 1, 'John', 'Smith', '1985-03-15', :processing, now(),
+                    'worker-test@example.com', :id
+                FROM generate_series(1, 20)
+                RETURNING id
+                """
+            ),
+            {"processing": Status.PROCESSING, "id": REQUEST_SOURCE_ID},
+        )
+        ids = sorted(result.scalars())
+        await session.commit()
+    yield ids
+    async with open_session() as session:
+        await session.execute(
+            text("DELETE FROM data_request WHERE request_source_id = :id"),
+            {"id": REQUEST_SOURCE_ID},
+        )
+        await session.execute(
+            text("DELETE FROM request_source WHERE id = :id"),
+            {"id": REQUEST_SOURCE_ID},
+        )
+        await session.commit()
+
+
+async def statuses(ids: list[int]) -> list[Status]:
+    async with open_session() as session:
+        result = await session.execute(
+            text("SELECT status FROM data_request WHERE id = ANY(:ids) ORDER BY id"),
+            {"ids": ids},
+        )
+        return [Status(status) for status in result.scalars()]
+
+
+async def run_until_processed(ids: list[int], *workers: DataRequestWorker) -> None:
+    """Run the workers until none of the requests is PROCESSING, then stop them."""
+    running = [asyncio.create_task(worker.run()) for worker in workers]
+    try:
+        async with asyncio.timeout(10):
+            while Status.PROCESSING in await statuses(ids):
+                await asyncio.sleep(0.05)
+    finally:
+        for worker in workers:
+            worker.stop()
+        await asyncio.gather(*running)
+
+
+class FailingOnce:
+    """Fails the first attempt at each request by taking too long."""
+
+    def __init__(self) -> None:
+        self.attempted: set[int] = set()
+
+    async def process(self, data_request: DataRequest) -> Status:
+        if data_request.id not in self.attempted:
+            self.attempted.add(data_request.id)
+            await asyncio.sleep(10)
+        return Status.COMPLETE
+
+
+class TestDataRequestWorker:
+    """Integration tests for processing data requests in the background."""
+
+    @pytest.mark.asyncio
+    async def test_processes_every_request(self, request_ids: list[int]) -> None:
+        connector = FakeConnector(latency_seconds=0.01, review_rate=0.5, seed=1)
+        worker = DataRequestWorker(
+            {REQUEST_SOURCE_ID: SourceHandler(connector, concurrency=4)}
+        )
+
+        await run_until_processed(request_ids, worker)
+
+        assert sorted(connector.processed) == request_ids
+        assert set(await statuses(request_ids)) == {
+            Status.COMPLETE,
+            Status.NEEDS_REVIEW,
+        }
+        assert worker.stats.completed + worker.stats.needs_review == 20
+        assert worker.stats.flushes < 20
+
+    @pytest.mark.asyncio
+    async def test_timed_out_requests_are_retried(self, request_ids: list[int]) -> None:
+        handler = SourceHandler(
+            FailingOnce(), concurrency=20, timeout_seconds=0.05, retry_delay_seconds=0
+        )
+        worker = DataRequestWorker({REQUEST_SOURCE_ID: handler})
+
+        await run_until_processed(request_ids, worker)
+
+        assert await statuses(request_ids) == [Status.COMPLETE] * 20
+        assert worker.stats.retried == 20
+
+    @pytest.mark.asyncio
+    async def test_requests_that_keep_failing_need_review(
+        self, request_ids: list[int]
+    ) -> None:
+        handler = SourceHandler(
+            FakeConnector(latency_seconds=0, failure_rate=1),
+            concurrency=20,
+            max_attempts=2,
+            retry_delay_seconds=0,
+        )
+        worker = DataRequestWorker({REQUEST_SOURCE_ID: handler})
+
+        await run_until_processed(request_ids, worker)
+
+        assert await statuses(request_ids) == [Status.NEEDS_REVIEW] * 20
+        assert worker.stats.retried == 20
+        assert worker.stats.needs_review == 20
+
+    @pytest.mark.asyncio
+    async def test_workers_do_not_process_a_request_twice(
+        self, request_ids: list[int]
+    ) -> None:
+        connectors = [FakeConnector(latency_seconds=0.01, seed=n) for n in range(3)]
+        workers = [
+            DataRequestWorker(
+                {REQUEST_SOURCE_ID: SourceHandler(connector, concurrency=2)}
+            )
+            for connector in connectors
+        ]
+
+        await run_until_processed(request_ids, *workers)
+
+        processed = [id for connector in connectors for id in connector.processed]
+        assert sorted(processed) == request_ids
+
+    @pytest.mark.asyncio
+    async def test_stop_writes_back_requests_in_progress(
+        self, request_ids: list[int]
+    ) -> None:
+        connector = FakeConnector(latency_seconds=0.2)
+        worker = DataRequestWorker(
+            {REQUEST_SOURCE_ID: SourceHandler(connector, concurrency=5)}
+        )
+        running = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.1)
+
+        worker.stop()
+        await running
+
+        assert await statuses(request_ids) == (
+            [Status.COMPLETE] * 5 + [Status.PROCESSING] * 15
+        )
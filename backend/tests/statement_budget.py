@@ -0,0 +1,47 @@
+"""Pytest plugin that fails tests running more SQL statements than budgeted.
+
+Mark a test with ``@pytest.mark.statement_budget(n)`` to fail it when the
+code it drives, including requests made through an in-process client,
+runs more than ``n`` statements. The failure lists the statements by
+shape, so an N+1 query shows up as one shape run many times.
+"""
+
+from typing import Iterator
+
+import pytest
+
+from core.database import on_engine_created
+from core.query_log import QueryLog, capture, log_queries
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "statement_budget(n): fail if the test runs more than n SQL statements",
+    )
+    on_engine_created(lambda engine, name: log_queries(engine))
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    for item in items:
+        if item.get_closest_marker("statement_budget") and isinstance(
+            item, pytest.Function
+        ):
+            item.fixturenames.append("statement_budget")
+
+
+@pytest.fixture
+def statement_budget(request: pytest.FixtureRequest) -> Iterator[QueryLog]:
+    """The statements a ``statement_budget`` test runs, checked at teardown."""
+    budget = request.node.get_closest_marker("statement_budget").args[0]
+    with capture() as log:
+        yield log
+
+    if len(log.records) > budget:
+        counts = log.repeated(0)
+        details = "\n".join(f"  {count}× {shape}" for shape, count in counts.items())
+        pytest.fail(
+            f"Ran {len(log.records)} SQL statements, over the budget of {budget}:\n"
+            f"{details}",
+            pytrace=False,
+        )
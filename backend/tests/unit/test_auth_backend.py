@@ -0,0 +1,118 @@
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi_users.db import SQLAlchemyUserDatabase
+
+from core.auth import CachingJWTStrategy, User
+from core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCachingJWTStrategy:
+    """Unit tests for the verified-token cache in front of user lookups."""
+
+    @pytest.fixture
+    def user(self) -> User:
+        return User(id=uuid.uuid4(), email="test@example.com", is_active=True)
+
+    @pytest.fixture
+    def user_manager(self, user: User) -> MagicMock:
+        """Mock UserManager whose database session merges without loading."""
+        manager = MagicMock()
+        manager.parse_id = uuid.UUID
+        manager.get = AsyncMock(return_value=user)
+        manager.user_db = MagicMock(spec=SQLAlchemyUserDatabase)
+        manager.user_db.session = MagicMock()
+        manager.user_db.session.merge = AsyncMock(side_effect=lambda u, load: u)
+        return manager
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def strategy(
+        self, clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+    ) -> CachingJWTStrategy:
+        """Strategy issuing 30s tokens, with a fresh 60s cache."""
+        cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=10, ttl=60, clock=clock)
+        monkeypatch.setattr(CachingJWTStrategy, "cache", cache)
+        return CachingJWTStrategy(secret="test-secret", lifetime_seconds=30)
+
+    @pytest.mark.asyncio
+    async def test_cached_token_skips_user_lookup(
+        self, strategy: CachingJWTStrategy, user_manager: MagicMock, user: User
+    ) -> None:
+        token = await strategy.write_token(user)
+
+        assert await strategy.read_token(token, user_manager) is user
+        cached = await strategy.read_token(token, user_manager)
+
+        user_manager.get.assert_awaited_once_with(user.id)
+        user_manager.user_db.session.merge.assert_awaited_once_with(cached, load=False)
+        # A copy is merged, so the session that loaded the user cannot
+        # expire what later requests see
+        assert cached is not None and cached is not user
+        assert (cached.id, cached.email, cached.is_active) == (
+            user.id,
+            user.email,
+            user.is_active,
+        )
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_with_the_token(
+        self,
+        strategy: CachingJWTStrategy,
+        user_manager: MagicMock,
+        user: User,
+        clock: FakeClock,
+    ) -> None:
+        token = await strategy.write_token(user)
+        await strategy.read_token(token, user_manager)
+
+        # The token lives 30s, less than the cache's 60s ttl.
+        clock.now += 31
+        await strategy.read_token(token, user_manager)
+
+        assert user_manager.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_tokens_are_rejected_and_not_cached(
+        self, strategy: CachingJWTStrategy, user_manager: MagicMock
+    ) -> None:
+        assert await strategy.read_token("not-a-jwt", user_manager) is None
+        assert await strategy.read_token(None, user_manager) is None
+
+        user_manager.get.assert_not_awaited()
+        assert len(strategy.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_rejected(
+        self, strategy: CachingJWTStrategy, user_manager: MagicMock, user: User
+    ) -> None:
+        strategy.lifetime_seconds = -1
+        token = await strategy.write_token(user)
+
+        assert await strategy.read_token(token, user_manager) is None
+        assert len(strategy.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forgets_every_token(
+        self, strategy: CachingJWTStrategy, user_manager: MagicMock, user: User
+    ) -> None:
+        token = await strategy.write_token(user)
+        await strategy.read_token(token, user_manager)
+
+        CachingJWTStrategy.invalidate()
+        await strategy.read_token(token, user_manager)
+
+        assert user_manager.get.await_count == 2
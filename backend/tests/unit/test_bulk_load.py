@@ -0,0 +1,88 @@
+import json
+import random
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from core.data_request import Status
+from db.bulk_load import (
+    DATA_REQUEST_COLUMNS,
+    SyntheticPeople,
+    generate_data_requests,
+    iter_records,
+)
+
+RECORDS = [
+    {"id": "1", "name": "Acme"},
+    {"id": "2", "name": "Globex, Inc."},
+]
+
+
+class TestIterRecords:
+    """Unit tests for reading records from load files."""
+
+    def test_reads_json_array(self, tmp_path: Path):
+        path = tmp_path / "sources.json"
+        path.write_text(json.dumps(RECORDS))
+
+        assert list(iter_records(path)) == RECORDS
+
+    def test_reads_ndjson_skipping_blank_lines(self, tmp_path: Path):
+        path = tmp_path / "sources.ndjson"
+        path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n\n")
+
+        assert list(iter_records(path)) == RECORDS
+
+    def test_reads_csv_with_header(self, tmp_path: Path):
+        path = tmp_path / "sources.csv"
+        path.write_text('id,name\n1,Acme\n2,"Globex, Inc."\n')
+
+        assert list(iter_records(path)) == RECORDS
+
+    def test_rejects_unknown_file_type(self, tmp_path: Path):
+        path = tmp_path / "sources.xml"
+        path.write_text("")
+
+        with pytest.raises(ValueError):
+            list(iter_records(path))
+
+
+class TestSyntheticData:
+    """Unit tests for the synthetic people and data request generators."""
+
+    def test_people_have_consecutive_ids(self):
+        people = SyntheticPeople(50, 101, random.Random(0))
+
+        rows = list(people.rows())
+
+        assert len(rows) == 50
+        assert [row[0] for row in rows] == list(range(101, 151))
+
+    def test_generates_requested_rows_and_ids(self):
+        rng = random.Random(0)
+        people = SyntheticPeople(20, 1, rng)
+
+        rows = list(generate_data_requests(500, 1000, people, ["a", "b"], rng))
+
+        assert len(rows) == 500
+        assert [row[0] for row in rows] == list(range(1000, 1500))
+        assert all(len(row) == len(DATA_REQUEST_COLUMNS) for row in rows)
+
+    def test_requests_copy_their_persons_details(self):
+        rng = random.Random(0)
+        people = SyntheticPeople(20, 1, rng)
+        people_by_id = {row[0]: row for row in people.rows()}
+
+        for row in generate_data_requests(200, 1, people, ["a", "b"], rng):
+            request = dict(zip(DATA_REQUEST_COLUMNS, row))
+            person = people_by_id[request["person_id"]]
+            assert (
+                request["person_id"],
+                request["first_name"],
+                request["last_name"],
+                request["date_of_birth"],
+            ) == person
+            assert isinstance(request["date_of_birth"], date)
+            assert request["status"] in set(Status)
+            assert request["request_source_id"] in ("a", "b")
@@ -0,0 +1,186 @@
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.cache import CacheStats, TTLCache
+from core.person import CachedPersonRepository, Person, PersonRepository
+from core.repository import Page
+from core.request_source import (
+    CachedRequestSourceRepository,
+    RequestSource,
+    RequestSourceRepository,
+)
+
+
+class FakeClock:
+    """Manually advanced clock for expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Unit tests for the TTL/LRU cache."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock: FakeClock) -> TTLCache[str, int]:
+        return TTLCache(maxsize=2, ttl=10, clock=clock)
+
+    def test_get_after_set(self, cache: TTLCache[str, int]) -> None:
+        """Test that a stored entry is returned and counted as a hit."""
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats() == CacheStats(hits=1, misses=1, size=1, maxsize=2)
+
+    def test_entries_expire(self, cache: TTLCache[str, int], clock: FakeClock) -> None:
+        """Test that entries are gone once their TTL has passed."""
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert cache.get("a") == 1
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_cannot_exceed_default(
+        self, cache: TTLCache[str, int], clock: FakeClock
+    ) -> None:
+        """Test that a per-entry TTL can shorten but not extend expiry."""
+        cache.set("short", 1, ttl=2)
+        cache.set("long", 2, ttl=100)
+        clock.now = 5
+
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+    def test_expired_ttl_is_not_stored(self, cache: TTLCache[str, int]) -> None:
+        """Test that an entry with no time left is not cached at all."""
+        cache.set("a", 1, ttl=0)
+
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, cache: TTLCache[str, int]) -> None:
+        """Test that the entry used longest ago is evicted when full."""
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_invalidate_and_clear(self, cache: TTLCache[str, int]) -> None:
+        """Test that entries can be dropped one by one or all at once."""
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestCachedPersonRepository:
+    """Unit tests for serving person lookups from the cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self) -> None:
+        CachedPersonRepository.cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_skips_database(self) -> None:
+        """Test that a cached person is returned without a query."""
+        person = Person(
+            id=1, first_name="John", last_name="Smith", date_of_birth=date(1985, 3, 15)
+        )
+        repo = CachedPersonRepository(MagicMock())
+
+        with patch.object(
+            PersonRepository, "get_by_id", AsyncMock(return_value=person)
+        ) as get_by_id:
+            assert await repo.get_by_id(1) == person
+            assert await repo.get_by_id(1) == person
+
+        get_by_id.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_missing_person_is_not_cached(self) -> None:
+        """Test that a failed lookup is retried on the next call."""
+        repo = CachedPersonRepository(MagicMock())
+
+        with patch.object(
+            PersonRepository, "get_by_id", AsyncMock(return_value=None)
+        ) as get_by_id:
+            assert await repo.get_by_id(9999) is None
+            assert await repo.get_by_id(9999) is None
+
+        assert get_by_id.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self) -> None:
+        """Test that an invalidated person is loaded again."""
+        person = Person(
+            id=1, first_name="John", last_name="Smith", date_of_birth=date(1985, 3, 15)
+        )
+        repo = CachedPersonRepository(MagicMock())
+
+        with patch.object(
+            PersonRepository, "get_by_id", AsyncMock(return_value=person)
+        ) as get_by_id:
+            await repo.get_by_id(1)
+            CachedPersonRepository.invalidate(1)
+            await repo.get_by_id(1)
+
+        assert get_by_id.call_count == 2
+
+
+class TestCachedRequestSourceRepository:
+    """Unit tests for serving request sources from the cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self) -> None:
+        CachedRequestSourceRepository.cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_pages_are_cached_per_limit_and_cursor(self) -> None:
+        """Test that each distinct page is loaded once."""
+        page = Page(items=[RequestSource(id="acme-corp", name="Acme Corporation")])
+        repo = CachedRequestSourceRepository(MagicMock())
+
+        with patch.object(
+            RequestSourceRepository, "get_page", AsyncMock(return_value=page)
+        ) as get_page:
+            assert await repo.get_page() == page
+            assert await repo.get_page() == page
+            await repo.get_page(limit=1)
+
+        assert get_page.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_clears_everything(self) -> None:
+        """Test that invalidating reloads pages and single sources."""
+        source = RequestSource(id="acme-corp", name="Acme Corporation")
+        repo = CachedRequestSourceRepository(MagicMock())
+
+        with patch.object(
+            RequestSourceRepository, "get_by_id", AsyncMock(return_value=source)
+        ) as get_by_id:
+            await repo.get_by_id("acme-corp")
+            CachedRequestSourceRepository.invalidate()
+            await repo.get_by_id("acme-corp")
+
+        assert get_by_id.call_count == 2
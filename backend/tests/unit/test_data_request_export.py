@@ -0,0 +1,89 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import AsyncIterator
+
+import pytest
+
+from core.data_request import DataRequest, ExportFormat, Status, encode_export
+
+
+def make_data_request(id: int) -> DataRequest:
+    """Create a sample data request with the given id."""
+    return DataRequest(
+        id=id,
+        person_id=1,
+        first_name="John",
+        last_name="Smith, Jr.",
+        date_of_birth=date(1985, 3, 15),
+        status=Status.PROCESSING,
+        created_on=datetime(2024, 1, 15, 9, 30, 0),
+        created_by="test@example.com",
+        request_source_id="acme-corp",
+    )
+
+
+async def chunks_of(*chunks: list[DataRequest]) -> AsyncIterator[list[DataRequest]]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def encode(
+    export_format: ExportFormat, *chunks: list[DataRequest]
+) -> list[bytes]:
+    return [chunk async for chunk in encode_export(chunks_of(*chunks), export_format)]
+
+
+class TestEncodeExport:
+    """Unit tests for encoding data request exports."""
+
+    @pytest.mark.asyncio
+    async def test_ndjson_writes_one_object_per_line(self) -> None:
+        """Test that NDJSON output has one JSON object per data request."""
+        output = await encode(
+            ExportFormat.NDJSON,
+            [make_data_request(1), make_data_request(2)],
+            [make_data_request(3)],
+        )
+
+        assert len(output) == 2
+        lines = b"".join(output).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        assert [row["id"] for row in rows] == [1, 2, 3]
+        assert rows[0] == {
+            "id": 1,
+            "person_id": 1,
+            "first_name": "John",
+            "last_name": "Smith, Jr.",
+            "date_of_birth": "1985-03-15",
+            "status": 2,
+            "created_on": "2024-01-15T09:30:00",
+            "created_by": "test@example.com",
+            "request_source_id": "acme-corp",
+        }
+
+    @pytest.mark.asyncio
+    async def test_csv_writes_header_then_rows(self) -> None:
+        """Test that CSV output starts with a header and quotes values."""
+        output = await encode(ExportFormat.CSV, [make_data_request(1)])
+
+        rows = list(csv.reader(io.StringIO(b"".join(output).decode())))
+        assert rows[0][0] == "id"
+        assert rows[1] == [
+            "1",
+            "1",
+            "John",
+            "Smith, Jr.",
+            "1985-03-15",
+            "2",
+            "2024-01-15T09:30:00",
+            "test@example.com",
+            "acme-corp",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_export(self) -> None:
+        """Test that an empty export is empty NDJSON or a bare CSV header."""
+        assert await encode(ExportFormat.NDJSON) == []
+        assert len(await encode(ExportFormat.CSV)) == 1
@@ -0,0 +1,145 @@
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from core.data_request import (
+    ChangeOp,
+    ChangeSubscription,
+    DataRequest,
+    DataRequestChange,
+    DataRequestFilter,
+    Resync,
+    Status,
+    encode_event,
+)
+
+
+def make_data_request(id: int, status: Status = Status.PROCESSING) -> DataRequest:
+    """Create a sample data request with the given id and status."""
+    return DataRequest(
+        id=id,
+        person_id=1,
+        first_name="John",
+        last_name="Smith",
+        date_of_birth=date(1985, 3, 15),
+        status=status,
+        created_on=datetime(2024, 1, 15, 9, 30, 0),
+        created_by="test@example.com",
+        request_source_id="acme-corp",
+    )
+
+
+def insert(id: int, status: Status = Status.PROCESSING) -> DataRequestChange:
+    return DataRequestChange(ChangeOp.INSERT, make_data_request(id, status))
+
+
+def buffered(subscription: ChangeSubscription) -> list:
+    """Take every event out of a subscription's buffer."""
+    events = []
+    while not subscription._events.empty():
+        events.append(subscription._events.get_nowait())
+    return events
+
+
+class TestDataRequestFilterMatches:
+    """Unit tests for matching data requests against filters in memory."""
+
+    def test_empty_filter_matches_everything(self) -> None:
+        assert DataRequestFilter().matches(make_data_request(1))
+
+    @pytest.mark.parametrize(
+        "filters, expected",
+        [
+            (DataRequestFilter(status=2), True),
+            (DataRequestFilter(status=3), False),
+            (DataRequestFilter(status_in=[1, 2]), True),
+            (DataRequestFilter(status_in=[3, 99]), False),
+            (DataRequestFilter(request_source_id="globex-inc"), False),
+            (DataRequestFilter(person_id=1, created_by="test@example.com"), True),
+            (DataRequestFilter(created_from=datetime(2024, 1, 15, 9, 30)), True),
+            (DataRequestFilter(created_to=datetime(2024, 1, 15, 9, 30)), False),
+        ],
+    )
+    def test_filters(self, filters: DataRequestFilter, expected: bool) -> None:
+        assert filters.matches(make_data_request(1)) is expected
+
+    def test_aware_datetimes_compare_in_utc(self) -> None:
+        plus_two = timezone(timedelta(hours=2))
+        filters = DataRequestFilter(
+            created_from=datetime(2024, 1, 15, 11, 0, tzinfo=plus_two)
+        )
+
+        assert filters.matches(make_data_request(1))
+
+
+class TestChangeSubscription:
+    """Unit tests for buffering changes for one subscriber."""
+
+    def test_buffers_matching_changes(self) -> None:
+        subscription = ChangeSubscription(DataRequestFilter(status=2), 10)
+
+        subscription.publish(insert(1))
+        subscription.publish(insert(2, Status.COMPLETE))
+
+        assert buffered(subscription) == [insert(1)]
+
+    def test_update_matches_on_the_previous_row(self) -> None:
+        subscription = ChangeSubscription(DataRequestFilter(status=2), 10)
+        completed = DataRequestChange(
+            ChangeOp.UPDATE,
+            make_data_request(1, Status.COMPLETE),
+            previous=make_data_request(1, Status.PROCESSING),
+        )
+
+        subscription.publish(completed)
+
+        assert buffered(subscription) == [completed]
+
+    def test_resync_is_sent_whatever_the_filters(self) -> None:
+        subscription = ChangeSubscription(DataRequestFilter(status=3), 10)
+
+        subscription.publish(Resync("bulk"))
+
+        assert buffered(subscription) == [Resync("bulk")]
+
+    def test_overflow_replaces_the_backlog_with_resync(self) -> None:
+        subscription = ChangeSubscription(DataRequestFilter(), 3)
+
+        for id in range(1, 6):
+            subscription.publish(insert(id))
+
+        assert buffered(subscription) == [Resync("overflow"), insert(5)]
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_the_next_event(self) -> None:
+        subscription = ChangeSubscription(DataRequestFilter(), 3)
+        subscription.publish(insert(1))
+
+        assert await subscription.get() == insert(1)
+
+
+class TestEncodeEvent:
+    """Unit tests for encoding change events as Server-Sent Events."""
+
+    def test_change(self) -> None:
+        change = DataRequestChange(
+            ChangeOp.UPDATE,
+            make_data_request(1, Status.COMPLETE),
+            previous=make_data_request(1, Status.NEEDS_REVIEW),
+        )
+
+        message = encode_event(change)
+
+        event, data, blank, end = message.split(b"\n")
+        assert event == b"event: change"
+        assert (blank, end) == (b"", b"")
+        payload = json.loads(data.removeprefix(b"data: "))
+        assert payload["op"] == "update"
+        assert payload["data_request"]["status"] == 99
+        assert payload["previous"]["status"] == 3
+
+    def test_resync(self) -> None:
+        assert encode_event(Resync("overflow")) == (
+            b'event: resync\ndata: {"reason":"overflow"}\n\n'
+        )
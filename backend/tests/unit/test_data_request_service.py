@@ -4,12 +4,16 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from core.data_request import (
+    BulkCreateFailure,
     DataRequest,
     DataRequestService,
+    InvalidStatusChangeError,
+    NewDataRequest,
     PersonNotFoundError,
     Status,
 )
 from core.person import Person
+from core.request_source import RequestSource
 
 
 class TestDataRequestService:
@@ -160,6 +164,159 @@ class TestDataRequestService:
         )
 
 
+class TestCreateDataRequests:
+    """Unit tests for DataRequestService.create_data_requests."""
+
+    @pytest.fixture
+    def people(self) -> dict[int, Person]:
+        """People known to the mocked person repository."""
+        return {
+            1: Person(
+                id=1,
+                first_name="John",
+                last_name="Smith",
+                date_of_birth=date(1985, 3, 15),
+            ),
+            2: Person(
+                id=2,
+                first_name="Sarah",
+                last_name="Johnson",
+                date_of_birth=date(1990, 7, 22),
+            ),
+        }
+
+    @pytest.fixture
+    def get_people(self, people: dict[int, Person]) -> AsyncMock:
+        """Mock PersonRepository.get_by_ids returning the sample people."""
+        return AsyncMock(return_value=people)
+
+    @pytest.fixture
+    def create_many(self) -> AsyncMock:
+        """Mock DataRequestRepository.create_many."""
+        return AsyncMock(return_value=[])
+
+    @pytest.fixture
+    def service(
+        self, get_people: AsyncMock, create_many: AsyncMock
+    ) -> DataRequestService:
+        """Create a DataRequestService with mocked bulk lookups."""
+        person_repo = MagicMock()
+        person_repo.get_by_ids = get_people
+        request_source_repo = MagicMock()
+        request_source_repo.get_by_ids = AsyncMock(
+            return_value={
+                "acme-corp": RequestSource(id="acme-corp", name="Acme Corporation")
+            }
+        )
+        data_request_repo = MagicMock()
+        data_request_repo.create_many = create_many
+        return DataRequestService(data_request_repo, person_repo, request_source_repo)
+
+    @pytest.mark.asyncio
+    async def test_valid_items_are_created_in_one_call(
+        self,
+        service: DataRequestService,
+        people: dict[int, Person],
+        get_people: AsyncMock,
+        create_many: AsyncMock,
+    ) -> None:
+        """Test that all people are looked up once and created together."""
+        await service.create_data_requests(
+            [
+                NewDataRequest(person_id=1, request_source_id="acme-corp"),
+                NewDataRequest(person_id=2, request_source_id="acme-corp"),
+                NewDataRequest(person_id=1, request_source_id="acme-corp"),
+            ],
+            created_by="test@example.com",
+        )
+
+        get_people.assert_called_once_with([1, 2, 1])
+        create_many.assert_called_once_with(
+            [
+                (people[1], "acme-corp"),
+                (people[2], "acme-corp"),
+                (people[1], "acme-corp"),
+            ],
+            created_by="test@example.com",
+        )
+
+    @pytest.mark.asyncio
+    async def test_missing_references_are_reported_not_raised(
+        self,
+        service: DataRequestService,
+        people: dict[int, Person],
+        create_many: AsyncMock,
+    ) -> None:
+        """Test that bad items fail individually without aborting the batch."""
+        result = await service.create_data_requests(
+            [
+                NewDataRequest(person_id=9999, request_source_id="acme-corp"),
+                NewDataRequest(person_id=1, request_source_id="acme-corp"),
+                NewDataRequest(person_id=2, request_source_id="no-such-source"),
+            ],
+        )
+
+        assert result.failed == [
+            BulkCreateFailure(
+                index=0,
+                person_id=9999,
+                request_source_id="acme-corp",
+                error="Person with id 9999 not found",
+            ),
+            BulkCreateFailure(
+                index=2,
+                person_id=2,
+                request_source_id="no-such-source",
+                error="Request source with id no-such-source not found",
+            ),
+        ]
+        create_many.assert_called_once_with(
+            [(people[1], "acme-corp")], created_by="demo_user"
+        )
+
+
+class TestChangeStatus:
+    """Unit tests for DataRequestService.change_status."""
+
+    @pytest.fixture
+    def change_status(self) -> AsyncMock:
+        """Mock DataRequestRepository.change_status updating ids 1 and 3."""
+        return AsyncMock(return_value=[1, 3])
+
+    @pytest.fixture
+    def service(self, change_status: AsyncMock) -> DataRequestService:
+        """Create a DataRequestService with a mocked status update."""
+        data_request_repo = MagicMock()
+        data_request_repo.change_status = change_status
+        return DataRequestService(data_request_repo, MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_ids_not_updated_are_skipped(
+        self, service: DataRequestService, change_status: AsyncMock
+    ) -> None:
+        """Test that one update is made and the other ids reported skipped."""
+        result = await service.change_status(Status.COMPLETE, ids=[3, 2, 1, 2, 4])
+
+        change_status.assert_called_once_with(
+            Status.COMPLETE,
+            [Status.PROCESSING, Status.NEEDS_REVIEW],
+            ids=[3, 2, 1, 2, 4],
+            filters=None,
+        )
+        assert result.updated == [1, 3]
+        assert result.skipped == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test_no_status_can_change_to_created(
+        self, service: DataRequestService, change_status: AsyncMock
+    ) -> None:
+        """Test that a status no change leads to is refused up front."""
+        with pytest.raises(InvalidStatusChangeError):
+            await service.change_status(Status.CREATED, ids=[1])
+
+        change_status.assert_not_called()
+
+
 class TestStatus:
     """Unit tests for the Status enum."""
 
@@ -0,0 +1,76 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from core.data_request import (
+    DataRequest,
+    FakeConnector,
+    FakeConnectorError,
+    SourceHandler,
+    Status,
+)
+from core.data_request.data_request_worker import (
+    FLUSH_INTERVAL_SECONDS,
+    LEASE_MARGIN_SECONDS,
+)
+
+DATA_REQUEST = DataRequest(
+    id=1,
+    person_id=1,
+    first_name="John",
+    last_name="Smith",
+    date_of_birth=date(1985, 3, 15),
+    status=Status.PROCESSING,
+    created_on=datetime(2024, 1, 15, 9, 30, 0),
+    created_by="test@example.com",
+    request_source_id="acme-corp",
+)
+
+
+class TestSourceHandler:
+    """Unit tests for the retry and lease timing of a source handler."""
+
+    def test_retry_delay_doubles_up_to_the_maximum(self) -> None:
+        handler = SourceHandler(
+            FakeConnector(), retry_delay_seconds=1, max_retry_delay_seconds=5
+        )
+
+        assert [handler.retry_delay(attempt) for attempt in range(1, 6)] == [
+            1,
+            2,
+            4,
+            5,
+            5,
+        ]
+
+    def test_lease_outlasts_the_timeout_and_write_back(self) -> None:
+        handler = SourceHandler(FakeConnector(), timeout_seconds=10)
+
+        assert handler.lease == timedelta(
+            seconds=10 + FLUSH_INTERVAL_SECONDS + LEASE_MARGIN_SECONDS
+        )
+
+
+class TestFakeConnector:
+    """Unit tests for the fake request source connector."""
+
+    @pytest.mark.asyncio
+    async def test_completes_and_records_requests(self) -> None:
+        connector = FakeConnector(latency_seconds=0)
+
+        assert await connector.process(DATA_REQUEST) is Status.COMPLETE
+        assert connector.processed == [1]
+
+    @pytest.mark.asyncio
+    async def test_review_rate(self) -> None:
+        connector = FakeConnector(latency_seconds=0, review_rate=1)
+
+        assert await connector.process(DATA_REQUEST) is Status.NEEDS_REVIEW
+
+    @pytest.mark.asyncio
+    async def test_failure_rate(self) -> None:
+        connector = FakeConnector(latency_seconds=0, failure_rate=1)
+
+        with pytest.raises(FakeConnectorError):
+            await connector.process(DATA_REQUEST)
+        assert connector.processed == []
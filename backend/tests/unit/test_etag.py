@@ -0,0 +1,41 @@
+import pytest
+
+from core.etag import etag_matches, make_etag
+
+
+class TestMakeEtag:
+    """Unit tests for building ETags."""
+
+    def test_same_parts_same_etag(self) -> None:
+        """Test that ETags are stable for the same inputs."""
+        assert make_etag("people", 3, "limit=10") == make_etag("people", 3, "limit=10")
+
+    def test_any_part_changes_etag(self) -> None:
+        """Test that a new version or query gives a new ETag."""
+        etag = make_etag("people", 3, "")
+
+        assert make_etag("people", 4, "") != etag
+        assert make_etag("people", 3, "limit=10") != etag
+
+    def test_etag_is_quoted(self) -> None:
+        """Test that the ETag is a quoted strong validator."""
+        etag = make_etag("people", 3)
+
+        assert etag.startswith('"') and etag.endswith('"')
+
+
+class TestEtagMatches:
+    """Unit tests for evaluating If-None-Match."""
+
+    @pytest.mark.parametrize(
+        "header",
+        ['"abc"', '"xyz", "abc"', 'W/"abc"', "*", ' "abc" '],
+    )
+    def test_matching_headers(self, header: str) -> None:
+        """Test the header forms that match the current ETag."""
+        assert etag_matches(header, '"abc"')
+
+    @pytest.mark.parametrize("header", [None, "", '"xyz"', "abc"])
+    def test_non_matching_headers(self, header: str | None) -> None:
+        """Test that other or missing validators do not match."""
+        assert not etag_matches(header, '"abc"')
@@ -0,0 +1,70 @@
+from core.metrics import Counter, Gauge, Histogram, HistogramMetric, Registry
+
+
+class TestHistogram:
+    """Unit tests for the Prometheus-style histogram."""
+
+    def test_counts_are_cumulative_with_inclusive_bounds(self):
+        histogram = Histogram(buckets=[0.1, 1.0])
+
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == {"0.1": 2, "1.0": 3, "+Inf": 4}
+        assert histogram.count == 4
+        assert histogram.sum == 2.65
+
+    def test_buckets_are_sorted(self):
+        histogram = Histogram(buckets=[1.0, 0.1])
+
+        histogram.observe(0.5)
+
+        assert list(histogram.cumulative()) == ["0.1", "1.0", "+Inf"]
+        assert histogram.cumulative()["1.0"] == 1
+
+
+class TestRegistry:
+    """Unit tests for rendering metrics in the Prometheus text format."""
+
+    def test_renders_counters_and_gauges_with_labels(self):
+        registry = Registry()
+        requests = registry.register(Counter("requests_total", "Requests.", ["path"]))
+        in_flight = registry.register(Gauge("in_flight", "In flight."))
+
+        requests.inc(("/a",))
+        requests.inc(("/a",))
+        requests.inc(('say "hi"\n',), 0.5)
+        in_flight.set((), 3)
+
+        assert registry.render() == (
+            "# HELP requests_total Requests.\n"
+            "# TYPE requests_total counter\n"
+            'requests_total{path="/a"} 2\n'
+            'requests_total{path="say \\"hi\\"\\n"} 0.5\n'
+            "# HELP in_flight In flight.\n"
+            "# TYPE in_flight gauge\n"
+            "in_flight 3\n"
+        )
+
+    def test_renders_histograms_with_le_label(self):
+        registry = Registry()
+        latency = registry.register(
+            HistogramMetric("latency_seconds", "Latency.", ["route"], [0.1, 1.0])
+        )
+
+        latency.observe(("/a",), 0.5)
+
+        assert registry.render().splitlines()[2:] == [
+            'latency_seconds_bucket{route="/a",le="0.1"} 0',
+            'latency_seconds_bucket{route="/a",le="1.0"} 1',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 1',
+            'latency_seconds_sum{route="/a"} 0.5',
+            'latency_seconds_count{route="/a"} 1',
+        ]
+
+    def test_runs_collectors_before_rendering(self):
+        registry = Registry()
+        gauge = registry.register(Gauge("connections", "Connections."))
+        registry.add_collector(lambda: gauge.set((), 7))
+
+        assert registry.render().splitlines()[-1] == "connections 7"
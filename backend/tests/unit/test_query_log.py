@@ -0,0 +1,66 @@
+from core.query_log import (
+    QueryLog,
+    StatementRecord,
+    capture,
+    parameter_shape,
+    statement_shape,
+)
+
+
+def record(statement: str) -> StatementRecord:
+    return StatementRecord(statement=statement, parameters="()", seconds=0.0, rows=1)
+
+
+class TestStatementShape:
+    """Unit tests for normalizing statements."""
+
+    def test_collapses_whitespace_and_placeholder_lists(self):
+        assert (
+            statement_shape("SELECT *\n  FROM people\n WHERE id IN ($1, $2, $3)")
+            == "SELECT * FROM people WHERE id IN (?)"
+        )
+
+    def test_statements_differing_in_list_length_match(self):
+        assert statement_shape("SELECT 1 WHERE id = $1") == statement_shape(
+            "SELECT 1 WHERE id = $7"
+        )
+        assert statement_shape("WHERE a IN ($1, $2) AND b = $3") == (
+            "WHERE a IN (?) AND b = ?"
+        )
+
+
+class TestParameterShape:
+    """Unit tests for describing parameters without their values."""
+
+    def test_runs_of_one_type_are_counted(self):
+        assert parameter_shape((1, 2, 3, "a")) == "(int×3, str)"
+
+    def test_mappings_use_their_values(self):
+        assert parameter_shape({"id": 1, "name": None}) == "(int, NoneType)"
+
+    def test_executemany_counts_batches(self):
+        assert parameter_shape([(1, "a"), (2, "b")], executemany=True) == (
+            "2×(int, str)"
+        )
+
+
+class TestQueryLog:
+    """Unit tests for finding repeated statements."""
+
+    def test_repeated_counts_shapes_over_the_limit(self):
+        log = QueryLog()
+        log.records = [
+            record("SELECT * FROM people WHERE id = $1"),
+            record("SELECT * FROM people WHERE id = $2"),
+            record("SELECT * FROM people WHERE id = $3"),
+            record("SELECT * FROM data_request"),
+        ]
+
+        assert log.repeated(2) == {"SELECT * FROM people WHERE id = ?": 3}
+        assert log.repeated(3) == {}
+
+    def test_captures_nest(self):
+        with capture() as outer:
+            with capture() as inner:
+                assert inner is not outer
+            assert outer.records == inner.records == []
@@ -0,0 +1,126 @@
+from datetime import date, datetime
+
+import pytest
+
+from core.data_request import DataRequest, Status
+from core.data_request.data_request_model import DataRequestModel
+from core.repository import (
+    BaseRepository,
+    InvalidCursorError,
+    Page,
+    RowMapper,
+    decode_cursor,
+    encode_cursor,
+)
+from core.request_source import RequestSource
+from core.request_source.request_source_model import RequestSourceModel
+
+
+class TestCursor:
+    """Unit tests for keyset pagination cursors."""
+
+    def test_round_trip(self) -> None:
+        """Test that a decoded cursor returns the encoded sort key."""
+        cursor = encode_cursor(("Smith", "John", 1))
+
+        assert decode_cursor(cursor, (str, str, int)) == ["Smith", "John", 1]
+
+    def test_cursor_is_url_safe(self) -> None:
+        """Test that cursors can be used in a query string unescaped."""
+        cursor = encode_cursor(("?&/+=", 1))
+
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "!!!", "e30"])
+    def test_malformed_cursor_raises(self, cursor: str) -> None:
+        """Test that garbage cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, (int,))
+
+    def test_wrong_key_shape_raises(self) -> None:
+        """Test that a cursor from a different sort order is rejected."""
+        cursor = encode_cursor(("Acme", "acme-corp"))
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, (int,))
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, (str, int))
+
+
+class TestPaginate:
+    """Unit tests for trimming query results into pages."""
+
+    def test_without_limit_returns_everything(self) -> None:
+        """Test that no limit means a single page with no cursor."""
+        page = BaseRepository._paginate([1, 2, 3], None, lambda i: (i,))
+
+        assert page == Page(items=[1, 2, 3])
+
+    def test_extra_row_produces_cursor(self) -> None:
+        """Test that the limit + 1 row yields a cursor after the last item."""
+        page = BaseRepository._paginate([1, 2, 3], 2, lambda i: (i,))
+
+        assert page.items == [1, 2]
+        assert page.next_cursor is not None
+        assert decode_cursor(page.next_cursor, (int,)) == [2]
+
+    def test_last_page_has_no_cursor(self) -> None:
+        """Test that a short page ends the pagination."""
+        page = BaseRepository._paginate([1, 2], 2, lambda i: (i,))
+
+        assert page == Page(items=[1, 2])
+
+
+class TestRowMapper:
+    """Unit tests for mapping column-select rows into DTOs."""
+
+    def test_columns_follow_dto_field_order(self) -> None:
+        """Test that the selected columns line up with the DTO fields."""
+        mapper = RowMapper(DataRequest, DataRequestModel.__table__)
+
+        assert [column.name for column in mapper.columns] == [
+            "id",
+            "person_id",
+            "first_name",
+            "last_name",
+            "date_of_birth",
+            "status",
+            "created_on",
+            "created_by",
+            "request_source_id",
+        ]
+
+    def test_maps_row_to_dto(self) -> None:
+        """Test that a row is mapped positionally into the DTO."""
+        mapper = RowMapper(RequestSource, RequestSourceModel.__table__)
+
+        assert mapper(("acme-corp", "Acme Corporation")) == RequestSource(
+            id="acme-corp", name="Acme Corporation"
+        )
+
+    def test_applies_converters(self) -> None:
+        """Test that converters are applied to their column only."""
+        mapper = RowMapper(
+            DataRequest, DataRequestModel.__table__, converters={"status": Status}
+        )
+        created_on = datetime(2024, 1, 15, 9, 30, 0)
+
+        [data_request] = mapper.all(
+            [
+                (
+                    1,
+                    1,
+                    "John",
+                    "Smith",
+                    date(1985, 3, 15),
+                    2,
+                    created_on,
+                    "admin@example.com",
+                    "acme-corp",
+                )
+            ]
+        )
+
+        assert data_request.status is Status.PROCESSING
+        assert data_request.created_on == created_on
+        assert data_request.request_source_id == "acme-corp"
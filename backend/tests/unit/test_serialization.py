@@ -0,0 +1,82 @@
+import dataclasses
+import json
+from datetime import date, datetime
+
+import pytest
+
+from core.data_request import DataRequest, Status
+from core.person import Person
+from core.serialization import dump_json
+
+
+@pytest.fixture
+def data_request() -> DataRequest:
+    """Create a sample data request for testing."""
+    return DataRequest(
+        id=1,
+        person_id=1,
+        first_name="John",
+        last_name="Smith",
+        date_of_birth=date(1985, 3, 15),
+        status=Status.NEEDS_REVIEW,
+        created_on=datetime(2024, 1, 15, 9, 30, 0),
+        created_by="admin@example.com",
+        request_source_id="acme-corp",
+    )
+
+
+class TestDumpJson:
+    """Unit tests for serializing DTOs to JSON."""
+
+    def test_matches_asdict_output(self, data_request: DataRequest) -> None:
+        """Test that the JSON is what the asdict-based responses produced."""
+        assert json.loads(dump_json(data_request, DataRequest)) == {
+            "id": 1,
+            "person_id": 1,
+            "first_name": "John",
+            "last_name": "Smith",
+            "date_of_birth": "1985-03-15",
+            "status": 3,
+            "created_on": "2024-01-15T09:30:00",
+            "created_by": "admin@example.com",
+            "request_source_id": "acme-corp",
+        }
+
+    def test_serializes_lists(self) -> None:
+        """Test that a list of DTOs serializes to a JSON array."""
+        people = [
+            Person(
+                id=1,
+                first_name="John",
+                last_name="Smith",
+                date_of_birth=date(1985, 3, 15),
+            ),
+            Person(
+                id=2,
+                first_name="Sarah",
+                last_name="Johnson",
+                date_of_birth=date(1990, 7, 22),
+            ),
+        ]
+
+        data = json.loads(dump_json(people, list[Person]))
+
+        assert [item["id"] for item in data] == [1, 2]
+        assert data[1]["date_of_birth"] == "1990-07-22"
+
+    def test_empty_list(self) -> None:
+        """Test that an empty list serializes to an empty array."""
+        assert dump_json([], list[Person]) == b"[]"
+
+
+class TestFrozenDTOs:
+    """Unit tests for the slotted, frozen DTOs."""
+
+    def test_dto_is_immutable(self, data_request: DataRequest) -> None:
+        """Test that DTO fields cannot be reassigned."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            data_request.status = Status.COMPLETE  # type: ignore[misc]
+
+    def test_dto_has_no_instance_dict(self, data_request: DataRequest) -> None:
+        """Test that DTOs use slots instead of a per-instance dict."""
+        assert not hasattr(data_request, "__dict__")
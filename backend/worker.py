@@ -0,0 +1,70 @@
+"""Run the background worker that processes PROCESSING data requests.
+
+The worker claims requests through leases in the database, so run as many
+copies as needed, on one machine or several; no request is processed by
+two of them. SIGTERM or SIGINT stops claiming, lets the requests in
+progress finish and writes their results back before exiting.
+
+No request source has a real connector yet. Pass --fake to process every
+request source with the fake connector, which only sleeps and completes
+requests, e.g. to try the worker out against a disposable database.
+
+Run with: uv run python worker.py --fake
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from dotenv import load_dotenv
+
+from core.data_request import DataRequestWorker, FakeConnector, SourceHandler
+from core.database import dispose_database, open_session
+from core.request_source import RequestSourceRepository
+
+
+async def fake_handlers(args: argparse.Namespace) -> dict[str, SourceHandler]:
+    """Handle every request source with the fake connector."""
+    async with open_session() as session:
+        request_sources = await RequestSourceRepository(session).get_all()
+    connector = FakeConnector(
+        latency_seconds=args.latency,
+        failure_rate=args.failure_rate,
+        review_rate=args.review_rate,
+    )
+    return {
+        request_source.id: SourceHandler(connector, concurrency=args.concurrency)
+        for request_source in request_sources
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    worker = DataRequestWorker(await fake_handlers(args))
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, worker.stop)
+    await worker.run()
+    await dispose_database()
+    print(f"Stopped: {worker.stats}")
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--fake", action="store_true", help="Use the fake connector for every source"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="Requests at once per source"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Fake seconds per request"
+    )
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--review-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    if not args.fake:
+        parser.error("no request source has a connector yet; pass --fake")
+    asyncio.run(main(args))
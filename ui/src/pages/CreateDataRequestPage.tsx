@@ -2,6 +2,7 @@ import { useEffect, useState } from 'react'
 import { useNavigate, Link } from 'react-router'
 import { apiFetch } from '../lib/api'
 import { Button } from '@/components/ui/button'
+import { Input } from '@/components/ui/input'
 import { Label } from '@/components/ui/label'
 import {
   Select,
@@ -23,35 +24,32 @@ interface Person {
   date_of_birth: string
 }
 
+// People are searched for as the user types, rather than all loaded up front
+const MIN_SEARCH_LENGTH = 2
+const SEARCH_DELAY_MS = 250
+
 export function CreateDataRequestPage() {
   const navigate = useNavigate()
   const [requestSources, setRequestSources] = useState<RequestSource[]>([])
+  const [personQuery, setPersonQuery] = useState('')
   const [people, setPeople] = useState<Person[]>([])
+  const [selectedPerson, setSelectedPerson] = useState<Person | null>(null)
   const [loading, setLoading] = useState(true)
   const [submitting, setSubmitting] = useState(false)
   const [error, setError] = useState<string | null>(null)
 
-  const [personId, setPersonId] = useState('')
   const [requestSourceId, setRequestSourceId] = useState('')
 
   useEffect(() => {
-    Promise.all([
-      apiFetch('/api/v1/request-sources').then((response) => {
+    apiFetch('/api/v1/request-sources')
+      .then((response) => {
         if (!response.ok) {
           throw new Error('Failed to fetch request sources')
         }
         return response.json()
-      }),
-      apiFetch('/api/v1/people').then((response) => {
-        if (!response.ok) {
-          throw new Error('Failed to fetch people')
-        }
-        return response.json()
-      }),
-    ])
-      .then(([requestSourcesData, peopleData]) => {
+      })
+      .then((requestSourcesData) => {
         setRequestSources(requestSourcesData)
-        setPeople(peopleData)
         setLoading(false)
       })
       .catch((err) => {
@@ -60,6 +58,48 @@ export function CreateDataRequestPage() {
       })
   }, [])
 
+  const searchTerm = personQuery.trim()
+  const searching = searchTerm.length >= MIN_SEARCH_LENGTH
+
+  useEffect(() => {
+    if (!searching) {
+      return
+    }
+    const controller = new AbortController()
+    const timeout = setTimeout(() => {
+      apiFetch(`/api/v1/people/search?q=${encodeURIComponent(searchTerm)}`, {
+        signal: controller.signal,
+      })
+        .then((response) => {
+          if (!response.ok) {
+            throw new Error('Failed to search people')
+          }
+          return response.json()
+        })
+        .then(setPeople)
+        .catch((err) => {
+          if (err.name !== 'AbortError') {
+            setError(err.message)
+          }
+        })
+    }, SEARCH_DELAY_MS)
+    return () => {
+      clearTimeout(timeout)
+      controller.abort()
+    }
+  }, [searchTerm, searching])
+
+  // Keep the selected person listed while the results change
+  const results = searching ? people : []
+  const personOptions =
+    selectedPerson && !results.some((p) => p.id === selectedPerson.id)
+      ? [selectedPerson, ...results]
+      : results
+
+  const handlePersonChange = (value: string) => {
+    setSelectedPerson(personOptions.find((p) => String(p.id) === value) ?? null)
+  }
+
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault()
     setSubmitting(true)
@@ -72,7 +112,7 @@ export function CreateDataRequestPage() {
           'Content-Type': 'application/json',
         },
         body: JSON.stringify({
-          person_id: parseInt(personId, 10),
+          person_id: selectedPerson?.id,
           request_source_id: requestSourceId,
         }),
       })
@@ -103,12 +143,22 @@ export function CreateDataRequestPage() {
       <form onSubmit={handleSubmit} className="space-y-4">
         <div className="space-y-2">
           <Label htmlFor="person">Person</Label>
-          <Select value={personId} onValueChange={setPersonId} required>
+          <Input
+            id="person"
+            placeholder="Search by name"
+            value={personQuery}
+            onChange={(e) => setPersonQuery(e.target.value)}
+          />
+          <Select
+            value={selectedPerson ? String(selectedPerson.id) : ''}
+            onValueChange={handlePersonChange}
+            required
+          >
             <SelectTrigger>
               <SelectValue placeholder="Select a person" />
             </SelectTrigger>
             <SelectContent>
-              {people.map((person) => (
+              {personOptions.map((person) => (
                 <SelectItem key={person.id} value={String(person.id)}>
                   {person.first_name} {person.last_name} ({person.date_of_birth})
                 </SelectItem>
@@ -132,7 +182,7 @@ export function CreateDataRequestPage() {
           </Select>
         </div>
         <div className="flex gap-2 pt-4">
-          <Button type="submit" disabled={submitting || !personId || !requestSourceId}>
+          <Button type="submit" disabled={submitting || !selectedPerson || !requestSourceId}>
             {submitting ? 'Creating...' : 'Create'}
           </Button>
           <Button type="button" variant="outline" asChild>